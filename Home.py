@@ -1,13 +1,9 @@
 # -*- coding: utf-8 -*-
-import os
 import logging
 import streamlit as st
-import sys
-import time
 # import streamlit.components.v1 as components
 import src.utils.streamlit_gui as utl
-from pathlib import Path
-from PIL import Image
+from src.utils.loader import warm_up_with_notification
 
 # Initialize a session state variable that tracks the sidebar state (either 'expanded' or 'collapsed').
 if 'sidebar_state' not in st.session_state:
@@ -28,6 +24,9 @@ def main():
     st.write("### Exploratory Data Analysis")
     st.write("""Welcome. This vizualization tool allows you to explore associated risk factors with Net Migraion Rate of unaccompanied minors.""")
     st.markdown("---")
+
+    # Load every dataset in parallel while the visitor reads the welcome page.
+    warm_up_with_notification()
     return
 
 if __name__ == '__main__':
@@ -1,42 +1,37 @@
 # -*- coding: utf-8 -*-
+from types import MappingProxyType
 
-def get_dictionary(col):
+REF_AREA_dict = {'AFG': 'Afghanistan', 'WHO_AFRO': 'Africa', 'UNDEV_002': 'Africa', 'ALB': 'Albania', 'DZA': 'Algeria', 'ASM': 'American Samoa', 'WHO_AMRO': 'Americas', 'AND': 'Andorra', 'AGO': 'Angola', 'AIA': 'Anguilla', 'ATG': 'Antigua and Barbuda', 'UNFPA_AS': 'Arab States', 'ARG': 'Argentina', 'ARM': 'Armenia', 'ABW': 'Aruba', 'UNDEV_142': 'Asia', 'UNFPA_AP': 'Asia and the Pacific', 'AUS': 'Australia', 'UNSDG_AUSTRALIANEWZEALAND': 'Australia and New Zealand', 'UNDEV_053': 'Australia and New Zealand', 'AUT': 'Austria', 'AZE': 'Azerbaijan', 'BHS': 'Bahamas', 'BHR': 'Bahrain', 'BGD': 'Bangladesh', 'BRB': 'Barbados', 'BLR': 'Belarus', 'BEL': 'Belgium', 'BLZ': 'Belize', 'BEN': 'Benin', 'BMU': 'Bermuda', 'BTN': 'Bhutan', 'BOL': 'Bolivia (Plurinational State of)', 'BES': 'Bonaire, Sint Eustatius and Saba', 'BIH': 'Bosnia and Herzegovina', 'BWA': 'Botswana', 'BRA': 'Brazil', 'VGB': 'British Virgin Islands', 'BRN': 'Brunei Darussalam', 'BGR': 'Bulgaria', 'BFA': 'Burkina Faso', 'BDI': 'Burundi', 'CPV': 'Cabo Verde', 'KHM': 'Cambodia', 'CMR': 'Cameroon', 'CAN': 'Canada', 'UNSDG_CARIBBEAN': 'Caribbean', 'UNDEV_029': 'Caribbean', 'CYM': 'Cayman Islands', 'CAF': 'Central African Republic', 'UNSDG_CENTRALAMR': 'Central America', 'UNDEV_013': 'Central America', 'UNSDG_CENTRALASIA': 'Central Asia', 'UNDEV_143': 'Central Asia', 'UNSDG_CENTRALASIASOUTHERNASIA': 'Central and Southern Asia', 'TCD': 'Chad', 'CHI': 'Channel Islands', 'CHL': 'Chile', 'CHN': 'China', 'HKG': 'China, Hong Kong Special Administrative Region', 'MAC': 'China, Macao Special Administrative Region', 'COL': 'Colombia', 'COM': 'Comoros', 'COG': 'Congo', 'COK': 'Cook Islands', 'CRI': 'Costa Rica', 'HRV': 'Croatia', 'CUB': 'Cuba', 'CUW': 'Curaçao', 'CYP': 'Cyprus', 'CZE': 'Czechia', 'CIV': "Côte d'Ivoire", 'PRK': "Democratic People's Republic of Korea", 'COD': 'Democratic Republic of the Congo', 'DNK': 'Denmark', 'DJI': 'Djibouti', 'DMA': 'Dominica', 'DOM': 'Dominican Republic', 'UNICEF_EAP': 'East Asia and Pacific', 'UNICEF_EAPRO': 'East Asia and Pacific', 'UNFPA_ESA': 'East and Southern Africa', 'UNSDG_EASTERNAFR': 'Eastern Africa', 'UNDEV_014': 'Eastern Africa', 'UNSDG_EASTERNASIA': 'Eastern Asia', 'UNDEV_030': 'Eastern Asia', 'UNDEV_151': 'Eastern Europe', 'UNICEF_EECA': 'Eastern Europe and Central Asia', 'UNFPA_EECA': 'Eastern Europe and Central Asia', 'WHO_EMRO': 'Eastern Mediterranean', 'UNSDG_EASTERNASIASOUTHEASTERNASIA': 'Eastern and South-Eastern Asia', 'UNICEF_ESA': 'Eastern and Southern Africa', 'UNICEF_ESARO': 'Eastern and Southern Africa', 'ECU': 'Ecuador', 'EGY': 'Egypt', 'SLV': 'El Salvador', 'GNQ': 'Equatorial Guinea', 'ERI': 'Eritrea', 'EST': 'Estonia', 'SWZ': 'Eswatini', 'ETH': 'Ethiopia', 'UNSDG_EUROPE': 'Europe', 'WHO_EURO': 'Europe', 'UNICEF_ECA': 'Europe and Central Asia', 'UNICEF_ECARO': 'Europe and Central Asia', 'UNSDG_EUROPENORTHERNAMR': 'Europe and Northern America', 'FLK': 'Falkland Islands (Malvinas)', 'FRO': 'Faroe Islands', 'FJI': 'Fiji', 'FIN': 'Finland', 'FRA': 'France', 'GUF': 'French Guiana', 'PYF': 'French Polynesia', 'GAB': 'Gabon', 'GMB': 'Gambia', 'GEO': 'Georgia', 'DEU': 'Germany', 'GHA': 'Ghana', 'GIB': 'Gibraltar', 'GRC': 'Greece', 'GRL': 'Greenland', 'GRD': 'Grenada', 'GLP': 'Guadeloupe', 'GUM': 'Guam', 'GTM': 'Guatemala', 'GIN': 'Guinea', 'GNB': 'Guinea-Bissau', 'GUY': 'Guyana', 'HTI': 'Haiti', 'VAT': 'Holy See', 'HND': 'Honduras', 'HUN': 'Hungary', 'ISL': 'Iceland', 'IND': 'India', 'IDN': 'Indonesia', 'IRN': 'Iran (Islamic Republic of)', 'IRQ': 'Iraq', 'IRL': 'Ireland', 'IMN': 'Isle of Man', 'ISR': 'Israel', 'ITA': 'Italy', 'JAM': 'Jamaica', 'JPN': 'Japan', 'JOR': 'Jordan', 'KAZ': 'Kazakhstan', 'KEN': 'Kenya', 'KIR': 'Kiribati', 'XKX': 'Kosovo', 'KWT': 'Kuwait', 'KGZ': 'Kyrgyzstan', 'UNSDG_LLDC': 'Landlocked developing countries (LLDCs)', 'LAO': "Lao People's Democratic Republic", 'UNSDG_LAC': 'Latin America & the Caribbean', 'UNICEF_LAC': 'Latin America and Caribbean', 'UNICEF_LACRO': 'Latin America and Caribbean', 'UNFPA_LAC': 'Latin America and the Caribbean', 'UNDEV_419': 'Latin America and the Caribbean', 'LVA': 'Latvia', 'UNSDG_LDC': 'Least developed countries', 'LBN': 'Lebanon', 'LSO': 'Lesotho', 'LBR': 'Liberia', 'LBY': 'Libya', 'LIE': 'Liechtenstein', 'LTU': 'Lithuania', 'FAO_LIFDC': 'Low income food deficient countries', 'LUX': 'Luxembourg', 'MDG': 'Madagascar', 'MWI': 'Malawi', 'MYS': 'Malaysia', 'MDV': 'Maldives', 'MLI': 'Mali', 'MLT': 'Malta', 'MHL': 'Marshall Islands', 'MTQ': 'Martinique', 'MRT': 'Mauritania', 'MUS': 'Mauritius', 'MYT': 'Mayotte', 'UNDEV_54': 'Melanasia', 'MEX': 'Mexico', 'UNDEV_57': 'Micronesia', 'FSM': 'Micronesia (Federated States of)', 'UNSDG_MIDDLEAFR': 'Middle Africa', 'UNDEV_017': 'Middle Africa', 'UNICEF_MENA': 'Middle East and North Africa', 'UNICEF_MENARO': 'Middle East and North Africa', 'MCO': 'Monaco', 'MNG': 'Mongolia', 'MNE': 'Montenegro', 'MSR': 'Montserrat', 'MAR': 'Morocco', 'MOZ': 'Mozambique', 'MMR': 'Myanmar', 'NAM': 'Namibia', 'NRU': 'Nauru', 'NPL': 'Nepal', 'NLD': 'Netherlands', 'NCL': 'New Caledonia', 'NZL': 'New Zealand', 'NIC': 'Nicaragua', 'NER': 'Niger', 'NGA': 'Nigeria', 'NIU': 'Niue', 'UNSDG_NORTHERNAMR': 'North America', 'UNICEF_NA': 'North America', 'MKD': 'North Macedonia', 'UNSDG_NORTHAFR': 'Northern Africa', 'UNDEV_015': 'Northern Africa', 'UNSDG_WESTERNASIANORTHERNAFR': 'Northern Africa and Western Asia', 'UNDEV_021': 'Northern America', 'UNDEV_154': 'Northern Europe', 'MNP': 'Northern Mariana Islands', 'NOR': 'Norway', 'UNSDG_OCEANIA': 'Oceania', 'UNDEV_009': 'Oceania', 'UNSDG_OCEANIAexAUSNZL': 'Oceania excluding Australia and New Zealand', 'UNDEV_543': 'Oceania excluding Australia and New Zealand', 'OMN': 'Oman', 'TWN': 'Other, non specified', 'PAK': 'Pakistan', 'PLW': 'Palau', 'PAN': 'Panama', 'PNG': 'Papua New Guinea', 'PRY': 'Paraguay', 'PER': 'Peru', 'PHL': 'Philippines', 'POL': 'Poland', 'UNDEV_61': 'Polynesia', 'PRT': 'Portugal', 'PRI': 'Puerto Rico', 'QAT': 'Qatar', 'KOR': 'Republic of Korea', 'MDA': 'Republic of Moldova', 'ROU': 'Romania', 'RUS': 'Russian Federation', 'RWA': 'Rwanda', 'REU': 'Réunion', 'UNSDG_REGION_GLOBAL': 'SDG regions - Global', 'BLM': 'Saint Barthélemy', 'SHN': 'Saint Helena, Ascension and Tristan da Cunha', 'KNA': 'Saint Kitts and Nevis', 'LCA': 'Saint Lucia', 'MAF': 'Saint Martin (French part)', 'SPM': 'Saint Pierre and Miquelon', 'VCT': 'Saint Vincent and the Grenadines', 'WSM': 'Samoa', 'SMR': 'San Marino', 'STP': 'Sao Tome and Principe', 'SAU': 'Saudi Arabia', 'SEN': 'Senegal', 'SRB': 'Serbia', 'SYC': 'Seychelles', 'SLE': 'Sierra Leone', 'SGP': 'Singapore', 'SXM': 'Sint Maarten', 'SVK': 'Slovakia', 'SVN': 'Slovenia', 'UNSDG_SIDS': 'Small Island Developing States (SIDS)', 'SLB': 'Solomon Islands', 'SOM': 'Somalia', 'ZAF': 'South Africa', 'UNSDG_SOUTHAMR': 'South America', 'UNDEV_005': 'South America', 'UNICEF_SA': 'South Asia', 'UNICEF_ROSA': 'South Asia', 'SSD': 'South Sudan', 'UNSDG_SOUTHEASTERNASIA': 'South-Eastern Asia', 'UNDEV_035': 'South-eastern Asia', 'WHO_SEARO': 'Southeast Asia', 'UNSDG_SOUTHERNAFR': 'Southern Africa', 'UNDEV_018': 'Southern Africa', 'UNSDG_SOUTHASIA': 'Southern Asia', 'UNDEV_034': 'Southern Asia', 'UNDEV_39': 'Southern Europe', 'ESP': 'Spain', 'LKA': 'Sri Lanka', 'PSE': 'State of Palestine', 'UNICEF_SSA': 'Sub-Saharan Africa', 'SDN': 'Sudan', 'SUR': 'Suriname', 'SWE': 'Sweden', 'CHE': 'Switzerland', 'SYR': 'Syrian Arab Republic', 'TJK': 'Tajikistan', 'THA': 'Thailand', 'TUR': 'The Republic of Turkey', 'TLS': 'Timor-Leste', 'TGO': 'Togo', 'TKL': 'Tokelau', 'TON': 'Tonga', 'TTO': 'Trinidad and Tobago', 'TUN': 'Tunisia', 'TKM': 'Turkmenistan', 'TCA': 'Turks and Caicos Islands', 'TUV': 'Tuvalu', 'UNICEF_PROG_REG_GLOBAL': 'UNICEF Programme Regions - Global', 'UNICEF_REP_REG_GLOBAL': 'UNICEF reporting regions - Global', 'UGA': 'Uganda', 'UKR': 'Ukraine', 'ARE': 'United Arab Emirates', 'GBR': 'United Kingdom', 'TZA': 'United Republic of Tanzania', 'USA': 'United States', 'URY': 'Uruguay', 'UZB': 'Uzbekistan', 'VUT': 'Vanuatu', 'VEN': 'Venezuela (Bolivarian Republic of)', 'VNM': 'Viet Nam', 'VIR': 'Virgin Islands U.S.', 'WLF': 'Wallis and Futuna', 'UNICEF_WCA': 'West and Central Africa', 'UNICEF_WCARO': 'West and Central Africa', 'UNFPA_WCA': 'West and Central Africa', 'UNSDG_WESTERNAFR': 'Western Africa', 'UNDEV_011': 'Western Africa', 'UNSDG_WESTERNASIA': 'Western Asia', 'UNDEV_145': 'Western Asia', 'UNICEF_WE': 'Western Europe', 'UNDEV_155': 'Western Europe', 'WHO_WPRO': 'Western Pacific', 'WORLD': 'World', 'WB_HI': 'World Bank (high income)', 'WB_LI': 'World Bank (low income)', 'WB_LMI': 'World Bank (lower middle income)', 'WB_MI': 'World Bank (middle Income)', 'WB_UMI': 'World Bank (upper middle income)', 'WHO_REG_GLOBAL': 'World Health Organisation regions - Global', 'YEM': 'Yemen', 'ZMB': 'Zambia', 'ZWE': 'Zimbabwe', 'UNSDG_SUBSAHARANAFRICA': 'sub-Saharan Africa'}
+
+SEX_dict = {'_T': 'Total', 'F': 'Female', 'M': 'Male'}
 
-    REF_AREA_dict = {'AFG': 'Afghanistan', 'WHO_AFRO': 'Africa', 'UNDEV_002': 'Africa', 'ALB': 'Albania', 'DZA': 'Algeria', 'ASM': 'American Samoa', 'WHO_AMRO': 'Americas', 'AND': 'Andorra', 'AGO': 'Angola', 'AIA': 'Anguilla', 'ATG': 'Antigua and Barbuda', 'UNFPA_AS': 'Arab States', 'ARG': 'Argentina', 'ARM': 'Armenia', 'ABW': 'Aruba', 'UNDEV_142': 'Asia', 'UNFPA_AP': 'Asia and the Pacific', 'AUS': 'Australia', 'UNSDG_AUSTRALIANEWZEALAND': 'Australia and New Zealand', 'UNDEV_053': 'Australia and New Zealand', 'AUT': 'Austria', 'AZE': 'Azerbaijan', 'BHS': 'Bahamas', 'BHR': 'Bahrain', 'BGD': 'Bangladesh', 'BRB': 'Barbados', 'BLR': 'Belarus', 'BEL': 'Belgium', 'BLZ': 'Belize', 'BEN': 'Benin', 'BMU': 'Bermuda', 'BTN': 'Bhutan', 'BOL': 'Bolivia (Plurinational State of)', 'BES': 'Bonaire, Sint Eustatius and Saba', 'BIH': 'Bosnia and Herzegovina', 'BWA': 'Botswana', 'BRA': 'Brazil', 'VGB': 'British Virgin Islands', 'BRN': 'Brunei Darussalam', 'BGR': 'Bulgaria', 'BFA': 'Burkina Faso', 'BDI': 'Burundi', 'CPV': 'Cabo Verde', 'KHM': 'Cambodia', 'CMR': 'Cameroon', 'CAN': 'Canada', 'UNSDG_CARIBBEAN': 'Caribbean', 'UNDEV_029': 'Caribbean', 'CYM': 'Cayman Islands', 'CAF': 'Central African Republic', 'UNSDG_CENTRALAMR': 'Central America', 'UNDEV_013': 'Central America', 'UNSDG_CENTRALASIA': 'Central Asia', 'UNDEV_143': 'Central Asia', 'UNSDG_CENTRALASIASOUTHERNASIA': 'Central and Southern Asia', 'TCD': 'Chad', 'CHI': 'Channel Islands', 'CHL': 'Chile', 'CHN': 'China', 'HKG': 'China, Hong Kong Special Administrative Region', 'MAC': 'China, Macao Special Administrative Region', 'COL': 'Colombia', 'COM': 'Comoros', 'COG': 'Congo', 'COK': 'Cook Islands', 'CRI': 'Costa Rica', 'HRV': 'Croatia', 'CUB': 'Cuba', 'CUW': 'Curaçao', 'CYP': 'Cyprus', 'CZE': 'Czechia', 'CIV': "Côte d'Ivoire", 'PRK': "Democratic People's Republic of Korea", 'COD': 'Democratic Republic of the Congo', 'DNK': 'Denmark', 'DJI': 'Djibouti', 'DMA': 'Dominica', 'DOM': 'Dominican Republic', 'UNICEF_EAP': 'East Asia and Pacific', 'UNICEF_EAPRO': 'East Asia and Pacific', 'UNFPA_ESA': 'East and Southern Africa', 'UNSDG_EASTERNAFR': 'Eastern Africa', 'UNDEV_014': 'Eastern Africa', 'UNSDG_EASTERNASIA': 'Eastern Asia', 'UNDEV_030': 'Eastern Asia', 'UNDEV_151': 'Eastern Europe', 'UNICEF_EECA': 'Eastern Europe and Central Asia', 'UNFPA_EECA': 'Eastern Europe and Central Asia', 'WHO_EMRO': 'Eastern Mediterranean', 'UNSDG_EASTERNASIASOUTHEASTERNASIA': 'Eastern and South-Eastern Asia', 'UNICEF_ESA': 'Eastern and Southern Africa', 'UNICEF_ESARO': 'Eastern and Southern Africa', 'ECU': 'Ecuador', 'EGY': 'Egypt', 'SLV': 'El Salvador', 'GNQ': 'Equatorial Guinea', 'ERI': 'Eritrea', 'EST': 'Estonia', 'SWZ': 'Eswatini', 'ETH': 'Ethiopia', 'UNSDG_EUROPE': 'Europe', 'WHO_EURO': 'Europe', 'UNICEF_ECA': 'Europe and Central Asia', 'UNICEF_ECARO': 'Europe and Central Asia', 'UNSDG_EUROPENORTHERNAMR': 'Europe and Northern America', 'FLK': 'Falkland Islands (Malvinas)', 'FRO': 'Faroe Islands', 'FJI': 'Fiji', 'FIN': 'Finland', 'FRA': 'France', 'GUF': 'French Guiana', 'PYF': 'French Polynesia', 'GAB': 'Gabon', 'GMB': 'Gambia', 'GEO': 'Georgia', 'DEU': 'Germany', 'GHA': 'Ghana', 'GIB': 'Gibraltar', 'GRC': 'Greece', 'GRL': 'Greenland', 'GRD': 'Grenada', 'GLP': 'Guadeloupe', 'GUM': 'Guam', 'GTM': 'Guatemala', 'GIN': 'Guinea', 'GNB': 'Guinea-Bissau', 'GUY': 'Guyana', 'HTI': 'Haiti', 'VAT': 'Holy See', 'HND': 'Honduras', 'HUN': 'Hungary', 'ISL': 'Iceland', 'IND': 'India', 'IDN': 'Indonesia', 'IRN': 'Iran (Islamic Republic of)', 'IRQ': 'Iraq', 'IRL': 'Ireland', 'IMN': 'Isle of Man', 'ISR': 'Israel', 'ITA': 'Italy', 'JAM': 'Jamaica', 'JPN': 'Japan', 'JOR': 'Jordan', 'KAZ': 'Kazakhstan', 'KEN': 'Kenya', 'KIR': 'Kiribati', 'XKX': 'Kosovo', 'KWT': 'Kuwait', 'KGZ': 'Kyrgyzstan', 'UNSDG_LLDC': 'Landlocked developing countries (LLDCs)', 'LAO': "Lao People's Democratic Republic", 'UNSDG_LAC': 'Latin America & the Caribbean', 'UNICEF_LAC': 'Latin America and Caribbean', 'UNICEF_LACRO': 'Latin America and Caribbean', 'UNFPA_LAC': 'Latin America and the Caribbean', 'UNDEV_419': 'Latin America and the Caribbean', 'LVA': 'Latvia', 'UNSDG_LDC': 'Least developed countries', 'LBN': 'Lebanon', 'LSO': 'Lesotho', 'LBR': 'Liberia', 'LBY': 'Libya', 'LIE': 'Liechtenstein', 'LTU': 'Lithuania', 'FAO_LIFDC': 'Low income food deficient countries', 'LUX': 'Luxembourg', 'MDG': 'Madagascar', 'MWI': 'Malawi', 'MYS': 'Malaysia', 'MDV': 'Maldives', 'MLI': 'Mali', 'MLT': 'Malta', 'MHL': 'Marshall Islands', 'MTQ': 'Martinique', 'MRT': 'Mauritania', 'MUS': 'Mauritius', 'MYT': 'Mayotte', 'UNDEV_54': 'Melanasia', 'MEX': 'Mexico', 'UNDEV_57': 'Micronesia', 'FSM': 'Micronesia (Federated States of)', 'UNSDG_MIDDLEAFR': 'Middle Africa', 'UNDEV_017': 'Middle Africa', 'UNICEF_MENA': 'Middle East and North Africa', 'UNICEF_MENARO': 'Middle East and North Africa', 'MCO': 'Monaco', 'MNG': 'Mongolia', 'MNE': 'Montenegro', 'MSR': 'Montserrat', 'MAR': 'Morocco', 'MOZ': 'Mozambique', 'MMR': 'Myanmar', 'NAM': 'Namibia', 'NRU': 'Nauru', 'NPL': 'Nepal', 'NLD': 'Netherlands', 'NCL': 'New Caledonia', 'NZL': 'New Zealand', 'NIC': 'Nicaragua', 'NER': 'Niger', 'NGA': 'Nigeria', 'NIU': 'Niue', 'UNSDG_NORTHERNAMR': 'North America', 'UNICEF_NA': 'North America', 'MKD': 'North Macedonia', 'UNSDG_NORTHAFR': 'Northern Africa', 'UNDEV_015': 'Northern Africa', 'UNSDG_WESTERNASIANORTHERNAFR': 'Northern Africa and Western Asia', 'UNDEV_021': 'Northern America', 'UNDEV_154': 'Northern Europe', 'MNP': 'Northern Mariana Islands', 'NOR': 'Norway', 'UNSDG_OCEANIA': 'Oceania', 'UNDEV_009': 'Oceania', 'UNSDG_OCEANIAexAUSNZL': 'Oceania excluding Australia and New Zealand', 'UNDEV_543': 'Oceania excluding Australia and New Zealand', 'OMN': 'Oman', 'TWN': 'Other, non specified', 'PAK': 'Pakistan', 'PLW': 'Palau', 'PAN': 'Panama', 'PNG': 'Papua New Guinea', 'PRY': 'Paraguay', 'PER': 'Peru', 'PHL': 'Philippines', 'POL': 'Poland', 'UNDEV_61': 'Polynesia', 'PRT': 'Portugal', 'PRI': 'Puerto Rico', 'QAT': 'Qatar', 'KOR': 'Republic of Korea', 'MDA': 'Republic of Moldova', 'ROU': 'Romania', 'RUS': 'Russian Federation', 'RWA': 'Rwanda', 'REU': 'Réunion', 'UNSDG_REGION_GLOBAL': 'SDG regions - Global', 'BLM': 'Saint Barthélemy', 'SHN': 'Saint Helena, Ascension and Tristan da Cunha', 'KNA': 'Saint Kitts and Nevis', 'LCA': 'Saint Lucia', 'MAF': 'Saint Martin (French part)', 'SPM': 'Saint Pierre and Miquelon', 'VCT': 'Saint Vincent and the Grenadines', 'WSM': 'Samoa', 'SMR': 'San Marino', 'STP': 'Sao Tome and Principe', 'SAU': 'Saudi Arabia', 'SEN': 'Senegal', 'SRB': 'Serbia', 'SYC': 'Seychelles', 'SLE': 'Sierra Leone', 'SGP': 'Singapore', 'SXM': 'Sint Maarten', 'SVK': 'Slovakia', 'SVN': 'Slovenia', 'UNSDG_SIDS': 'Small Island Developing States (SIDS)', 'SLB': 'Solomon Islands', 'SOM': 'Somalia', 'ZAF': 'South Africa', 'UNSDG_SOUTHAMR': 'South America', 'UNDEV_005': 'South America', 'UNICEF_SA': 'South Asia', 'UNICEF_ROSA': 'South Asia', 'SSD': 'South Sudan', 'UNSDG_SOUTHEASTERNASIA': 'South-Eastern Asia', 'UNDEV_035': 'South-eastern Asia', 'WHO_SEARO': 'Southeast Asia', 'UNSDG_SOUTHERNAFR': 'Southern Africa', 'UNDEV_018': 'Southern Africa', 'UNSDG_SOUTHASIA': 'Southern Asia', 'UNDEV_034': 'Southern Asia', 'UNDEV_39': 'Southern Europe', 'ESP': 'Spain', 'LKA': 'Sri Lanka', 'PSE': 'State of Palestine', 'UNICEF_SSA': 'Sub-Saharan Africa', 'SDN': 'Sudan', 'SUR': 'Suriname', 'SWE': 'Sweden', 'CHE': 'Switzerland', 'SYR': 'Syrian Arab Republic', 'TJK': 'Tajikistan', 'THA': 'Thailand', 'TUR': 'The Republic of Turkey', 'TLS': 'Timor-Leste', 'TGO': 'Togo', 'TKL': 'Tokelau', 'TON': 'Tonga', 'TTO': 'Trinidad and Tobago', 'TUN': 'Tunisia', 'TKM': 'Turkmenistan', 'TCA': 'Turks and Caicos Islands', 'TUV': 'Tuvalu', 'UNICEF_PROG_REG_GLOBAL': 'UNICEF Programme Regions - Global', 'UNICEF_REP_REG_GLOBAL': 'UNICEF reporting regions - Global', 'UGA': 'Uganda', 'UKR': 'Ukraine', 'ARE': 'United Arab Emirates', 'GBR': 'United Kingdom', 'TZA': 'United Republic of Tanzania', 'USA': 'United States', 'URY': 'Uruguay', 'UZB': 'Uzbekistan', 'VUT': 'Vanuatu', 'VEN': 'Venezuela (Bolivarian Republic of)', 'VNM': 'Viet Nam', 'VIR': 'Virgin Islands U.S.', 'WLF': 'Wallis and Futuna', 'UNICEF_WCA': 'West and Central Africa', 'UNICEF_WCARO': 'West and Central Africa', 'UNFPA_WCA': 'West and Central Africa', 'UNSDG_WESTERNAFR': 'Western Africa', 'UNDEV_011': 'Western Africa', 'UNSDG_WESTERNASIA': 'Western Asia', 'UNDEV_145': 'Western Asia', 'UNICEF_WE': 'Western Europe', 'UNDEV_155': 'Western Europe', 'WHO_WPRO': 'Western Pacific', 'WORLD': 'World', 'WB_HI': 'World Bank (high income)', 'WB_LI': 'World Bank (low income)', 'WB_LMI': 'World Bank (lower middle income)', 'WB_MI': 'World Bank (middle Income)', 'WB_UMI': 'World Bank (upper middle income)', 'WHO_REG_GLOBAL': 'World Health Organisation regions - Global', 'YEM': 'Yemen', 'ZMB': 'Zambia', 'ZWE': 'Zimbabwe', 'UNSDG_SUBSAHARANAFRICA': 'sub-Saharan Africa'}
+UNIT_MULTIPLIER_dict = {'nan': 'nan', '3': 'Thousands', '0': 'Units'}
 
-    SEX_dict = {'_T': 'Total', 'F': 'Female', 'M': 'Male'}
+UNIT_MEASURE_dict = {'PCNT': '%', 'D_PER_1000_B': 'Deaths per 1,000 live births', 'D_PER_1000_10': 'Deaths per 1000 children aged 10', 'D_PER_1000_15': 'Deaths per 1000 children aged 15', 'D_PER_1000_1': 'Deaths per 1000 children aged 1', 'D_PER_1000_20': 'Deaths per 1000 children aged 20', 'D_PER_1000_5': 'Deaths per 1000 children aged 5', 'STILLBIRTHS': 'Number of stillbirths', 'SB_PER_1000_B': 'Stillbirths per 1,000 total births', 'D': 'Number of deaths', 'PS': 'Persons', 'NUMBER': 'Number', 'YR': 'Years', 'USD': 'USD', 'IDX': 'Index', 'BINARY': 'Binary', 'RATE_100000': 'Rate per 100,000 of Population', 'RATE_1000': 'Rate per 1,000 of Population', 'RATE_100': 'Rate per 100 of Population', 'PER1000': 'Per 1000', 'PER1USD_GNI_CAP': 'per 1 USD GNI per capita', 'BIRTHSPER1000WOMEN': 'Births per 1000 women', 'PROB': 'Probability', 'PER100KLIVEBIRTHS': 'Per 100,000 live births', 'HRS_PER_WEEK': 'Hours per week', 'RATIO': 'Ratio'}
 
-    UNIT_MULTIPLIER_dict = {'nan': 'nan', '3': 'Thousands', '0': 'Units'}
+TIME_PERIOD_METHOD_dict = {'nan': 'nan', 'EOF': 'End of fieldwork', 'MOF': 'Middle of fieldwork', 'OTHER': 'Other'}
 
-    UNIT_MEASURE_dict = {'PCNT': '%', 'D_PER_1000_B': 'Deaths per 1,000 live births', 'D_PER_1000_10': 'Deaths per 1000 children aged 10', 'D_PER_1000_15': 'Deaths per 1000 children aged 15', 'D_PER_1000_1': 'Deaths per 1000 children aged 1', 'D_PER_1000_20': 'Deaths per 1000 children aged 20', 'D_PER_1000_5': 'Deaths per 1000 children aged 5', 'STILLBIRTHS': 'Number of stillbirths', 'SB_PER_1000_B': 'Stillbirths per 1,000 total births', 'D': 'Number of deaths', 'PS': 'Persons', 'NUMBER': 'Number', 'YR': 'Years', 'USD': 'USD', 'IDX': 'Index', 'BINARY': 'Binary', 'RATE_100000': 'Rate per 100,000 of Population', 'RATE_1000': 'Rate per 1,000 of Population', 'RATE_100': 'Rate per 100 of Population', 'PER1000': 'Per 1000', 'PER1USD_GNI_CAP': 'per 1 USD GNI per capita', 'BIRTHSPER1000WOMEN': 'Births per 1000 women', 'PROB': 'Probability', 'PER100KLIVEBIRTHS': 'Per 100,000 live births', 'HRS_PER_WEEK': 'Hours per week', 'RATIO': 'Ratio'}
+OBS_STATUS_dict = {'A': 'Normal value', 'nan': 'nan', 'RP': 'Reported', 'E': 'Estimated value', 'MD': 'Modelled', 'ER': 'External Reanalysis', 'RA': 'Reanalysed', 'AD': 'Adjusted', 'U': 'Low reliability'}
 
-    TIME_PERIOD_METHOD_dict = {'nan': 'nan', 'EOF': 'End of fieldwork', 'MOF': 'Middle of fieldwork', 'OTHER': 'Other'}
+OBS_CONF_dict = {'nan': 'nan', 'F': 'Free'}
 
-    OBS_STATUS_dict = {'A': 'Normal value', 'nan': 'nan', 'RP': 'Reported', 'E': 'Estimated value', 'MD': 'Modelled', 'ER': 'External Reanalysis', 'RA': 'Reanalysed', 'AD': 'Adjusted', 'U': 'Low reliability'}
+INDICATOR_dict = {'CME_ARR_10T19': 'Annual Rate of Reduction in Mortality Rate Age 10-19', 'CME_ARR_SBR': 'Annual rate of reduction in stillbirth rate (over previous 20 years)', 'CME_ARR_U5MR': 'Annual rate of reduction in under-five mortality rate (over previous 20 years)', 'CME_MRM0': 'Neonatal mortality rate', 'CME_MRY0': 'Infant mortality rate', 'CME_MRY0T4': 'Under-five mortality rate', 'CME_MRY10T14': 'Mortality rate age 10-14', 'CME_MRY10T19': 'Mortality rate age 10-19', 'CME_MRY15T19': 'Mortality rate age 15-19', 'CME_MRY15T24': 'Mortality rate age 15-24', 'CME_MRY1T4': 'Child mortality rate (aged 1-4 years)', 'CME_MRY20T24': 'Mortality rate age 20-24', 'CME_MRY5T14': 'Mortality rate (children aged 5 to 14 years)', 'CME_MRY5T24': 'Mortality rate age 5-24', 'CME_MRY5T9': 'Mortality rate age 5-9', 'CME_PND': 'Neonatal deaths as a percentage of under-five deaths', 'CME_SB': 'Stillbirths', 'CME_SBR': 'Stillbirth rate', 'CME_TMM0': 'Neonatal deaths', 'CME_TMY0': 'Infant deaths', 'CME_TMY0T4': 'Under-five deaths', 'CME_TMY10T14': 'Deaths aged 10 to 14', 'CME_TMY10T19': 'Deaths aged 10 to 19', 'CME_TMY15T19': 'Deaths aged 15 to 19', 'CME_TMY15T24': 'Deaths aged 15 to 24', 'CME_TMY1T4': 'Child deaths (aged 1-4 years)', 'CME_TMY20T24': 'Deaths aged 20 to 24', 'CME_TMY5T14': 'Deaths (children aged 5-14)', 'CME_TMY5T24': 'Deaths aged 5 to 24', 'CME_TMY5T9': 'Deaths aged 5 to 9', 'DM_BRTS': 'Number of births', 'DM_DPR_CHD': 'Child dependency ratio', 'DM_DPR_OLD': 'Old age dependency ratio', 'DM_DPR_TOT': 'Total dependency ratio', 'DM_FRATE_TOT': 'Total fertility rate', 'DM_LIFE_EXP': 'Life expectancy', 'DM_NET_MG_RATE': 'Net migration rate (per 1,000 population)', 'DM_POP_15TO24': 'Youth population from 15 to 24', 'DM_POP_ADLCNT': 'Adolescent population (10-19)', 'DM_POP_ADLCNT_PROP': 'Adolescent population as proportion of total population (%)', 'DM_POP_GRT': 'Population annual growth rate', 'DM_POP_TOT': 'Total population', 'DM_POP_U18': 'Population under age 18', 'DM_POP_U5': 'Population under age 5', 'DM_POP_URBN': 'Share of urban population', 'DM_POP_U_GRT': 'Annual growth rate of urban population', 'ECD_CHLD_36-59M_EDU-PGM': 'Percentage of children aged 36-59 months attending an early childhood education programme', 'ECON_GVT_EDU_EXP_PTEXP': 'government expenditure on education (% government budget)', 'ECON_GVT_EDU_EXP_PTGDP': 'government expenditure on education (% GDP)', 'ECON_GVT_HLTH_EXP_PTEXP': 'government expenditure on health (% government budget)', 'ECON_GVT_HLTH_EXP_PTGDP': 'government expenditure on health (% GDP)', 'ECON_GVT_REV_PTGDP': 'government revenue (%GDP)', 'ECON_ODA_INFLOW_PTGNI': 'ODA inflow (%GNI)', 'ECON_ODA_INFLOW_USD': 'ODA inflow (USD)', 'ECON_SOC_PRO_EXP_PTEXP': 'government expenditure on social protection (% government budget)', 'ECON_SOC_PRO_EXP_PTGDP': 'government expenditure on social protection (% GDP)', 'ED_15-24_LR': 'Youth literacy rate for 15-24 years', 'ED_ANAR_L02': 'Adjusted net attendance rate, one year before the official primary entry age', 'ED_ANAR_L1': 'Adjusted net attendance rate for children of primary school age', 'ED_ANAR_L2': 'Adjusted net attendance rate for adolescents of lower secondary school age', 'ED_ANAR_L3': 'Adjusted net attendance rate for youth of upper secondary school age', 'ED_CR_L1': 'Completion rate for children of primary school age', 'ED_CR_L2': 'Completion rate for adolescents of lower secondary school age', 'ED_CR_L3': 'Completion rate for youth of upper secondary education school age', 'ED_ROFST_L1': 'Out-of-school rate for children of primary school age', 'ED_ROFST_L2': 'Out-of-school rate for adolescents of lower secondary school age', 'ED_ROFST_L3': 'Out-of-school rate for youth of upper secondary school age', 'ED_ROFST_L3_ADM': 'Out-of-school rate for youth of upper secondary school age (administrative data)', 'GN_FB_BNK_ACCSS': 'Proportion of adolescents and adults (aged 15 years and older) with an account at a financial institution or mobile money service provider', 'GN_IDX': 'Social Institutions and Gender Index (SIGI)', 'GN_IDX_CAT': 'Social Institutions and Gender Index Categorical (SIGI)', 'GN_LF_PTCPN': 'Labour force participation rate', 'GN_MTNTY_LV_BNFTS': 'Maternity leave benefits', 'GN_PTNTY_LV_BNFTS': 'Paternity leave benefits', 'GN_UNMPLY': 'Labour force unemployment rate', 'HVA_EPI_DTH_ANN_0-19': 'Estimated number of annual AIDS-related deaths (children aged 0-19 years)', 'HVA_EPI_DTH_ANN_15-24': 'Estimated number of annual AIDS-related deaths (adolescents and young people aged 15-24 years)', 'HVA_EPI_DTH_RT_0-14': 'Estimated rate of annual AIDS-related deaths (per 100,000 population, children aged 0-14 years)', 'HVA_EPI_DTH_RT_10-19': 'Estimated rate of annual AIDS-related deaths (per 100,000 population, adolescents aged 10-19 years)', 'HVA_EPI_INF_ANN_0-19': 'Estimated number of new HIV infections (children aged 0-19 years)', 'HVA_EPI_INF_ANN_15-24': 'Estimated number of new HIV infections (adolescents and young people aged 15-24 years)', 'HVA_EPI_INF_RT_0-14': 'Estimated incidence rate (new HIV infection per 1,000 uninfected population, children aged 0-14 years)', 'HVA_EPI_INF_RT_10-19': 'Estimated incidence rate (new HIV infection per 1,000 uninfected population, adolescents aged 10-19 years)', 'HVA_EPI_LHIV_0-19': 'Estimated number of children (aged 0-19 years) living with HIV', 'HVA_EPI_LHIV_15-24': 'Estimated number of adolescents and young people (aged 15-24 years) living with HIV', 'HVA_PED_ART_CVG': 'Per cent of children (aged 0-14 years) living with HIV and receiving antiretroviral therapy (ART)', 'HVA_PED_ART_NUM': 'Reported number of children (aged 0-14 years) receiving antiretroviral treatment (ART)', 'HVA_PED_EID_CVG': 'Per cent of infants born to pregnant women living with HIV who received a virological test for HIV within 2 months of birth', 'HVA_PED_EID_NUM': 'Reported number of infants born to pregnant women living with HIV who received a virological test for HIV within 2 months of birth', 'HVA_PED_LOST': 'Estimated number of children (aged 0-17 years) who have lost one or both parents due to all causes', 'HVA_PED_LOST_AIDS': 'Estimated number of children (aged 0-17 years) who have lost one or both parents due to AIDS', 'HVA_PMTCT_ART_CVG': 'Per cent of pregnant women living with HIV receiving lifelong ART', 'HVA_PMTCT_ART_NUM': 'Reported number of pregnant women living with HIV receiving lifelong antiretroviral treatment (ART)', 'HVA_PMTCT_ARV_CVG': 'Per cent of pregnant women living with HIV receiving effective ARVs for PMTCT (excludes single-dose nevirapine)', 'HVA_PMTCT_ARV_NUM': 'Reported number of pregnant woment living with HIV receiving anitretroviral treatments (ARVs) for prevention of mother to child transmission programmes (PMTCT)', 'HVA_PMTCT_MTCT': 'Mother-to-child HIV transmission rate', 'HVA_PMTCT_STAT_CVG': 'Per cent of pregnant women presenting at ANC who were tested for HIV or already knew their HIV positive status', 'HVA_PMTCT_STAT_NUM': 'Reported number of pregnant women presenting at antenatal clinics (ANC) who were tested for HIV or already knew their HIV positive status', 'HVA_PREV_KNOW': 'Per cent of young people (aged 15-24 years) with comprehensive, correct knowledge of HIV', 'HVA_PREV_KNOW_TEST': 'Per cent of young people (aged 15-24 years) who know a place to get tested for HIV', 'HVA_PREV_TEST_RES': 'Per cent of young people (aged 15-24 years) who have ever been tested for HIV and received the result of the last test', 'IM_BCG': 'Percentage of live births who received bacille Calmette-Guerin (vaccine against tuberculosis)', 'IM_DTP1': 'Percentage of surviving infants who received the first dose of DTP-containing vaccine', 'IM_DTP3': 'Percentage of surviving infants who received the third dose of DTP-containing vaccine', 'IM_HEPB3': 'Percentage of surviving infants who received the third dose of hep B-containing vaccine', 'IM_HEPBB': 'Percentage of live births who received hepatitis-B-containing vaccine within 24 hours of birth', 'IM_HIB3': 'Percentage of surviving infants who received the third dose of Hib-containing vaccine', 'IM_IPV1': 'Percentage of surviving infants who received the first dose of inactivated polio-containing vaccine', 'IM_MCV1': 'Percentage of surviving infants who received the first dose of measles-containing vaccine', 'IM_MCV2': 'Percentage of children who received the 2nd dose of measles-containing vaccine, as per administered in the national schedule', 'IM_PAB': 'Percentage of newborns protected at birth against tetanus with tetanus toxoid', 'IM_PCV3': 'Percentage of surviving infants who received the third dose of pneumococcal conjugate-containing vaccine (PCV)', 'IM_POL3': 'Percentage of surviving infants who received the third dose of inactivated polio-containing vaccine', 'IM_ROTAC': 'Percentage of surviving infants who received the last dose of rotavirus-containing vaccine (2nd or 3rd dose depending on vaccine used)', 'MG_INTNL_MG_CNTRY_DEST': 'International migrants, by country of destination', 'MG_RFGS_CNTRY_ASYLM': 'Refugees, by country of asylum', 'MG_RFGS_CNTRY_ASYLM_PER1000': 'Refugees by host country, per 1000 population', 'MG_RFGS_CNTRY_ASYLM_PER_USD_GNI': 'Refugees by host country, per 1 USD GNI per capita', 'MG_RFGS_CNTRY_ORIGIN': 'Refugees, by country of origin', 'MNCH_ABR': 'Adolescent birth rate (number of live births to adolescent women per 1,000 adolescent women)', 'MNCH_ADO_ALCOHOL': 'Percentage of adolescents (aged 15-19 years) who had at least one alcoholic drink at any time during the last 12 months', 'MNCH_ADO_INSUFF_PHYS': 'Insufficient physical activity among school going adolescents', 'MNCH_ADO_TOBACCO': 'Percentage of adolescents (aged 13-15 years) who smoked cigarettes or used smoked or smokeless tobacco products at any time during the last month', 'MNCH_ANC1': 'Antenatal care 1+ visit - percentage of women (aged 15-49 years) attended at least once during pregnancy by skilled health personnel', 'MNCH_ANC4': 'Antenatal care 4+ visits - percentage of women (aged 15-49 years) attended at least four times during pregnancy by any provider', 'MNCH_BIRTH18': 'Early childbearing - percentage of women (aged 20-24 years) who gave birth before age 18', 'MNCH_CSEC': 'C-section rate - percentage of deliveries by cesarean section', 'MNCH_DEMAND_FP': 'Demand for family planning satisfied with modern methods - percentage of women (aged 15-49 years)', 'MNCH_DIARCARE': 'Careseeking for diarrhoea - percentage of children (under age 5) with diarrhoea for whom advice or treatment was sought from a health facility or provider', 'MNCH_INSTDEL': 'Institutional deliveries - percentage of deliveries in a health facility', 'MNCH_ITN': 'ITN use by children - percentage of children (under age 5) who slept under an insecticide-treated mosquito net the night prior to the survey', 'MNCH_ITN2': 'Household with insecticide treated net (ITN) and/or indoor residual spraying (IRS) - percentage of households with at least one ITN for every two persons and/or IRS in the past 12 months', 'MNCH_ITNOWN': 'Percentage of households with at least one insecticide-treated mosquito net (ITN)', 'MNCH_ITNPREG': 'Pregnant women sleeping under ITN - percentage of pregnant women (aged 15-49 years) who slept under an insecticide-treated net the previous night', 'MNCH_LIFE_EXPECTANCY': 'Life expectancy at birth - number of years newborn female children would live if subject to the mortality risks prevailing for the cross section of population at the time of their birth (estimated)', 'MNCH_LTR_MATERNAL_DEATH': 'Lifetime risk of maternal death (probability (1 in X) that a 15-year-old girl (in the year of the estimate) will eventually die from a maternal cause)', 'MNCH_MATERNAL_DEATHS': 'Maternal deaths (estimated)', 'MNCH_MLRACT': 'Malaria, first line treatment - percentage of febrile children (under age 5) receiving ACT (first line antimalarial drug), among those receiving any antimalarial drugs', 'MNCH_MLRCARE': 'Careseeking for febrile children - percentage of children (under age 5) with fever for whom advice or treatment was sought from a health facility or provider', 'MNCH_MLRDIAG': 'Malaria diagnostics - percentage of febrile children (under age 5) who had a finger or heel stick for malaria testing', 'MNCH_MMR': 'Maternal mortality ratio (number of maternal deaths per 100,000 live births)', 'MNCH_ORS': 'Diarrhoea treatment - percentage of children (under age 5) with diarrhoea who received ORS (packets or pre-packaged fluids)', 'MNCH_ORSZINC': 'Diarrhoea treatment - percentage of children (under age 5) with diarrhoea who received ORS and zinc', 'MNCH_ORTCF': 'Diarrhoea treatment - percentage of children (under age 5) with diarrhoea who received ORT (oral rehydration salts or recommended homemade fluids or increased fluids) and continued feeding', 'MNCH_PNCMOM': 'Postnatal care for mothers - percentage of women (aged 15-49 years) who received postnatal care within 2 days of giving birth', 'MNCH_PNCNB': 'Postnatal care for newborns - percentage of newborns who have a postnatal contact with a health provider within 2 days of delivery', 'MNCH_PNEUCARE': 'Careseeking for ARI - percentage of children (under age 5) with acute respiratory infection symptoms whom advice or treatment was sought from a health facility or provider', 'MNCH_SAB': 'Skilled birth attendant - percentage of deliveries attended by skilled health personnel', 'MNCH_UHC': 'Coverage of essential health services', 'MNCH_UHC_RMNCH': 'Universal health coverage index for reproductive, maternal, newborn and child-health interventions', 'MNCH_ZINC': 'Diarrhoea treatment - percentage of children (under age 5) with diarrhoea who received zinc', 'NT_ANT_BAZ_AVG': 'Mean BMI-for-age', 'NT_ANT_BAZ_NE1': 'BMI-for-age <-1 SD', 'NT_ANT_BAZ_NE1_T_NE2': 'BMI-for-age <-1 SD and ≥ -2 SD, Survey Estimates', 'NT_ANT_BAZ_NE2': 'BMI-for-age <-2 SD', 'NT_ANT_BAZ_NE2_T_NE3': 'BMI-for-age <-2 SD and ≥ -3 SD, Survey Estimates', 'NT_ANT_BAZ_NE3': 'BMI-for-age <-3 SD', 'NT_ANT_BAZ_PO1': 'BMI-for-age >+1 SD', 'NT_ANT_BAZ_PO1_T_PO2': 'BMI-for-age >+1 SD and ≤+2 SD, Survey Estimates', 'NT_ANT_BAZ_PO2': 'BMI-for-age >+2 SD', 'NT_ANT_BAZ_PO2_T_PO3': 'BMI-for-age >+2 SD and ≤+3 SD, Survey Estimates', 'NT_ANT_BAZ_PO3': 'BMI-for-age >+3 SD', 'NT_ANT_BAZ_SD': 'BMI-for-age (Standard Deviation)', 'NT_ANT_COMB': 'Wasted, Overweight or Stunted', 'NT_ANT_FREE': 'No Wasting, Overweight, Stunting', 'NT_ANT_HAZWHZ_NE2_NE2': 'Height-for-age <-2SD & Weight-for-height <-2SD', 'NT_ANT_HAZWHZ_NE2_PO2': 'Height-for-age <-2SD & Weight-for-height >+2SD', 'NT_ANT_HAZWHZ_NE3_NE2': 'Height-for-age <-3SD & Weight-for-height <-2SD', 'NT_ANT_HAZWHZ_NE3_PO2': 'Height-for-age <-3SD & Weight-for-height >+2SD', 'NT_ANT_HAZ_AVG': 'Mean Height-for-age', 'NT_ANT_HAZ_NE1': 'Height-for-age <-1 SD', 'NT_ANT_HAZ_NE1_T_NE2': 'Height-for-age <-1 SD and ≥ -2 SD (Mild Stunting only), Survey Estimates', 'NT_ANT_HAZ_NE2': 'Height-for-age <-2 SD (stunting)', 'NT_ANT_HAZ_NE2_MOD': 'Height-for-age <-2 SD (stunting), Modeled Estimates', 'NT_ANT_HAZ_NE2_MOD_NUMTH': 'Height-for-age <-2 SD (Stunting) Modeled Estimates, Numbers Affected', 'NT_ANT_HAZ_NE2_ONLY': 'Height-for-age <-2SD but weight-for-height ≥-2SD and weight-for-height ≤2SD', 'NT_ANT_HAZ_NE2_T_NE3': 'Height-for-age <-2 SD and ≥ -3 SD (Moderate Stunting only), Survey Estimates', 'NT_ANT_HAZ_NE3': 'Height-for-age <-3 SD (Severe Stunting)', 'NT_ANT_HAZ_PO1': 'Height-for-age >+1 SD', 'NT_ANT_HAZ_PO1_T_PO2': 'Height-for-age >+1 SD and ≤+2 SD, Survey Estimates', 'NT_ANT_HAZ_PO2': 'Height-for-age >+2 SD', 'NT_ANT_HAZ_PO2_T_PO3': 'Height-for-age >+2 SD and ≤+3 SD, Survey Estimates', 'NT_ANT_HAZ_PO3': 'Height-for-age >+3 SD', 'NT_ANT_HAZ_SD': 'Height-for-age (Standard Deviation)', 'NT_ANT_WAZ_AVG': 'Weight-for-age (Mean)', 'NT_ANT_WAZ_NE1': 'Weight-for-age <-1 SD', 'NT_ANT_WAZ_NE1_T_NE2': 'Weight-for-age <-1 SD and ≥ -2 SD, Survey Estimates', 'NT_ANT_WAZ_NE2': 'Weight-for-age <-2 SD (Underweight)', 'NT_ANT_WAZ_NE2_T_NE3': 'Weight-for-age <-2 SD and ≥ -3 SD, Survey Estimates', 'NT_ANT_WAZ_NE3': 'Weight-for-age <-3 SD (Severe Underweight)', 'NT_ANT_WAZ_PO1': 'Weight-for-age >+1 SD', 'NT_ANT_WAZ_PO1_T_PO2': 'Weight-for-age >+1 SD and ≤+2 SD, Survey Estimates', 'NT_ANT_WAZ_PO2': 'Weight-for-age (>+2 SD)', 'NT_ANT_WAZ_PO2_T_PO3': 'Weight-for-age >+2 SD and ≤+3 SD, Survey Estimates', 'NT_ANT_WAZ_PO3': 'Weight-for-age (>+3 SD)', 'NT_ANT_WAZ_SD': 'Weight-for-age (Standard Deviation)', 'NT_ANT_WHZ_AVG': 'Mean Weight-for-height', 'NT_ANT_WHZ_NE1': 'Weight-for-height <-1 SD', 'NT_ANT_WHZ_NE1_T_NE2': 'Weight-for-height <-1 SD and ≥ -2 SD, Survey Estimates', 'NT_ANT_WHZ_NE2': 'Weight-for-height <-2 SD (wasting)', 'NT_ANT_WHZ_NE2_ONLY': 'Weight-for-height <-2SD but height-for-age ≥-2SD', 'NT_ANT_WHZ_NE2_T_NE3': 'Weight-for-height <-2 SD and ≥ -3 SD, Survey Estimates', 'NT_ANT_WHZ_NE3': 'Weight-for-height <-3 SD (severe wasting)', 'NT_ANT_WHZ_PO1': 'Weight-for-height >+1 SD', 'NT_ANT_WHZ_PO1_T_PO2': 'Weight-for-height >+1 SD and ≤+2 SD, Survey Estimates', 'NT_ANT_WHZ_PO2': 'Weight-for-height >+2 SD (overweight)', 'NT_ANT_WHZ_PO2_MOD': 'Weight-for-height >+2 SD (overweight), Modeled Estimates', 'NT_ANT_WHZ_PO2_MOD_NUMTH': 'Weight-for-height >+2 SD (Overweight) Modeled Estimates, Numbers Affected', 'NT_ANT_WHZ_PO2_ONLY': 'Weight-for-height >+2SD but height-for-age ≥-2SD', 'NT_ANT_WHZ_PO2_T_PO3': 'Weight-for-height >+2 SD and ≤+3 SD, Survey Estimates', 'NT_ANT_WHZ_PO3': 'Weight-for-height >+3 SD', 'NT_ANT_WHZ_SD': 'Weight-for-height (Standard Deviation)', 'NT_BF_CBF_12_15': 'Continued breastfeeding (12-15 months)', 'NT_BF_CBF_12_23': 'Continued breastfeeding (12-23 months)', 'NT_BF_CBF_20_23': 'Continued breastfeeding (20-23 months)', 'NT_BF_EBF': 'Ever breastfed (0-23 months)', 'NT_BF_EIBF': 'Early initiation of breastfeeding', 'NT_BF_EXBF': 'Exclusive breastfeeding (0-5 months)', 'NT_BF_EXBF_2D': 'Exclusively Breastfed for the First Two Days After Birth', 'NT_BF_MIXMF': 'Mixed Milk Feeding (0-5 months)', 'NT_BF_PRED_BF': 'Predominantly breastfeeding (children aged 0 to 5 months)', 'NT_BW_UNW': 'Percentage of births without a birth weight in the data source', 'NT_CF_ASF': 'Egg and/or flesh foods consumption (6-23months)', 'NT_CF_BREASTMILK': 'Food group- Breastmilk (6-23months)', 'NT_CF_DAIRY': 'Food group- Dairy (milk, infant formula, yogurt, cheese) (6-23months)', 'NT_CF_EGGS': 'Food group- Eggs (6-23months)', 'NT_CF_FF': 'Food group- Flesh foods (meat, poultry, fish and organ meats) (6-23months)', 'NT_CF_GRAINS': 'Food group- Grains, roots, tubers and plantains (6-23months)', 'NT_CF_ISSSF_FL': 'Introduction to solid, semi-solid foods (6-8 months)', 'NT_CF_LEGUMES': 'Food group- Pulses (beans, peas, lentils), nuts and seeds (6-23months)', 'NT_CF_MAD': 'Minimum acceptable diet (children aged 6-23 months)', 'NT_CF_MDD': 'Minimum diet diversity (children aged 6 to 23 months)', 'NT_CF_MMF': 'Minimum meal frequency (children aged 6 to 23 months)', 'NT_CF_OTHER_FV': 'Food group- Other fruits and vegetables (6-23months)', 'NT_CF_VITA': 'Food group- Vitamin-A rich fruits and vegetables (6-23months)', 'NT_CF_ZEROFV': 'Zero vegetable or fruit consumption (6-23months)', 'NT_IOD_ANY_TH': 'Iodized salt consumption (>0 ppm) among all tested households', 'NT_IOD_ANY_TS': 'Iodized salt consumption (>0 ppm) among all tested households with salt', 'NT_OVERWEIGHT': 'Overweight', 'NT_SANT_10_19_BAZ_NE2_MOD': 'Prevalence of thinness among children aged 10-19 years, BMI < -2 standard deviations below the median (Crude estimate)', 'NT_SANT_10_19_BAZ_PO1_MOD': 'Prevalence of overweight among children aged 10-19 years, BMI > +1 standard deviations above the median (Crude estimate)', 'NT_THINNESS': 'Thinness', 'NT_VAS_S1': 'VAS Semester 1 Coverage', 'NT_VAS_S2': 'VAS Semester 2 Coverage', 'NT_VAS_TWODOSE': 'Vitamin A two-dose coverage', 'PT_ADLS_10-14_LBR_HC': 'Percentage of adolescents (aged 10-14 years) engaged in household chores', 'PT_ADLT_PS_NEC': 'Percentage of adults who think that physical punishment is necessary to raise/educate children', 'PT_CHLD_1-14_PS-PSY-V_CGVR': 'Percentage of children (aged 1-14 years) who experienced any physical punishment and/or psychological aggression by caregivers', 'PT_CHLD_5-17_LBR_ECON': 'Percentage of children (aged 5-17 years) engaged in child labour (economic activities)', 'PT_CHLD_5-17_LBR_ECON-HC': 'Percentage of children (aged 5-17 years) engaged in child labour (economic activities and household chores)', 'PT_CHLD_LBR_THRSLD_ECON': 'Child labour thresholds (economic activity)', 'PT_CHLD_LBR_THRSLD_HC': 'Child labour thresholds (household chores)', 'PT_CHLD_LBR_TIME_ECON': 'Time spent in economic activities', 'PT_CHLD_LBR_TIME_HC': 'Time spent in household chores', 'PT_CHLD_Y0T4_REG': 'Percentage of children under age 5 whose births are registered', 'PT_F_15-17_SX-V': 'Percentage of girls (aged 15-17 years) who have experienced sexual violence', 'PT_F_15-19_MRD': 'Percentage of girls aged 15-19 years who are currently married or in union', 'PT_F_15-49_W-BTNG': 'Percentage of women (aged 15-49 years) who consider a husband to be justified in hitting or beating his wife for at least one of the specified reasons', 'PT_F_18-29_SX-V_AGE-18': 'Percentage of women (aged 18-29 years) who experienced sexual violence by age 18', 'PT_F_20-24_MRD_U15': 'Percentage of women (aged 20-24 years) married or in union before age 15', 'PT_F_20-24_MRD_U18': 'Percentage of women (aged 20-24 years) married or in union before age 18', 'PT_F_GE15_PS-SX-EM_V_PTNR_12MNTH': 'Percentage of ever-partnered women and girls (aged 15 years and older) subjected to physical, sexual or psychological violence by a current or former intimate partner in the previous 12 months', 'PT_M_15-19_MRD': 'Percentage of boys aged 15-19 years who are currently married or in union', 'PT_M_20-24_MRD_U18': 'Percentage of men (aged 20-24 years) married or in union before age 18', 'PT_ST_13-15_BUL_30-DYS': 'Percentage of students (aged 13-15 years) who reported being bullied on 1 or more days in the past 30 days', 'PV_CHLD_INCM-PL': 'Children living in households with income below the national poverty line (as a % of all children)', 'SPP_CHLD_SOC_PROT': 'Proportion of children covered by social protection', 'SPP_GDPPC': 'GDP per capita (current US$)', 'SPP_GINI': 'Gini Coefficient', 'SPP_MOTHERS_CASH_BNF': 'Mothers with newborns receiving cash benefit (%)', 'WS_PPL_H-B': 'Proportion of population with a handwashing facility with soap and water available at home', 'WS_PPL_H-L': 'Proportion of population with a limited handwashing facility', 'WS_PPL_H-N': 'Proportion of population with no handwashing facility at home', 'WS_PPL_S-ALB': 'Proportion of population using at least basic sanitation services', 'WS_PPL_S-I': 'Proportion of population using improved sanitation facilities', 'WS_PPL_S-L': 'Proportion of population using limited sanitation services', 'WS_PPL_S-LAT': 'Proportion of population using improved latrines and other improved facilities', 'WS_PPL_S-OD': 'Proportion of population practising open defecation', 'WS_PPL_S-SEP': 'Proportion of population using sanitation facilities connected to septic tanks', 'WS_PPL_S-SEW': 'Proportion of population using sanitation facilities connected to sewer networks', 'WS_PPL_S-UI': 'Proportion of population using unimproved sanitation facilites', 'WS_PPL_W-ALB': 'Proportion of population using at least basic drinking water services', 'WS_PPL_W-B': 'Proportion of population using basic drinking water services', 'WS_PPL_W-I': 'Proportion of population using improved drinking water sources', 'WS_PPL_W-L': 'Proportion of population using limited drinking water services', 'WS_PPL_W-NP': 'Proportion of population using non-piped improved drinking water sources', 'WS_PPL_W-P': 'Proportion of population using piped drinking water sources', 'WS_PPL_W-PRE': 'Proportion of population using improved drinking water sources located on premises', 'WS_PPL_W-QUA': 'Proportion of population using of improved drinking water sources free from faecal and priority chemical contamination', 'WS_PPL_W-SM': 'Proportion of population using safely managed drinking water services', 'WS_PPL_W-SW': 'Proportion of population using surface water', 'WS_PPL_W-UI': 'Proportion of population using unimproved drinking water sources', 'WS_SCH_H-B': 'Proportion of schools with basic hygiene services', 'WS_SCH_S-B': 'Proportion of schools with basic sanitation services', 'WS_SCH_S-L': 'Proportion of schools with limited sanitation services', 'WS_SCH_S-N': 'Proportion of schools with no sanitation service', 'WS_SCH_W-B': 'Proportion of schools with basic drinking water services', 'WS_SCH_W-L': 'Proportion of schools with limited drinking water services', 'WS_SCH_W-N': 'Proportion of schools with no drinking water service', 'WT_ADLS_15-19_ED_NEET': 'Percentage of adolescents (aged 15-19 years) not in education, employment or training', 'WT_ADLS_15-19_LAB_FRC_UNEMP': 'Percentage of adolescents (aged 15-19 years) in the labour force who are unemployed', 'IM_RCV1': 'Percentage of surviving infants who received the first dose of rubella-containing vaccine', 'IM_YFV': 'Percentage of surviving infants who received yellow fever- containing vaccine (for countries at risk and where the vaccine is in the national schedule)', 'MNCH_IPTP': 'IPTp for pregnant women - percentage of women (aged 15-49 years) who received three or more doses of intermittent preventive treatment during antenatal care visits during their last pregnancy', 'NT_BW_LBW_MOD': 'Number (in thousands) of live births that weighed less than 2500 g (Modeled Estimates)', 'NT_BW_LBW_MOD_NUMTH': 'Number (in thousands) of live births that weighed less than 2500 g (Modeled Estimates)', 'WS_HCF_H-B': 'Proportion of health care facilities with basic hygiene services', 'WS_HCF_H-L': 'Proportion of health care facilities with limited hygiene services', 'WS_HCF_H-N': 'Proportion of health care facilities with no hygiene service', 'WS_HCF_S-B': 'Proportion of health care facilities with basic sanitation services', 'WS_HCF_S-L': 'Proportion of health care facilities with limited sanitation services', 'WS_HCF_S-N': 'Proportion of health care facilities with no sanitation service', 'WS_HCF_W-B': 'Proportion of health care facilities with basic water services', 'WS_HCF_W-L': 'Proportion of health care facilities with limited water services', 'WS_HCF_W-N': 'Proportion of health care facilities with no water service', 'WS_HCF_WM-B': 'Proportion of health care facilities with basic health care waste management services', 'WS_HCF_WM-L': 'Proportion of health care facilities with limited health care waste management services', 'WS_HCF_WM-N': 'Proportion of health care facilities with no health care waste management service', 'WS_PPL_S-B': 'Proportion of population using basic sanitation services', 'WS_PPL_S-DIS': 'Proportion of population using on-site sanitation facilities with human waste disposed in situ', 'WS_PPL_S-SM': 'Proportion of population using safely managed sanitation services', 'WS_PPL_S-WWT': 'Proportion of population using sanitation facilities connected to sewer networks and with sewage treated to at least secondary levels', 'WS_PPL_W-AVA': 'Proportion of population using improved drinking water sources available when needed', 'WS_SCH_H-L': 'Proportion of schools with limited hygiene services', 'WS_SCH_H-N': 'Proportion of schools with no hygiene service', 'ECON_GVT_EXP_PTGDP': 'government expenditure (% GDP)', 'ED_MAT_L1': 'Proportion of students at the end of primary achieving at least a minimum proficiency level in mathematics', 'ED_MAT_L2': 'Proportion of students at the end of lower secondary achieving at least a minimum proficiency level in mathematics', 'ED_READ_L2': 'Proportion of students at the end of lower secondary achieving at least a minimum proficiency level in reading', 'ED_ROFST_L02_ADM': 'Out-of-school rate for children one year younger than official entry age (administrative data)', 'ED_ROFST_L1_ADM': 'Out-of-school rate for children of primary school age (administrative data)', 'ED_ROFST_L2_ADM': 'Out-of-school rate for adolescents of lower secondary school age (administrative data)', 'GN_SG_LGL_GENEQEMP': 'Legal frameworks that promote, enforce and monitor gender equality in employment and economic benefits', 'NT_BW_LBW': 'Prevalence of low birth weight among new-borns', 'PV_CHLD_DPRV-AVG-HS': 'Average number of deprivations suffered per child. Homogeneous moderate standards', 'PV_CHLD_DPRV-AVG-POV-HS': 'Average number of deprivations for children suffering at least one deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-AVG-POV-S-HS': 'Average number of deprivations for children suffering at least one deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-AVG-S-HS': 'Average number of deprivations suffered per child. Homogeneous severe standards', 'PV_CHLD_DPRV-E1-HS': 'Percentage Children suffering exactly one deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-E2-HS': 'Percentage Children suffering exactly two deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-E3-HS': 'Percentage Children suffering exactly three deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-E4-HS': 'Percentage Children suffering exactly four deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-E5-HS': 'Percentage Children suffering exactly five deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-L1-HS': 'Percentage children suffering at least one deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-L2-HS': 'Percentage children suffering at least two deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-L3-HS': 'Percentage children suffering at least three deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-L4-HS': 'Percentage children suffering at least four deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-L5-HS': 'Percentage children suffering at least five deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-S-E1-HS': 'Percentage Children suffering exactly one deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-E2-HS': 'Percentage Children suffering exactly two deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-E3-HS': 'Percentage Children suffering exactly three deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-E4-HS': 'Percentage Children suffering exactly four deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-E5-HS': 'Percentage Children suffering exactly five deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-L1-HS': 'Percentage children suffering at least one deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-L2-HS': 'Percentage children suffering at least two deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-L3-HS': 'Percentage children suffering at least three deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-L4-HS': 'Percentage children suffering at least four deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-L5-HS': 'Percentage children suffering at least five deprivation. Homogeneous severe standards', 'PV_VMIR': 'Vast Majority Income Ratio', 'SPP_PALMA': 'Palma Index of income inequality', 'SPP_VMI': 'VMI (vast majority index of income inequality)', 'WS_PPL_S-FST': 'Proportion of population using of on-site sanitation facilities with human waste treated off-site', 'ECD_CHLD_36-59M_LMPSL': 'Percentage of children (aged 36-59 months) developmentally on track in at least 3 of the 4 following domains', 'GN_IT_MOB_OWN': 'Proportion of individuals who own a mobile telephone', 'HVA_PREV_STIGMA': 'Per cent of people (aged 15-49 years) expressing discriminatory attitudes towards people living with HIV', 'PV_LEVEL': 'Poverty Level', 'GN_ED_ATTN': 'Educational attainment of the population (aged 25 years and older)', 'IM_HPV': 'Percentage of females who received the last dose of human papillomavirus (HPV) vaccine per national schedule', 'PT_F_15-17_SX-V_HLP': 'Percentage of girls (aged 15-17 years) who have ever experienced any sexual violence and sought help from a professional', 'PT_F_GE15_SX_V_PTNR_12MNTH': 'Women and girls aged 15 and older subjected to sexual violence by persons other than an intimate partner in the previous 12 months', 'ECON_ODA_OUTFLOW_PTGNI': 'ODA outflow (%GNI)', 'ECON_ODA_OUTFLOW_USD': 'ODA outflow (USD)', 'ED_MAT_G23': 'Proportion of students in Grade 2 or 3 achieving at least a minimum proficiency level in mathematics', 'ED_READ_G23': 'Proportion of students in Grade 2 or 3 achieving at least a minimum proficiency level in reading', 'ED_READ_L1': 'Proportion of students at the end of primary achieving at least a minimum proficiency level in reading', 'PT_F_0-14_FGM': 'Percentage of girls (aged 0-14 years) who have undergone female genital mutilation (FGM)', 'PT_F_15-49_FGM': 'Percentage of girls and women (aged 15-49 years) who have undergone female genital mutilation (FGM)', 'PT_F_15-49_FGM_ELIM': 'Percentage of women (aged 15-49 years) who think that FGM should be eliminated', 'PT_M_15-49_FGM_ELIM': 'Percentage of boys and men (aged 15-49 years) who think that FGM should be eliminated', 'WS_HCF_C-B': 'Proportion of health care facilities with basic cleaning services', 'WS_HCF_C-L': 'Proportion of health care facilities with limited cleaning services', 'WS_HCF_C-N': 'Proportion of health care facilities with no cleaning service', 'PT_M_15-17_SX-V': 'Percentage of boys (aged 15-17 years) who have experienced sexual violence', 'PT_M_18-29_SX-V_AGE-18': 'Percentage of men (aged 18-29 years) who experienced sexual violence by age 18', 'HVA_PREV_CNDM_REG': 'Per cent of young people (aged 15-24 years) who had sex with a non-marital, non-cohabitating partner in the past 12 months reporting the use of a condom during their last sexual intercourse', 'ECD_CHLD_24-59M_ADLT_SRC': 'Percentage of children (aged 24-59 months) with whom any adult household member has engaged in 4 or more activities to provide early stimulation and responsive care in the last 3 days', 'ECD_CHLD_24-59M_FHR-SPT-LNG': 'Percentage of children (aged 24-59 months) whose father has engaged in 4 or more activities to provide early stimulation and responsive care in the last 3 days', 'ECD_CHLD_U5_BKS-HM': "Percentage of children under age 5 who have 3 or more children's books", 'ECD_CHLD_U5_LFT-ALN': 'Percentage of children under age 5 left alone or under the supervision of another child younger than 10 years of age for more than 1 hour at least once in the last week', 'ECD_CHLD_U5_PLYTH-HM': 'Percentage of children under age 5 who play with 2 or more types of playthings'}
 
-    OBS_CONF_dict = {'nan': 'nan', 'F': 'Free'}
+AGE_dict = {'_T': 'Total', 'M36T59': '36 to 59 months old', 'Y_GE15': '15 years old and over', 'Y0': 'Under 1 year old', 'Y15T24': '15 to 24 years old', 'M12T23': '12 to 23 months old', 'Y0T17': 'Under 18 years old', 'Y15T19': '15 to 19 years old', 'Y11T17': '11 to 17 years old', 'Y13T15': '13 to 15 years', 'Y15T49': '15 to 49 years old', 'Y20T24': '20 to 24 years old', 'Y0T4': 'Under 5 years old', 'M12T15': '12 to 15 months old', 'M20T23': '20 to 23 months old', 'M0T23': 'Under 24 months old', 'M0T5': 'Under 6 months old', 'M6T23': '6 to 23 months old', 'Y10T19': '10 to 19 years old', 'M6T59': '6 to 59 months old', 'Y10T14': '10 to 14 years old', 'Y1T14': '1 to 14 years old', 'Y5T17': '5 to 17 years old', 'Y15T17': '15 to 17 years old', 'Y18T29': '18 to 29 years old', 'Y_GE25': '25 years old and over', 'Y0T14': 'Under 15 years old', 'M24T59': '24 to 59 months old', 'M0T47': 'Under 48 months old'}
 
-    INDICATOR_dict = {'CME_ARR_10T19': 'Annual Rate of Reduction in Mortality Rate Age 10-19', 'CME_ARR_SBR': 'Annual rate of reduction in stillbirth rate (over previous 20 years)', 'CME_ARR_U5MR': 'Annual rate of reduction in under-five mortality rate (over previous 20 years)', 'CME_MRM0': 'Neonatal mortality rate', 'CME_MRY0': 'Infant mortality rate', 'CME_MRY0T4': 'Under-five mortality rate', 'CME_MRY10T14': 'Mortality rate age 10-14', 'CME_MRY10T19': 'Mortality rate age 10-19', 'CME_MRY15T19': 'Mortality rate age 15-19', 'CME_MRY15T24': 'Mortality rate age 15-24', 'CME_MRY1T4': 'Child mortality rate (aged 1-4 years)', 'CME_MRY20T24': 'Mortality rate age 20-24', 'CME_MRY5T14': 'Mortality rate (children aged 5 to 14 years)', 'CME_MRY5T24': 'Mortality rate age 5-24', 'CME_MRY5T9': 'Mortality rate age 5-9', 'CME_PND': 'Neonatal deaths as a percentage of under-five deaths', 'CME_SB': 'Stillbirths', 'CME_SBR': 'Stillbirth rate', 'CME_TMM0': 'Neonatal deaths', 'CME_TMY0': 'Infant deaths', 'CME_TMY0T4': 'Under-five deaths', 'CME_TMY10T14': 'Deaths aged 10 to 14', 'CME_TMY10T19': 'Deaths aged 10 to 19', 'CME_TMY15T19': 'Deaths aged 15 to 19', 'CME_TMY15T24': 'Deaths aged 15 to 24', 'CME_TMY1T4': 'Child deaths (aged 1-4 years)', 'CME_TMY20T24': 'Deaths aged 20 to 24', 'CME_TMY5T14': 'Deaths (children aged 5-14)', 'CME_TMY5T24': 'Deaths aged 5 to 24', 'CME_TMY5T9': 'Deaths aged 5 to 9', 'DM_BRTS': 'Number of births', 'DM_DPR_CHD': 'Child dependency ratio', 'DM_DPR_OLD': 'Old age dependency ratio', 'DM_DPR_TOT': 'Total dependency ratio', 'DM_FRATE_TOT': 'Total fertility rate', 'DM_LIFE_EXP': 'Life expectancy', 'DM_NET_MG_RATE': 'Net migration rate (per 1,000 population)', 'DM_POP_15TO24': 'Youth population from 15 to 24', 'DM_POP_ADLCNT': 'Adolescent population (10-19)', 'DM_POP_ADLCNT_PROP': 'Adolescent population as proportion of total population (%)', 'DM_POP_GRT': 'Population annual growth rate', 'DM_POP_TOT': 'Total population', 'DM_POP_U18': 'Population under age 18', 'DM_POP_U5': 'Population under age 5', 'DM_POP_URBN': 'Share of urban population', 'DM_POP_U_GRT': 'Annual growth rate of urban population', 'ECD_CHLD_36-59M_EDU-PGM': 'Percentage of children aged 36-59 months attending an early childhood education programme', 'ECON_GVT_EDU_EXP_PTEXP': 'government expenditure on education (% government budget)', 'ECON_GVT_EDU_EXP_PTGDP': 'government expenditure on education (% GDP)', 'ECON_GVT_HLTH_EXP_PTEXP': 'government expenditure on health (% government budget)', 'ECON_GVT_HLTH_EXP_PTGDP': 'government expenditure on health (% GDP)', 'ECON_GVT_REV_PTGDP': 'government revenue (%GDP)', 'ECON_ODA_INFLOW_PTGNI': 'ODA inflow (%GNI)', 'ECON_ODA_INFLOW_USD': 'ODA inflow (USD)', 'ECON_SOC_PRO_EXP_PTEXP': 'government expenditure on social protection (% government budget)', 'ECON_SOC_PRO_EXP_PTGDP': 'government expenditure on social protection (% GDP)', 'ED_15-24_LR': 'Youth literacy rate for 15-24 years', 'ED_ANAR_L02': 'Adjusted net attendance rate, one year before the official primary entry age', 'ED_ANAR_L1': 'Adjusted net attendance rate for children of primary school age', 'ED_ANAR_L2': 'Adjusted net attendance rate for adolescents of lower secondary school age', 'ED_ANAR_L3': 'Adjusted net attendance rate for youth of upper secondary school age', 'ED_CR_L1': 'Completion rate for children of primary school age', 'ED_CR_L2': 'Completion rate for adolescents of lower secondary school age', 'ED_CR_L3': 'Completion rate for youth of upper secondary education school age', 'ED_ROFST_L1': 'Out-of-school rate for children of primary school age', 'ED_ROFST_L2': 'Out-of-school rate for adolescents of lower secondary school age', 'ED_ROFST_L3': 'Out-of-school rate for youth of upper secondary school age', 'ED_ROFST_L3_ADM': 'Out-of-school rate for youth of upper secondary school age (administrative data)', 'GN_FB_BNK_ACCSS': 'Proportion of adolescents and adults (aged 15 years and older) with an account at a financial institution or mobile money service provider', 'GN_IDX': 'Social Institutions and Gender Index (SIGI)', 'GN_IDX_CAT': 'Social Institutions and Gender Index Categorical (SIGI)', 'GN_LF_PTCPN': 'Labour force participation rate', 'GN_MTNTY_LV_BNFTS': 'Maternity leave benefits', 'GN_PTNTY_LV_BNFTS': 'Paternity leave benefits', 'GN_UNMPLY': 'Labour force unemployment rate', 'HVA_EPI_DTH_ANN_0-19': 'Estimated number of annual AIDS-related deaths (children aged 0-19 years)', 'HVA_EPI_DTH_ANN_15-24': 'Estimated number of annual AIDS-related deaths (adolescents and young people aged 15-24 years)', 'HVA_EPI_DTH_RT_0-14': 'Estimated rate of annual AIDS-related deaths (per 100,000 population, children aged 0-14 years)', 'HVA_EPI_DTH_RT_10-19': 'Estimated rate of annual AIDS-related deaths (per 100,000 population, adolescents aged 10-19 years)', 'HVA_EPI_INF_ANN_0-19': 'Estimated number of new HIV infections (children aged 0-19 years)', 'HVA_EPI_INF_ANN_15-24': 'Estimated number of new HIV infections (adolescents and young people aged 15-24 years)', 'HVA_EPI_INF_RT_0-14': 'Estimated incidence rate (new HIV infection per 1,000 uninfected population, children aged 0-14 years)', 'HVA_EPI_INF_RT_10-19': 'Estimated incidence rate (new HIV infection per 1,000 uninfected population, adolescents aged 10-19 years)', 'HVA_EPI_LHIV_0-19': 'Estimated number of children (aged 0-19 years) living with HIV', 'HVA_EPI_LHIV_15-24': 'Estimated number of adolescents and young people (aged 15-24 years) living with HIV', 'HVA_PED_ART_CVG': 'Per cent of children (aged 0-14 years) living with HIV and receiving antiretroviral therapy (ART)', 'HVA_PED_ART_NUM': 'Reported number of children (aged 0-14 years) receiving antiretroviral treatment (ART)', 'HVA_PED_EID_CVG': 'Per cent of infants born to pregnant women living with HIV who received a virological test for HIV within 2 months of birth', 'HVA_PED_EID_NUM': 'Reported number of infants born to pregnant women living with HIV who received a virological test for HIV within 2 months of birth', 'HVA_PED_LOST': 'Estimated number of children (aged 0-17 years) who have lost one or both parents due to all causes', 'HVA_PED_LOST_AIDS': 'Estimated number of children (aged 0-17 years) who have lost one or both parents due to AIDS', 'HVA_PMTCT_ART_CVG': 'Per cent of pregnant women living with HIV receiving lifelong ART', 'HVA_PMTCT_ART_NUM': 'Reported number of pregnant women living with HIV receiving lifelong antiretroviral treatment (ART)', 'HVA_PMTCT_ARV_CVG': 'Per cent of pregnant women living with HIV receiving effective ARVs for PMTCT (excludes single-dose nevirapine)', 'HVA_PMTCT_ARV_NUM': 'Reported number of pregnant woment living with HIV receiving anitretroviral treatments (ARVs) for prevention of mother to child transmission programmes (PMTCT)', 'HVA_PMTCT_MTCT': 'Mother-to-child HIV transmission rate', 'HVA_PMTCT_STAT_CVG': 'Per cent of pregnant women presenting at ANC who were tested for HIV or already knew their HIV positive status', 'HVA_PMTCT_STAT_NUM': 'Reported number of pregnant women presenting at antenatal clinics (ANC) who were tested for HIV or already knew their HIV positive status', 'HVA_PREV_KNOW': 'Per cent of young people (aged 15-24 years) with comprehensive, correct knowledge of HIV', 'HVA_PREV_KNOW_TEST': 'Per cent of young people (aged 15-24 years) who know a place to get tested for HIV', 'HVA_PREV_TEST_RES': 'Per cent of young people (aged 15-24 years) who have ever been tested for HIV and received the result of the last test', 'IM_BCG': 'Percentage of live births who received bacille Calmette-Guerin (vaccine against tuberculosis)', 'IM_DTP1': 'Percentage of surviving infants who received the first dose of DTP-containing vaccine', 'IM_DTP3': 'Percentage of surviving infants who received the third dose of DTP-containing vaccine', 'IM_HEPB3': 'Percentage of surviving infants who received the third dose of hep B-containing vaccine', 'IM_HEPBB': 'Percentage of live births who received hepatitis-B-containing vaccine within 24 hours of birth', 'IM_HIB3': 'Percentage of surviving infants who received the third dose of Hib-containing vaccine', 'IM_IPV1': 'Percentage of surviving infants who received the first dose of inactivated polio-containing vaccine', 'IM_MCV1': 'Percentage of surviving infants who received the first dose of measles-containing vaccine', 'IM_MCV2': 'Percentage of children who received the 2nd dose of measles-containing vaccine, as per administered in the national schedule', 'IM_PAB': 'Percentage of newborns protected at birth against tetanus with tetanus toxoid', 'IM_PCV3': 'Percentage of surviving infants who received the third dose of pneumococcal conjugate-containing vaccine (PCV)', 'IM_POL3': 'Percentage of surviving infants who received the third dose of inactivated polio-containing vaccine', 'IM_ROTAC': 'Percentage of surviving infants who received the last dose of rotavirus-containing vaccine (2nd or 3rd dose depending on vaccine used)', 'MG_INTNL_MG_CNTRY_DEST': 'International migrants, by country of destination', 'MG_RFGS_CNTRY_ASYLM': 'Refugees, by country of asylum', 'MG_RFGS_CNTRY_ASYLM_PER1000': 'Refugees by host country, per 1000 population', 'MG_RFGS_CNTRY_ASYLM_PER_USD_GNI': 'Refugees by host country, per 1 USD GNI per capita', 'MG_RFGS_CNTRY_ORIGIN': 'Refugees, by country of origin', 'MNCH_ABR': 'Adolescent birth rate (number of live births to adolescent women per 1,000 adolescent women)', 'MNCH_ADO_ALCOHOL': 'Percentage of adolescents (aged 15-19 years) who had at least one alcoholic drink at any time during the last 12 months', 'MNCH_ADO_INSUFF_PHYS': 'Insufficient physical activity among school going adolescents', 'MNCH_ADO_TOBACCO': 'Percentage of adolescents (aged 13-15 years) who smoked cigarettes or used smoked or smokeless tobacco products at any time during the last month', 'MNCH_ANC1': 'Antenatal care 1+ visit - percentage of women (aged 15-49 years) attended at least once during pregnancy by skilled health personnel', 'MNCH_ANC4': 'Antenatal care 4+ visits - percentage of women (aged 15-49 years) attended at least four times during pregnancy by any provider', 'MNCH_BIRTH18': 'Early childbearing - percentage of women (aged 20-24 years) who gave birth before age 18', 'MNCH_CSEC': 'C-section rate - percentage of deliveries by cesarean section', 'MNCH_DEMAND_FP': 'Demand for family planning satisfied with modern methods - percentage of women (aged 15-49 years)', 'MNCH_DIARCARE': 'Careseeking for diarrhoea - percentage of children (under age 5) with diarrhoea for whom advice or treatment was sought from a health facility or provider', 'MNCH_INSTDEL': 'Institutional deliveries - percentage of deliveries in a health facility', 'MNCH_ITN': 'ITN use by children - percentage of children (under age 5) who slept under an insecticide-treated mosquito net the night prior to the survey', 'MNCH_ITN2': 'Household with insecticide treated net (ITN) and/or indoor residual spraying (IRS) - percentage of households with at least one ITN for every two persons and/or IRS in the past 12 months', 'MNCH_ITNOWN': 'Percentage of households with at least one insecticide-treated mosquito net (ITN)', 'MNCH_ITNPREG': 'Pregnant women sleeping under ITN - percentage of pregnant women (aged 15-49 years) who slept under an insecticide-treated net the previous night', 'MNCH_LIFE_EXPECTANCY': 'Life expectancy at birth - number of years newborn female children would live if subject to the mortality risks prevailing for the cross section of population at the time of their birth (estimated)', 'MNCH_LTR_MATERNAL_DEATH': 'Lifetime risk of maternal death (probability (1 in X) that a 15-year-old girl (in the year of the estimate) will eventually die from a maternal cause)', 'MNCH_MATERNAL_DEATHS': 'Maternal deaths (estimated)', 'MNCH_MLRACT': 'Malaria, first line treatment - percentage of febrile children (under age 5) receiving ACT (first line antimalarial drug), among those receiving any antimalarial drugs', 'MNCH_MLRCARE': 'Careseeking for febrile children - percentage of children (under age 5) with fever for whom advice or treatment was sought from a health facility or provider', 'MNCH_MLRDIAG': 'Malaria diagnostics - percentage of febrile children (under age 5) who had a finger or heel stick for malaria testing', 'MNCH_MMR': 'Maternal mortality ratio (number of maternal deaths per 100,000 live births)', 'MNCH_ORS': 'Diarrhoea treatment - percentage of children (under age 5) with diarrhoea who received ORS (packets or pre-packaged fluids)', 'MNCH_ORSZINC': 'Diarrhoea treatment - percentage of children (under age 5) with diarrhoea who received ORS and zinc', 'MNCH_ORTCF': 'Diarrhoea treatment - percentage of children (under age 5) with diarrhoea who received ORT (oral rehydration salts or recommended homemade fluids or increased fluids) and continued feeding', 'MNCH_PNCMOM': 'Postnatal care for mothers - percentage of women (aged 15-49 years) who received postnatal care within 2 days of giving birth', 'MNCH_PNCNB': 'Postnatal care for newborns - percentage of newborns who have a postnatal contact with a health provider within 2 days of delivery', 'MNCH_PNEUCARE': 'Careseeking for ARI - percentage of children (under age 5) with acute respiratory infection symptoms whom advice or treatment was sought from a health facility or provider', 'MNCH_SAB': 'Skilled birth attendant - percentage of deliveries attended by skilled health personnel', 'MNCH_UHC': 'Coverage of essential health services', 'MNCH_UHC_RMNCH': 'Universal health coverage index for reproductive, maternal, newborn and child-health interventions', 'MNCH_ZINC': 'Diarrhoea treatment - percentage of children (under age 5) with diarrhoea who received zinc', 'NT_ANT_BAZ_AVG': 'Mean BMI-for-age', 'NT_ANT_BAZ_NE1': 'BMI-for-age <-1 SD', 'NT_ANT_BAZ_NE1_T_NE2': 'BMI-for-age <-1 SD and ≥ -2 SD, Survey Estimates', 'NT_ANT_BAZ_NE2': 'BMI-for-age <-2 SD', 'NT_ANT_BAZ_NE2_T_NE3': 'BMI-for-age <-2 SD and ≥ -3 SD, Survey Estimates', 'NT_ANT_BAZ_NE3': 'BMI-for-age <-3 SD', 'NT_ANT_BAZ_PO1': 'BMI-for-age >+1 SD', 'NT_ANT_BAZ_PO1_T_PO2': 'BMI-for-age >+1 SD and ≤+2 SD, Survey Estimates', 'NT_ANT_BAZ_PO2': 'BMI-for-age >+2 SD', 'NT_ANT_BAZ_PO2_T_PO3': 'BMI-for-age >+2 SD and ≤+3 SD, Survey Estimates', 'NT_ANT_BAZ_PO3': 'BMI-for-age >+3 SD', 'NT_ANT_BAZ_SD': 'BMI-for-age (Standard Deviation)', 'NT_ANT_COMB': 'Wasted, Overweight or Stunted', 'NT_ANT_FREE': 'No Wasting, Overweight, Stunting', 'NT_ANT_HAZWHZ_NE2_NE2': 'Height-for-age <-2SD & Weight-for-height <-2SD', 'NT_ANT_HAZWHZ_NE2_PO2': 'Height-for-age <-2SD & Weight-for-height >+2SD', 'NT_ANT_HAZWHZ_NE3_NE2': 'Height-for-age <-3SD & Weight-for-height <-2SD', 'NT_ANT_HAZWHZ_NE3_PO2': 'Height-for-age <-3SD & Weight-for-height >+2SD', 'NT_ANT_HAZ_AVG': 'Mean Height-for-age', 'NT_ANT_HAZ_NE1': 'Height-for-age <-1 SD', 'NT_ANT_HAZ_NE1_T_NE2': 'Height-for-age <-1 SD and ≥ -2 SD (Mild Stunting only), Survey Estimates', 'NT_ANT_HAZ_NE2': 'Height-for-age <-2 SD (stunting)', 'NT_ANT_HAZ_NE2_MOD': 'Height-for-age <-2 SD (stunting), Modeled Estimates', 'NT_ANT_HAZ_NE2_MOD_NUMTH': 'Height-for-age <-2 SD (Stunting) Modeled Estimates, Numbers Affected', 'NT_ANT_HAZ_NE2_ONLY': 'Height-for-age <-2SD but weight-for-height ≥-2SD and weight-for-height ≤2SD', 'NT_ANT_HAZ_NE2_T_NE3': 'Height-for-age <-2 SD and ≥ -3 SD (Moderate Stunting only), Survey Estimates', 'NT_ANT_HAZ_NE3': 'Height-for-age <-3 SD (Severe Stunting)', 'NT_ANT_HAZ_PO1': 'Height-for-age >+1 SD', 'NT_ANT_HAZ_PO1_T_PO2': 'Height-for-age >+1 SD and ≤+2 SD, Survey Estimates', 'NT_ANT_HAZ_PO2': 'Height-for-age >+2 SD', 'NT_ANT_HAZ_PO2_T_PO3': 'Height-for-age >+2 SD and ≤+3 SD, Survey Estimates', 'NT_ANT_HAZ_PO3': 'Height-for-age >+3 SD', 'NT_ANT_HAZ_SD': 'Height-for-age (Standard Deviation)', 'NT_ANT_WAZ_AVG': 'Weight-for-age (Mean)', 'NT_ANT_WAZ_NE1': 'Weight-for-age <-1 SD', 'NT_ANT_WAZ_NE1_T_NE2': 'Weight-for-age <-1 SD and ≥ -2 SD, Survey Estimates', 'NT_ANT_WAZ_NE2': 'Weight-for-age <-2 SD (Underweight)', 'NT_ANT_WAZ_NE2_T_NE3': 'Weight-for-age <-2 SD and ≥ -3 SD, Survey Estimates', 'NT_ANT_WAZ_NE3': 'Weight-for-age <-3 SD (Severe Underweight)', 'NT_ANT_WAZ_PO1': 'Weight-for-age >+1 SD', 'NT_ANT_WAZ_PO1_T_PO2': 'Weight-for-age >+1 SD and ≤+2 SD, Survey Estimates', 'NT_ANT_WAZ_PO2': 'Weight-for-age (>+2 SD)', 'NT_ANT_WAZ_PO2_T_PO3': 'Weight-for-age >+2 SD and ≤+3 SD, Survey Estimates', 'NT_ANT_WAZ_PO3': 'Weight-for-age (>+3 SD)', 'NT_ANT_WAZ_SD': 'Weight-for-age (Standard Deviation)', 'NT_ANT_WHZ_AVG': 'Mean Weight-for-height', 'NT_ANT_WHZ_NE1': 'Weight-for-height <-1 SD', 'NT_ANT_WHZ_NE1_T_NE2': 'Weight-for-height <-1 SD and ≥ -2 SD, Survey Estimates', 'NT_ANT_WHZ_NE2': 'Weight-for-height <-2 SD (wasting)', 'NT_ANT_WHZ_NE2_ONLY': 'Weight-for-height <-2SD but height-for-age ≥-2SD', 'NT_ANT_WHZ_NE2_T_NE3': 'Weight-for-height <-2 SD and ≥ -3 SD, Survey Estimates', 'NT_ANT_WHZ_NE3': 'Weight-for-height <-3 SD (severe wasting)', 'NT_ANT_WHZ_PO1': 'Weight-for-height >+1 SD', 'NT_ANT_WHZ_PO1_T_PO2': 'Weight-for-height >+1 SD and ≤+2 SD, Survey Estimates', 'NT_ANT_WHZ_PO2': 'Weight-for-height >+2 SD (overweight)', 'NT_ANT_WHZ_PO2_MOD': 'Weight-for-height >+2 SD (overweight), Modeled Estimates', 'NT_ANT_WHZ_PO2_MOD_NUMTH': 'Weight-for-height >+2 SD (Overweight) Modeled Estimates, Numbers Affected', 'NT_ANT_WHZ_PO2_ONLY': 'Weight-for-height >+2SD but height-for-age ≥-2SD', 'NT_ANT_WHZ_PO2_T_PO3': 'Weight-for-height >+2 SD and ≤+3 SD, Survey Estimates', 'NT_ANT_WHZ_PO3': 'Weight-for-height >+3 SD', 'NT_ANT_WHZ_SD': 'Weight-for-height (Standard Deviation)', 'NT_BF_CBF_12_15': 'Continued breastfeeding (12-15 months)', 'NT_BF_CBF_12_23': 'Continued breastfeeding (12-23 months)', 'NT_BF_CBF_20_23': 'Continued breastfeeding (20-23 months)', 'NT_BF_EBF': 'Ever breastfed (0-23 months)', 'NT_BF_EIBF': 'Early initiation of breastfeeding', 'NT_BF_EXBF': 'Exclusive breastfeeding (0-5 months)', 'NT_BF_EXBF_2D': 'Exclusively Breastfed for the First Two Days After Birth', 'NT_BF_MIXMF': 'Mixed Milk Feeding (0-5 months)', 'NT_BF_PRED_BF': 'Predominantly breastfeeding (children aged 0 to 5 months)', 'NT_BW_UNW': 'Percentage of births without a birth weight in the data source', 'NT_CF_ASF': 'Egg and/or flesh foods consumption (6-23months)', 'NT_CF_BREASTMILK': 'Food group- Breastmilk (6-23months)', 'NT_CF_DAIRY': 'Food group- Dairy (milk, infant formula, yogurt, cheese) (6-23months)', 'NT_CF_EGGS': 'Food group- Eggs (6-23months)', 'NT_CF_FF': 'Food group- Flesh foods (meat, poultry, fish and organ meats) (6-23months)', 'NT_CF_GRAINS': 'Food group- Grains, roots, tubers and plantains (6-23months)', 'NT_CF_ISSSF_FL': 'Introduction to solid, semi-solid foods (6-8 months)', 'NT_CF_LEGUMES': 'Food group- Pulses (beans, peas, lentils), nuts and seeds (6-23months)', 'NT_CF_MAD': 'Minimum acceptable diet (children aged 6-23 months)', 'NT_CF_MDD': 'Minimum diet diversity (children aged 6 to 23 months)', 'NT_CF_MMF': 'Minimum meal frequency (children aged 6 to 23 months)', 'NT_CF_OTHER_FV': 'Food group- Other fruits and vegetables (6-23months)', 'NT_CF_VITA': 'Food group- Vitamin-A rich fruits and vegetables (6-23months)', 'NT_CF_ZEROFV': 'Zero vegetable or fruit consumption (6-23months)', 'NT_IOD_ANY_TH': 'Iodized salt consumption (>0 ppm) among all tested households', 'NT_IOD_ANY_TS': 'Iodized salt consumption (>0 ppm) among all tested households with salt', 'NT_OVERWEIGHT': 'Overweight', 'NT_SANT_10_19_BAZ_NE2_MOD': 'Prevalence of thinness among children aged 10-19 years, BMI < -2 standard deviations below the median (Crude estimate)', 'NT_SANT_10_19_BAZ_PO1_MOD': 'Prevalence of overweight among children aged 10-19 years, BMI > +1 standard deviations above the median (Crude estimate)', 'NT_THINNESS': 'Thinness', 'NT_VAS_S1': 'VAS Semester 1 Coverage', 'NT_VAS_S2': 'VAS Semester 2 Coverage', 'NT_VAS_TWODOSE': 'Vitamin A two-dose coverage', 'PT_ADLS_10-14_LBR_HC': 'Percentage of adolescents (aged 10-14 years) engaged in household chores', 'PT_ADLT_PS_NEC': 'Percentage of adults who think that physical punishment is necessary to raise/educate children', 'PT_CHLD_1-14_PS-PSY-V_CGVR': 'Percentage of children (aged 1-14 years) who experienced any physical punishment and/or psychological aggression by caregivers', 'PT_CHLD_5-17_LBR_ECON': 'Percentage of children (aged 5-17 years) engaged in child labour (economic activities)', 'PT_CHLD_5-17_LBR_ECON-HC': 'Percentage of children (aged 5-17 years) engaged in child labour (economic activities and household chores)', 'PT_CHLD_LBR_THRSLD_ECON': 'Child labour thresholds (economic activity)', 'PT_CHLD_LBR_THRSLD_HC': 'Child labour thresholds (household chores)', 'PT_CHLD_LBR_TIME_ECON': 'Time spent in economic activities', 'PT_CHLD_LBR_TIME_HC': 'Time spent in household chores', 'PT_CHLD_Y0T4_REG': 'Percentage of children under age 5 whose births are registered', 'PT_F_15-17_SX-V': 'Percentage of girls (aged 15-17 years) who have experienced sexual violence', 'PT_F_15-19_MRD': 'Percentage of girls aged 15-19 years who are currently married or in union', 'PT_F_15-49_W-BTNG': 'Percentage of women (aged 15-49 years) who consider a husband to be justified in hitting or beating his wife for at least one of the specified reasons', 'PT_F_18-29_SX-V_AGE-18': 'Percentage of women (aged 18-29 years) who experienced sexual violence by age 18', 'PT_F_20-24_MRD_U15': 'Percentage of women (aged 20-24 years) married or in union before age 15', 'PT_F_20-24_MRD_U18': 'Percentage of women (aged 20-24 years) married or in union before age 18', 'PT_F_GE15_PS-SX-EM_V_PTNR_12MNTH': 'Percentage of ever-partnered women and girls (aged 15 years and older) subjected to physical, sexual or psychological violence by a current or former intimate partner in the previous 12 months', 'PT_M_15-19_MRD': 'Percentage of boys aged 15-19 years who are currently married or in union', 'PT_M_20-24_MRD_U18': 'Percentage of men (aged 20-24 years) married or in union before age 18', 'PT_ST_13-15_BUL_30-DYS': 'Percentage of students (aged 13-15 years) who reported being bullied on 1 or more days in the past 30 days', 'PV_CHLD_INCM-PL': 'Children living in households with income below the national poverty line (as a % of all children)', 'SPP_CHLD_SOC_PROT': 'Proportion of children covered by social protection', 'SPP_GDPPC': 'GDP per capita (current US$)', 'SPP_GINI': 'Gini Coefficient', 'SPP_MOTHERS_CASH_BNF': 'Mothers with newborns receiving cash benefit (%)', 'WS_PPL_H-B': 'Proportion of population with a handwashing facility with soap and water available at home', 'WS_PPL_H-L': 'Proportion of population with a limited handwashing facility', 'WS_PPL_H-N': 'Proportion of population with no handwashing facility at home', 'WS_PPL_S-ALB': 'Proportion of population using at least basic sanitation services', 'WS_PPL_S-I': 'Proportion of population using improved sanitation facilities', 'WS_PPL_S-L': 'Proportion of population using limited sanitation services', 'WS_PPL_S-LAT': 'Proportion of population using improved latrines and other improved facilities', 'WS_PPL_S-OD': 'Proportion of population practising open defecation', 'WS_PPL_S-SEP': 'Proportion of population using sanitation facilities connected to septic tanks', 'WS_PPL_S-SEW': 'Proportion of population using sanitation facilities connected to sewer networks', 'WS_PPL_S-UI': 'Proportion of population using unimproved sanitation facilites', 'WS_PPL_W-ALB': 'Proportion of population using at least basic drinking water services', 'WS_PPL_W-B': 'Proportion of population using basic drinking water services', 'WS_PPL_W-I': 'Proportion of population using improved drinking water sources', 'WS_PPL_W-L': 'Proportion of population using limited drinking water services', 'WS_PPL_W-NP': 'Proportion of population using non-piped improved drinking water sources', 'WS_PPL_W-P': 'Proportion of population using piped drinking water sources', 'WS_PPL_W-PRE': 'Proportion of population using improved drinking water sources located on premises', 'WS_PPL_W-QUA': 'Proportion of population using of improved drinking water sources free from faecal and priority chemical contamination', 'WS_PPL_W-SM': 'Proportion of population using safely managed drinking water services', 'WS_PPL_W-SW': 'Proportion of population using surface water', 'WS_PPL_W-UI': 'Proportion of population using unimproved drinking water sources', 'WS_SCH_H-B': 'Proportion of schools with basic hygiene services', 'WS_SCH_S-B': 'Proportion of schools with basic sanitation services', 'WS_SCH_S-L': 'Proportion of schools with limited sanitation services', 'WS_SCH_S-N': 'Proportion of schools with no sanitation service', 'WS_SCH_W-B': 'Proportion of schools with basic drinking water services', 'WS_SCH_W-L': 'Proportion of schools with limited drinking water services', 'WS_SCH_W-N': 'Proportion of schools with no drinking water service', 'WT_ADLS_15-19_ED_NEET': 'Percentage of adolescents (aged 15-19 years) not in education, employment or training', 'WT_ADLS_15-19_LAB_FRC_UNEMP': 'Percentage of adolescents (aged 15-19 years) in the labour force who are unemployed', 'IM_RCV1': 'Percentage of surviving infants who received the first dose of rubella-containing vaccine', 'IM_YFV': 'Percentage of surviving infants who received yellow fever- containing vaccine (for countries at risk and where the vaccine is in the national schedule)', 'MNCH_IPTP': 'IPTp for pregnant women - percentage of women (aged 15-49 years) who received three or more doses of intermittent preventive treatment during antenatal care visits during their last pregnancy', 'NT_BW_LBW_MOD': 'Number (in thousands) of live births that weighed less than 2500 g (Modeled Estimates)', 'NT_BW_LBW_MOD_NUMTH': 'Number (in thousands) of live births that weighed less than 2500 g (Modeled Estimates)', 'WS_HCF_H-B': 'Proportion of health care facilities with basic hygiene services', 'WS_HCF_H-L': 'Proportion of health care facilities with limited hygiene services', 'WS_HCF_H-N': 'Proportion of health care facilities with no hygiene service', 'WS_HCF_S-B': 'Proportion of health care facilities with basic sanitation services', 'WS_HCF_S-L': 'Proportion of health care facilities with limited sanitation services', 'WS_HCF_S-N': 'Proportion of health care facilities with no sanitation service', 'WS_HCF_W-B': 'Proportion of health care facilities with basic water services', 'WS_HCF_W-L': 'Proportion of health care facilities with limited water services', 'WS_HCF_W-N': 'Proportion of health care facilities with no water service', 'WS_HCF_WM-B': 'Proportion of health care facilities with basic health care waste management services', 'WS_HCF_WM-L': 'Proportion of health care facilities with limited health care waste management services', 'WS_HCF_WM-N': 'Proportion of health care facilities with no health care waste management service', 'WS_PPL_S-B': 'Proportion of population using basic sanitation services', 'WS_PPL_S-DIS': 'Proportion of population using on-site sanitation facilities with human waste disposed in situ', 'WS_PPL_S-SM': 'Proportion of population using safely managed sanitation services', 'WS_PPL_S-WWT': 'Proportion of population using sanitation facilities connected to sewer networks and with sewage treated to at least secondary levels', 'WS_PPL_W-AVA': 'Proportion of population using improved drinking water sources available when needed', 'WS_SCH_H-L': 'Proportion of schools with limited hygiene services', 'WS_SCH_H-N': 'Proportion of schools with no hygiene service', 'ECON_GVT_EXP_PTGDP': 'government expenditure (% GDP)', 'ED_MAT_L1': 'Proportion of students at the end of primary achieving at least a minimum proficiency level in mathematics', 'ED_MAT_L2': 'Proportion of students at the end of lower secondary achieving at least a minimum proficiency level in mathematics', 'ED_READ_L2': 'Proportion of students at the end of lower secondary achieving at least a minimum proficiency level in reading', 'ED_ROFST_L02_ADM': 'Out-of-school rate for children one year younger than official entry age (administrative data)', 'ED_ROFST_L1_ADM': 'Out-of-school rate for children of primary school age (administrative data)', 'ED_ROFST_L2_ADM': 'Out-of-school rate for adolescents of lower secondary school age (administrative data)', 'GN_SG_LGL_GENEQEMP': 'Legal frameworks that promote, enforce and monitor gender equality in employment and economic benefits', 'NT_BW_LBW': 'Prevalence of low birth weight among new-borns', 'PV_CHLD_DPRV-AVG-HS': 'Average number of deprivations suffered per child. Homogeneous moderate standards', 'PV_CHLD_DPRV-AVG-POV-HS': 'Average number of deprivations for children suffering at least one deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-AVG-POV-S-HS': 'Average number of deprivations for children suffering at least one deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-AVG-S-HS': 'Average number of deprivations suffered per child. Homogeneous severe standards', 'PV_CHLD_DPRV-E1-HS': 'Percentage Children suffering exactly one deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-E2-HS': 'Percentage Children suffering exactly two deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-E3-HS': 'Percentage Children suffering exactly three deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-E4-HS': 'Percentage Children suffering exactly four deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-E5-HS': 'Percentage Children suffering exactly five deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-L1-HS': 'Percentage children suffering at least one deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-L2-HS': 'Percentage children suffering at least two deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-L3-HS': 'Percentage children suffering at least three deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-L4-HS': 'Percentage children suffering at least four deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-L5-HS': 'Percentage children suffering at least five deprivation. Homogeneous moderate standards', 'PV_CHLD_DPRV-S-E1-HS': 'Percentage Children suffering exactly one deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-E2-HS': 'Percentage Children suffering exactly two deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-E3-HS': 'Percentage Children suffering exactly three deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-E4-HS': 'Percentage Children suffering exactly four deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-E5-HS': 'Percentage Children suffering exactly five deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-L1-HS': 'Percentage children suffering at least one deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-L2-HS': 'Percentage children suffering at least two deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-L3-HS': 'Percentage children suffering at least three deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-L4-HS': 'Percentage children suffering at least four deprivation. Homogeneous severe standards', 'PV_CHLD_DPRV-S-L5-HS': 'Percentage children suffering at least five deprivation. Homogeneous severe standards', 'PV_VMIR': 'Vast Majority Income Ratio', 'SPP_PALMA': 'Palma Index of income inequality', 'SPP_VMI': 'VMI (vast majority index of income inequality)', 'WS_PPL_S-FST': 'Proportion of population using of on-site sanitation facilities with human waste treated off-site', 'ECD_CHLD_36-59M_LMPSL': 'Percentage of children (aged 36-59 months) developmentally on track in at least 3 of the 4 following domains', 'GN_IT_MOB_OWN': 'Proportion of individuals who own a mobile telephone', 'HVA_PREV_STIGMA': 'Per cent of people (aged 15-49 years) expressing discriminatory attitudes towards people living with HIV', 'PV_LEVEL': 'Poverty Level', 'GN_ED_ATTN': 'Educational attainment of the population (aged 25 years and older)', 'IM_HPV': 'Percentage of females who received the last dose of human papillomavirus (HPV) vaccine per national schedule', 'PT_F_15-17_SX-V_HLP': 'Percentage of girls (aged 15-17 years) who have ever experienced any sexual violence and sought help from a professional', 'PT_F_GE15_SX_V_PTNR_12MNTH': 'Women and girls aged 15 and older subjected to sexual violence by persons other than an intimate partner in the previous 12 months', 'ECON_ODA_OUTFLOW_PTGNI': 'ODA outflow (%GNI)', 'ECON_ODA_OUTFLOW_USD': 'ODA outflow (USD)', 'ED_MAT_G23': 'Proportion of students in Grade 2 or 3 achieving at least a minimum proficiency level in mathematics', 'ED_READ_G23': 'Proportion of students in Grade 2 or 3 achieving at least a minimum proficiency level in reading', 'ED_READ_L1': 'Proportion of students at the end of primary achieving at least a minimum proficiency level in reading', 'PT_F_0-14_FGM': 'Percentage of girls (aged 0-14 years) who have undergone female genital mutilation (FGM)', 'PT_F_15-49_FGM': 'Percentage of girls and women (aged 15-49 years) who have undergone female genital mutilation (FGM)', 'PT_F_15-49_FGM_ELIM': 'Percentage of women (aged 15-49 years) who think that FGM should be eliminated', 'PT_M_15-49_FGM_ELIM': 'Percentage of boys and men (aged 15-49 years) who think that FGM should be eliminated', 'WS_HCF_C-B': 'Proportion of health care facilities with basic cleaning services', 'WS_HCF_C-L': 'Proportion of health care facilities with limited cleaning services', 'WS_HCF_C-N': 'Proportion of health care facilities with no cleaning service', 'PT_M_15-17_SX-V': 'Percentage of boys (aged 15-17 years) who have experienced sexual violence', 'PT_M_18-29_SX-V_AGE-18': 'Percentage of men (aged 18-29 years) who experienced sexual violence by age 18', 'HVA_PREV_CNDM_REG': 'Per cent of young people (aged 15-24 years) who had sex with a non-marital, non-cohabitating partner in the past 12 months reporting the use of a condom during their last sexual intercourse', 'ECD_CHLD_24-59M_ADLT_SRC': 'Percentage of children (aged 24-59 months) with whom any adult household member has engaged in 4 or more activities to provide early stimulation and responsive care in the last 3 days', 'ECD_CHLD_24-59M_FHR-SPT-LNG': 'Percentage of children (aged 24-59 months) whose father has engaged in 4 or more activities to provide early stimulation and responsive care in the last 3 days', 'ECD_CHLD_U5_BKS-HM': "Percentage of children under age 5 who have 3 or more children's books", 'ECD_CHLD_U5_LFT-ALN': 'Percentage of children under age 5 left alone or under the supervision of another child younger than 10 years of age for more than 1 hour at least once in the last week', 'ECD_CHLD_U5_PLYTH-HM': 'Percentage of children under age 5 who play with 2 or more types of playthings'}
 
-    AGE_dict = {'_T': 'Total', 'M36T59': '36 to 59 months old', 'Y_GE15': '15 years old and over', 'Y0': 'Under 1 year old', 'Y15T24': '15 to 24 years old', 'M12T23': '12 to 23 months old', 'Y0T17': 'Under 18 years old', 'Y15T19': '15 to 19 years old', 'Y11T17': '11 to 17 years old', 'Y13T15': '13 to 15 years', 'Y15T49': '15 to 49 years old', 'Y20T24': '20 to 24 years old', 'Y0T4': 'Under 5 years old', 'M12T15': '12 to 15 months old', 'M20T23': '20 to 23 months old', 'M0T23': 'Under 24 months old', 'M0T5': 'Under 6 months old', 'M6T23': '6 to 23 months old', 'Y10T19': '10 to 19 years old', 'M6T59': '6 to 59 months old', 'Y10T14': '10 to 14 years old', 'Y1T14': '1 to 14 years old', 'Y5T17': '5 to 17 years old', 'Y15T17': '15 to 17 years old', 'Y18T29': '18 to 29 years old', 'Y_GE25': '25 years old and over', 'Y0T14': 'Under 15 years old', 'M24T59': '24 to 59 months old', 'M0T47': 'Under 48 months old'}
+DICTIONARIES = {
+    'REF_AREA': REF_AREA_dict,
+    'SEX': SEX_dict,
+    'UNIT_MULTIPLIER': UNIT_MULTIPLIER_dict,
+    'UNIT_MEASURE': UNIT_MEASURE_dict,
+    'TIME_PERIOD_METHOD': TIME_PERIOD_METHOD_dict,
+    'OBS_STATUS': OBS_STATUS_dict,
+    'OBS_CONF': OBS_CONF_dict,
+    'INDICATOR': INDICATOR_dict,
+    'AGE': AGE_dict,
+}
 
-    if col == 'REF_AREA':
-        dic = REF_AREA_dict
-    elif col == 'SEX':
-        dic = SEX_dict
-    elif col == 'UNIT_MULTIPLIER':
-        dic = UNIT_MULTIPLIER_dict
-    elif col == 'UNIT_MEASURE':
-        dic = UNIT_MEASURE_dict
-    elif col == 'TIME_PERIOD_METHOD':
-        dic = TIME_PERIOD_METHOD_dict
-    elif col == 'OBS_STATUS':
-        dic = OBS_STATUS_dict
-    elif col == 'OBS_CONF':
-        dic = OBS_CONF_dict
-    elif col == 'INDICATOR':
-        dic = INDICATOR_dict
-    elif col == 'AGE':
-        dic = AGE_dict
-        
-    return dic
+
+def get_dictionary(col):
+    return MappingProxyType(DICTIONARIES[col])
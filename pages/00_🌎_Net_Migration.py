@@ -1,28 +1,24 @@
-import datetime
-import os
 import sys
-import time
 import math
-import pathlib
-import requests
-import zipfile
-import pandas as pd
-import pydeck as pdk
-import geopandas as gpd
 import streamlit as st
-import leafmap.colormaps as cm
 # import streamlit_toggle as tog
-from leafmap.common import hex_to_rgb
-from pydeck.types import String
 
 sys.path.append("..")
-from data.dictionary import get_dictionary
-INDICATOR_dict = get_dictionary('INDICATOR')
-REF_AREA_dict = get_dictionary('REF_AREA')
-
-# load the world dataset
-world = gpd.read_file(gpd.datasets.get_path("naturalearth_lowres"))
-cities = gpd.read_file(gpd.datasets.get_path('naturalearth_cities'))
+from src.utils.resources import lazy_module
+from src.utils.streamlit_gui import dimension_selectors, finish_timing, search_indicators
+from src.utils.timing import Timer
+from src.utils.loader import warm_up_with_notification
+from src.utils.datasets import dataset_path, indicators, table, view
+from src.utils.dimensions import decode, dimension
+from src.utils.classify import SCHEMES, apply_colors
+from src.utils.geometry import DEFAULT_PRECISION, select_lod
+from src.utils.artifacts import cached_artifact, data_version
+from src.utils.pipelines import MAP_GROUPS, NMR_INDICATOR, choropleth_records, indicator_points
+from src.utils.timeline import YEARS, choropleth_timeline, points_timeline, publish, year_index
+
+# Heavy libraries are imported on first use
+pdk = lazy_module("pydeck")
+cm = lazy_module("leafmap.colormaps")
 
 
 # Begin Streamlit
@@ -33,8 +29,14 @@ if 'sidebar_state' not in st.session_state:
 # Streamlit set_page_config method has a 'initial_sidebar_state' argument that controls sidebar state.
 st.set_page_config(initial_sidebar_state=st.session_state.sidebar_state, layout="wide")
 
+timer = Timer("Net Migration")
+
+# Load every dataset in parallel on the first visit to this server process.
+with timer.span("warm_up"):
+    warm_up_with_notification()
+
 # Show title and description of the app.
-st.title("Net Migration Rate 2021")
+st.title("Net Migration Rate")
 st.sidebar.write("""
 **Sidebar**
 
@@ -48,144 +50,36 @@ Use the checkbox to preview data before map rendering.
 #     "Fetch data from github?",
 #     ('No', 'Yes'))
 
-# if fetch_from_cloud == 'Yes':
-#     link_prefix = "data/"
-# else:
-link_prefix = "data/"
-
-data_links = {
-    "reference": {
-        "countries": link_prefix + "umr_eda_NMR.csv", # <== Net Migration
-        "countries_hires": link_prefix + "umr_eda_NMR.csv", # <== Net Migration
-    },
-    "indicator": {
-        "DM_": link_prefix + "umr_data_DM_.csv",
-        # "ECON_": link_prefix + "umr_data_ECON_.csv",
-        "MG_": link_prefix + "umr_data_MG_.csv",
-        "MNCH_": link_prefix + "umr_data_MNCH_.csv",
-        "PT_": link_prefix + "umr_data_PT_.csv",
-        "PV_": link_prefix + "umr_data_PV_.csv",
-        "WS_": link_prefix + "umr_data_WS_.csv",
-    },
-}
-
 def get_data_columns(df, category="world", frequency="annual"):
     cols = df.columns.values.tolist()
     return cols[1:]
 
 @st.cache_data
-def get_reference_data(url):
-    df = pd.read_csv(url)
-    df.drop(columns=["Unnamed: 0", "AGE"], inplace=True)
-    df = df[df.TIME_PERIOD==2021]
-    return df
+def get_choropleth(category, year, lod, url, precision):
+    key = (category, year, lod, url, precision)
+    return cached_artifact("choropleth_records", key, lambda: choropleth_records(*key))
+
 
 @st.cache_data
-def get_indicator_data(url):
-    df = pd.read_csv(url)
-    df.drop(columns=["Unnamed: 0"], inplace=True)
-    df = df[df.TIME_PERIOD==2021]
-    df.replace({"INDICATOR": INDICATOR_dict}, inplace=True)
+def get_points(category, group, indicator, year, url, age=None, sex=None):
+    key = (category, group, indicator, year, url, age, sex)
+    return cached_artifact("points", key, lambda: indicator_points(*key))
+
 
-    return df
+@st.cache_data
+def get_choropleth_timeline(category, lod, url, colors, scheme, version):
+    # Every year in one static file; the year slider only changes the accessors.
+    # version keys the cache too, so a data change never hands out a pruned URL.
+    collection, edges = choropleth_timeline(category, lod, url, list(colors), scheme)
+    url, size = publish(collection, "choropleth", (category, lod, url, colors, scheme), version)
+    return url, size, edges
 
 
 @st.cache_data
-def get_geom_data(category):
-    prefix = (
-        "https://raw.githubusercontent.com/harry-oestreicher/gis-data/main/"
-    )
-    links = {
-        "continents": prefix + "world/continents.geojson",
-        "countries": prefix + "world/countries.json",
-        "countries_hires": prefix + "world/countries_hires.geojson",
-        "world_cities_5000": prefix + "world/cities5000.csv",
-        "world_cities": prefix + "world/world_cities.geojson",
-        "us": prefix + "us/us_nation.geojson",
-        "state": prefix + "us/us_states.geojson",
-        "county": prefix + "us/us_counties.geojson",
-        "metro": prefix + "us/us_metro_areas.geojson",
-    }
+def get_points_timeline(category, group, indicator, url, version, age=None, sex=None):
+    points = points_timeline(category, group, indicator, url, AGE=age, SEX=sex)
+    return publish(points, "points", (category, group, indicator, url, age, sex), version)[0]
 
-    gdf = gpd.read_file(links[category])
-
-    return gdf
-
-
-def join_attributes(gdf, df, category):
-    new_gdf = None
-    if category == "county":
-        new_gdf = gdf.merge(df, left_on="GEOID", right_on="county_fips", how="outer")
-    elif category == "state":
-        new_gdf = gdf.merge(df, left_on="STUSPS", right_on="STUSPS", how="outer")
-    elif category == "us":
-        if "geo_country" in df.columns.values.tolist():
-            df["country"] = None
-            df.loc[0, "country"] = "United States"
-        new_gdf = gdf.merge(df, left_on="NAME", right_on="country", how="outer")
-    elif category == "countries":
-        new_gdf = gdf.merge(df, left_on="id", right_on="REF_AREA", how="outer")
-    elif category == "countries_hires":
-        new_gdf = gdf.merge(df, left_on="ISO_A3", right_on="REF_AREA", how="outer")
-        new_gdf.rename(columns={'ISO_A3': 'id'}, inplace=True)
-
-    # new_gdf['INDICATOR'] = 'Net Migration Rate'
-
-    new_gdf = new_gdf[~new_gdf["id"].isna()]
-    new_gdf = new_gdf.drop(columns=["REF_AREA"])
-    return new_gdf
-
-
-def join_indicator(gdf, df, indicator):
-    new_gdf = None
-    if indicator == "DM_":
-        new_gdf = gdf.merge(df, left_on=["id"], right_on=["REF_AREA"], how="outer")
-    elif indicator == "ECON_":
-        new_gdf = gdf.merge(df, left_on=["id"], right_on=["REF_AREA"], how="outer")
-    elif indicator == "MG_":
-        new_gdf = gdf.merge(df, left_on=["id"], right_on=["REF_AREA"], how="outer")
-        new_gdf["OBS_VALUE"] = new_gdf["OBS_VALUE"].astype(float)
-    elif indicator == "MNCH_":
-        new_gdf = gdf.merge(df, left_on=["id"], right_on=["REF_AREA"], how="outer")
-    elif indicator == "PT_":
-        new_gdf = gdf.merge(df, left_on=["id"], right_on=["REF_AREA"], how="outer")
-    elif indicator == "WS_":
-        new_gdf = gdf.merge(df, left_on=["id"], right_on=["REF_AREA"], how="outer")
-        new_gdf = new_gdf[~new_gdf["id"].isna()]
-    new_gdf = new_gdf[~new_gdf["geometry"].isna()]
-    return new_gdf
-
-
-def select_non_null(gdf, col_name):
-    new_gdf = gdf[~gdf[col_name].isna()]
-    return new_gdf
-
-
-def select_null(gdf, col_name):
-    new_gdf = gdf[gdf[col_name].isna()]
-    return new_gdf
-
-
-def get_indicator_dict(name):
-    in_csv = os.path.join(os.getcwd(), "data/umr_data_dict_INDICATOR.csv")
-    df = pd.read_csv(in_csv)
-    value = df[df.key==name]["value"].values[0]
-    return value
-
-
-def enumerate_column(col_in):
-    if col_in == "REF_AREA":
-        REF_AREA = REF_AREA_dict
-        val = REF_AREA.get(col_in)
-
-    elif col_in == "INDICATOR":
-        INDICATOR = INDICATOR_dict
-        val = INDICATOR.get(col_in)
-    return val
-
-def get_indicators(df):
-    indicator_list = df["INDICATOR"].unique()
-    return indicator_list
 
 def app():
     st.write(
@@ -199,14 +93,7 @@ def app():
     )
 
     # Associate these group labels with file prefixes:
-    indicator_group_dict = {
-            "Demographic": "DM_",
-            # "Economic": "ECON_",
-            "Migratory": "MG_",
-            # "Maternal, Newborn, and Child Health": "MNCH_",
-            # "Post-Trauma": "PT_",
-            "Water Services": "WS_"
-    }
+    indicator_group_dict = MAP_GROUPS
 
     org_dict = {
         "UNSDG": "United Nations Sustainable Development Group",
@@ -242,36 +129,44 @@ def app():
     frequency = "annual"
     scale = "countries"
     selected_year = 2021
+    map_zoom = 2
+    map_height = 900
+    map_precision = DEFAULT_PRECISION
 
     row1_col1, row1_col2  = st.columns(
         [4, 6]
     )
 
     with row1_col1:
-        indicator_group_selected = st.selectbox("**Indictator Group**", ["Demographic", "Migratory", "Water Services"])
+        indicator_group_selected = st.selectbox("**Indictator Group**", list(indicator_group_dict))
         indicator_group = indicator_group_dict[indicator_group_selected]
-        
-    # Get geometry data
-    gdf = get_geom_data(scale.lower())
-
-    # Get Net Migration Data
-    inventory_df = get_reference_data(data_links["reference"][scale.lower()])
+        map_mode = st.radio("**Map mode:**", ("Single year", "Time series"), horizontal=True)
+        time_series = map_mode == "Time series"
+        if time_series:
+            selected_year = st.select_slider("**Year:**", list(YEARS), value=selected_year)
+            year_min, year_max = YEARS[0], YEARS[-1]
+        else:
+            year_min, year_max = selected_year, selected_year
 
-    # Filter by selected year
-    inventory_df = inventory_df[inventory_df.TIME_PERIOD==selected_year]
+    # Get Net Migration Data of the selected year
+    with timer.span("load"):
+        inventory_df = view(dataset_path("NMR"), year_min=selected_year, year_max=selected_year,
+                            columns=["REF_AREA", "TIME_PERIOD", "INDICATOR", "OBS_VALUE"])
 
     # Calculate columns
     data_cols = get_data_columns(inventory_df, scale.lower(), frequency.lower())
 
-    # Get Indicator Group data
-    indicator_df = get_indicator_data(data_links["indicator"][indicator_group])
-    indicator_df = indicator_df[indicator_df.INDICATOR!="Net migration rate (per 1,000 population)"]
-    indicator_df = indicator_df[indicator_df.TIME_PERIOD==selected_year]
+    # Indicator Group data
+    indicator_path = dataset_path(indicator_group)
 
     with row1_col2:
         selected_col = "OBS_VALUE" #st.selectbox("Attribute", data_cols, 4)
-        this_ind_list = indicator_df["INDICATOR"].unique().tolist()
-        this_indicator = st.selectbox(f"**{indicator_group_selected} Indicators**", this_ind_list)
+        this_ind_list = [c for c in indicators(indicator_path, year_min, year_max) if c != NMR_INDICATOR]
+        this_ind_list = search_indicators(this_ind_list)
+        this_indicator = st.selectbox(f"**{indicator_group_selected} Indicators**", this_ind_list, format_func=dimension('INDICATOR').label)
+        this_indicator_label = dimension('INDICATOR').label(this_indicator)
+        # One AGE/SEX slice, so each country gets one point
+        codes = dimension_selectors(table(indicator_path), this_indicator)
 
 
     show_tables = "no"
@@ -282,13 +177,13 @@ def app():
     if show_tables:
         with row1a_col1:
             st.write("#### DM_NET_MG_RATE Layer")
-            st.write(inventory_df)
+            st.write(decode(inventory_df))
 
         with row1a_col2:
             indicator_data_cols = get_data_columns(inventory_df, scale.lower(), frequency.lower())
-            indicator_df = indicator_df[indicator_df.INDICATOR==this_indicator]
-            st.write(f"#### {this_indicator} Layer")
-            st.write(indicator_df)
+            indicator_df = table(indicator_path).select(this_indicator, selected_year, selected_year, **codes)
+            st.write(f"#### {this_indicator_label} Layer")
+            st.write(decode(indicator_df))
 
 
     row2_col1, row2_col2, row2_col3, row2_col4 = st.columns(
@@ -303,6 +198,7 @@ def app():
 
     with row2_col2:
         n_colors = st.slider("Number of colors", min_value=2, max_value=10, value=3)
+        scheme = SCHEMES[st.selectbox("Classification", list(SCHEMES))]
         show_3d = st.checkbox("Show 3D view", value=False)
         if show_3d:
             elev_scale = st.slider(
@@ -321,68 +217,77 @@ def app():
 
     with row2_col4:
         show_chloro = st.checkbox("Show **Net Migration** Choropleth", value=True)
-        show_nodata = st.checkbox("Show nodata", value=False)
+        show_nodata = st.checkbox("Show nodata", value=False, disabled=time_series)
         show_labels = st.checkbox("Show Heatmap", value=False)
         # heat_scale = st.slider("Heat scale:", min_value=1, max_value=20, value=4)
 
-    gdf = join_attributes(gdf, inventory_df, scale.lower())
-    gdf_null = select_null(gdf, selected_col)
-    gdf = select_non_null(gdf, selected_col)
-    gdf.replace({"INDICATOR": INDICATOR_dict}, inplace=True)
-
-    gdf = gdf.sort_values(by=selected_col, ascending=True)
-
-    gdf2 = get_geom_data(scale.lower())
-    gdf2 = join_indicator(gdf2, indicator_df, indicator_group)
-
-    # Create centroids projection on flat projection, then back
-    gdf2["centroids"] = gdf2.to_crs("+proj=cea").centroid.to_crs(gdf2.crs)
-    gdf2.drop(columns=["geometry"], inplace=True)
-    gdf2["long"] = round(gdf2.centroids.map(lambda p: p.x),5)
-    gdf2["lat"] = round(gdf2.centroids.map(lambda p: p.y),5)
-    gdf2 = gdf2.set_geometry("centroids")
-
-    gdf2.drop(columns=["REF_AREA"], inplace=True)
-    gdf2 = gdf2[["id", "name", "centroids", "TIME_PERIOD", "INDICATOR", "OBS_VALUE", "long", "lat"]]
-
-    gdf2_null = select_null(gdf2, selected_col)
-    gdf2 = select_non_null(gdf2, selected_col)
-    gdf2 = gdf2.sort_values(by=selected_col, ascending=True)
-    gdf2 = gdf2[gdf2.INDICATOR==this_indicator]
-    gdf2.replace({"INDICATOR": INDICATOR_dict}, inplace=True)
- 
     geo_colors_1 = cm.get_palette(palette1, n_colors)
     geo_colors_2 = cm.get_palette(palette2, n_colors)
 
-    def gen_colors(gdf, colors):
-        colors = [hex_to_rgb(c) for c in colors]
-
-        for i, ind in enumerate(gdf.index):
-            index = int(i / (len(gdf) / len(colors)))
-            if index >= len(colors):
-                index = len(colors) - 1
-            gdf.loc[ind, "R"] = colors[index][0]
-            gdf.loc[ind, "G"] = colors[index][1]
-            gdf.loc[ind, "B"] = colors[index][2]
-            pass
-
-        min_value = gdf[selected_col].min()
-        max_value = gdf[selected_col].max()
-
-        return gdf, min_value, max_value, colors
-
-    geo_layer_1, min1, max1, colors1 = gen_colors(gdf, geo_colors_1)
-    geo_layer_2, min2, max2, colors2 = gen_colors(gdf2, geo_colors_2)
-    color_exp = f"[R, G, B]"
+    if time_series:
+        # Geometry and every year's colors, elevations and radii are fetched once
+        # from static files; the year only picks the array entry in the accessors
+        with timer.span("timeline"):
+            version = data_version()
+            geo_layer_1, timeline_bytes, edges1 = get_choropleth_timeline(
+                scale.lower(), select_lod(map_zoom, map_height), dataset_path("NMR"), tuple(geo_colors_1), scheme, version)
+            geo_layer_2 = get_points_timeline(scale.lower(), indicator_group, this_indicator, indicator_path, version,
+                                              codes.get("AGE"), codes.get("SEX"))
+        min1, max1 = edges1[0], edges1[-1]
+        st.sidebar.caption(f"Choropleth: {timeline_bytes / 1024:,.0f} KB for {len(YEARS)} years, loaded once")
+        i = year_index(selected_year)
+        color_exp = f"properties.fill[{i}]"
+        elevation_exp = f"properties.nmr[{i}]"
+        radius_exp = f"radius[{i}]"
+        point_fill_exp = f"value[{i}] != null ? [0, 240, 50] : [0, 0, 0, 0]"
+        point_line_exp = f"value[{i}] != null ? [0, 0, 0] : [0, 0, 0, 0]"
+        weight_exp = f"value[{i}] > 0 ? value[{i}] : 0"
+        value_field = f"value_{selected_year}"
+        radius_scale = 100 * ind_scale
+    else:
+        # NMR choropleth on geometry simplified to what the initial map view can show,
+        # compacted to rounded coordinates and the properties the layers and tooltip use
+        with timer.span("choropleth"):
+            gdf, gdf_null, payload_sizes = get_choropleth(
+                scale.lower(), selected_year, select_lod(map_zoom, map_height), dataset_path("NMR"), map_precision)
+        st.sidebar.caption(f"Choropleth payload: {payload_sizes[0] / 1024:,.0f} KB → {payload_sizes[1] / 1024:,.0f} KB")
+
+        # Indicator values joined onto the precomputed centroid long/lat
+        with timer.span("points"):
+            gdf2 = get_points(scale.lower(), indicator_group, this_indicator, selected_year, indicator_path,
+                              codes.get("AGE"), codes.get("SEX"))
+
+        def gen_colors(gdf, colors):
+            gdf, edges = apply_colors(gdf, selected_col, colors, scheme)
+            return gdf, edges[0], edges[-1], edges
+
+        with timer.span("gen_colors"):
+            geo_layer_1, min1, max1, edges1 = gen_colors(gdf, geo_colors_1)
+            geo_layer_2, min2, max2, edges2 = gen_colors(gdf2, geo_colors_2)
+
+        # Decode dimension codes to labels for the tooltips only
+        with timer.span("decode"):
+            geo_layer_2 = decode(geo_layer_2, ["INDICATOR"])
+        geo_layer_2["obs_radius"] = geo_layer_2["OBS_VALUE"].map(lambda obs_count: math.sqrt(obs_count)*ind_scale)
+        color_exp = f"[R, G, B]"
+        elevation_exp = f"{selected_col}"
+        radius_exp = "obs_radius"
+        point_fill_exp, point_line_exp = [0, 240, 50], [0, 0, 0]
+        weight_exp = "OBS_VALUE > 0 ? OBS_VALUE : 0"
+        value_field = selected_col
+        radius_scale = 100
+
+    # Accessors that depend on the year are recomputed when it changes
+    year_triggers = [selected_year] if time_series else []
 
     initial_view_state = pdk.ViewState(
         latitude=10,
         longitude=0,
-        zoom=2,
+        zoom=map_zoom,
         max_zoom=9,
         pitch=0,
         bearing=0,
-        height=900,
+        height=map_height,
         width=None,
     )
 
@@ -397,15 +302,16 @@ def app():
         filled=True,
         extruded=show_3d,
         wireframe=True,
-        get_elevation=f"{selected_col}",
+        get_elevation=elevation_exp,
         elevation_scale=elev_scale,
         get_fill_color=color_exp,
+        update_triggers={"getFillColor": year_triggers, "getElevation": year_triggers},
         get_line_color=[255,255,255],
         get_line_width=10,
         line_width_min_pixels=2,
     )
 
-    geojson_null = pdk.Layer(
+    geojson_null = None if time_series else pdk.Layer(
         "GeoJsonLayer",
         gdf_null,
         pickable=True,
@@ -420,8 +326,6 @@ def app():
         line_width_min_pixels=2,
     )
 
-    geo_layer_2["obs_radius"] = geo_layer_2["OBS_VALUE"].map(lambda obs_count: math.sqrt(obs_count)*ind_scale)
-
     # Define a layer to display on a map
     geojson_indicator = pdk.Layer(
         "ScatterplotLayer",
@@ -430,14 +334,15 @@ def app():
         opacity=0.1,
         stroked=True,
         filled=True,
-        radius_scale=100,
+        radius_scale=radius_scale,
         radius_min_pixels=5,
         radius_max_pixels=500,
         line_width_min_pixels=1,
         get_position="[long, lat]",
-        get_radius="obs_radius",
-        get_fill_color=[0, 240, 50],
-        get_line_color=[0, 0, 0],
+        get_radius=radius_exp,
+        get_fill_color=point_fill_exp,
+        get_line_color=point_line_exp,
+        update_triggers={"getRadius": year_triggers, "getFillColor": year_triggers, "getLineColor": year_triggers},
     )
 
 
@@ -446,13 +351,16 @@ def app():
         geo_layer_2,
         opacity=0.9,
         get_position=["long", "lat"],
-        aggregation=String('SUM'),
-        get_weight="OBS_VALUE > 0 ? OBS_VALUE : 0",
+        aggregation=pdk.types.String('SUM'),
+        get_weight=weight_exp,
+        update_triggers={"getWeight": year_triggers},
     )
 
     tooltip1 = {
-        "html": "<strong>Country:</strong> {name}<br><strong>Indicator:</strong>{INDICATOR}<br/><strong>Value: </strong>{"
-        + selected_col
+        "html": "<strong>Country:</strong> {name}<br>"
+        + ("" if time_series else "<strong>Indicator:</strong>{INDICATOR}<br/>")
+        + "<strong>Value: </strong>{"
+        + value_field
         + "} <br/><strong>Year: </strong> "
         + str(selected_year)
         + "",
@@ -464,7 +372,7 @@ def app():
     if show_chloro:
         layers.append(geojson)
 
-    if show_nodata:
+    if show_nodata and not time_series:
         layers.append(geojson_null)
     
     if show_indicator:
@@ -486,12 +394,12 @@ def app():
     row3_col1, row3_col2 = st.columns([9, 1])
 
 
-    with row3_col1:
+    with row3_col1, timer.span("pydeck_chart"):
         st.pydeck_chart(r)
         # st.write(".")
 
 
-    with row3_col2:
+    with row3_col2, timer.span("colormap"):
         st.write(
             cm.create_colormap(
                 palette1,
@@ -504,7 +412,13 @@ def app():
                 font_size=7,
             )
         )
+        st.caption("  \n".join(f"{lo:.2f} to {hi:.2f}" for lo, hi in zip(edges1[:-1], edges1[1:])))
 
+    finish_timing(timer, {
+        "mode": map_mode, "year": selected_year,
+        "group": indicator_group, "indicator": this_indicator, **codes, "palette": palette1,
+        "n_colors": n_colors, "scheme": scheme, "layers": [l.type for l in layers],
+    })
     return None
 
 app()
@@ -1,14 +1,16 @@
-import os
 import sys
-import pandas as pd
 import streamlit as st
-import bokeh.plotting
-from bokeh.plotting import figure
 
 sys.path.append("..")
-from data.dictionary import get_dictionary
-INDICATOR_dict = get_dictionary('INDICATOR')
-REF_AREA_dict = get_dictionary('REF_AREA')
+from src.utils.loader import warm_up_with_notification
+from src.utils.datasets import DATASETS, dataset_path, indicators, table, view
+from src.utils.cube import build_cube, cube_version, load_cube
+from src.utils.ranking import RankingIndex
+from src.utils.risk_factors import DEFAULT_LAGS, associations
+from src.utils.artifacts import cached_artifact
+from src.utils.dimensions import decode, dimension
+from src.utils.streamlit_gui import dimension_selectors, finish_timing, search_indicators
+from src.utils.timing import Timer
 
 # Initialize a session state variable that tracks the sidebar state (either 'expanded' or 'collapsed').
 if 'sidebar_state' not in st.session_state:
@@ -17,6 +19,12 @@ if 'sidebar_state' not in st.session_state:
 # Streamlit set_page_config method has a 'initial_sidebar_state' argument that controls sidebar state.
 st.set_page_config(initial_sidebar_state=st.session_state.sidebar_state, layout="wide")
 
+timer = Timer("NMR Top-N")
+
+# Load every dataset in parallel on the first visit to this server process.
+with timer.span("warm_up"):
+    warm_up_with_notification()
+
 st.title("Net Migration Rate")
 st.sidebar.write("""
 **Sidebar**
@@ -32,61 +40,32 @@ with st.sidebar:
     "Fetch data from github?",
     ('No', 'Yes'))
 
-if fetch_from_cloud == 'Yes':
-    link_prefix = "https://raw.githubusercontent.com/harry-oestreicher/umr_eda/main/data/streamlit/"
-else:
-    link_prefix = "data/"
-    
+remote = fetch_from_cloud == 'Yes'
+
+@st.cache_resource
+def get_cube(version):
+    # One memory-mapped cube per view version, shared by every session.
+    return load_cube(version)
 
-data_links = {
-    "reference": {
-        "countries": link_prefix + "umr_eda_NMR.csv", # <== Net Migration
-        "countries_hires": link_prefix + "umr_eda_NMR.csv", # <== Net Migration
-    },
-    "indicator": {
-        "_ALL_": link_prefix + "all_indicators_2012-2022.csv",
-        "DM_": link_prefix + "umr_data_DM_.csv",
-        "ECON_": link_prefix + "umr_data_ECON_.csv",
-        "MG_": link_prefix + "umr_data_MG_.csv",
-        "PV_": link_prefix + "umr_data_PV_.csv",
-        "WS_": link_prefix + "umr_data_WS_.csv",
-        "WT_": link_prefix + "umr_data_WT_.csv",
-        "ED_": link_prefix + "umr_data_ED_.csv",
-        "GN_": link_prefix + "umr_data_GN_.csv",
-        "HVA_": link_prefix + "umr_data_HVA_.csv",
-        "IM_": link_prefix + "umr_data_IM_.csv",
-        "MNCH_": link_prefix + "umr_data_MNCH_.csv",
-        "PT_": link_prefix + "umr_data_PT_.csv",
-    },
-}
+@st.cache_resource
+def get_remote_cube(url):
+    return build_cube(view(url, year_min=2011))
+
+@st.cache_resource
+def get_ranking(version):
+    return RankingIndex.from_cube(get_cube(version), year_min=2011)
+
+@st.cache_resource
+def get_remote_ranking(url):
+    return RankingIndex.from_cube(get_remote_cube(url), year_min=2011)
+
+@st.cache_data
+def get_associations(version):
+    return cached_artifact("associations", (version,), lambda: associations(get_cube(version), year_min=2011))
 
 @st.cache_data
-def get_indicator_data(url):
-    df = pd.read_csv(url)
-    df = df[df["TIME_PERIOD"] >= 2011].copy()
-    df.drop(columns=["Unnamed: 0"], inplace=True)
-    df.replace({"INDICATOR": INDICATOR_dict}, inplace=True)
-    return df
-
-def get_indicator_dict(name):
-    in_csv = os.path.join(os.getcwd(), "data/umr_data_dict_INDICATOR.csv")
-    df = pd.read_csv(in_csv)
-    value = df[df.key==name]["value"].values[0]
-    return value
-
-def enumerate_column(col_in):
-    if col_in == "REF_AREA":
-        REF_AREA = REF_AREA_dict
-        val = REF_AREA.get(col_in)
-
-    elif col_in == "INDICATOR":
-        INDICATOR = INDICATOR_dict
-        val = INDICATOR.get(col_in)
-    return val
-
-def get_indicators(df):
-    indicator_list = df["INDICATOR"].unique()
-    return indicator_list
+def get_remote_associations(url):
+    return associations(get_remote_cube(url), year_min=2011)
 
 def app():
     # st.title("Unaccompanied Minor Research")
@@ -133,72 +112,103 @@ def app():
 
     st.write(" ")
 
-    df = get_indicator_data(data_links["indicator"]["_ALL_"])
-    net_mg_rate = df[df.INDICATOR=='Net migration rate (per 1,000 population)'].sort_values('OBS_VALUE').copy()
-
-    if all_year_toggle == 'No':
-        net_mg_rate = net_mg_rate[net_mg_rate.TIME_PERIOD==year_selected].copy()
-
-    def trim_the_fat(df, num):
-        upp = df.sort_values('OBS_VALUE').head(num)
-        lwr = df.sort_values('OBS_VALUE').tail(num)
-        out = pd.concat([upp,lwr])
-        return out.sort_values('REF_AREA', ascending=False)
+    with timer.span("cube"):
+        if remote:
+            ranking = get_remote_ranking(dataset_path("_ALL_", remote))
+            get_scores = lambda: get_remote_associations(dataset_path("_ALL_", remote))
+        else:
+            version = cube_version()
+            ranking = get_ranking(version)
+            get_scores = lambda: get_associations(version)
 
-    # Trim extremes (topN and bottomN) into a new dataframe.
-    top_40_nmr = trim_the_fat(net_mg_rate, num_extremes)
-    top_40_nmr.sort_values(by=["REF_AREA", "OBS_VALUE"], inplace=True)
+    # Extremes (topN and bottomN), sliced from the precomputed NMR ranking.
+    with timer.span("ranking"):
+        top_40_nmr = ranking.extremes(num_extremes, None if all_year_toggle == 'Yes' else year_selected)
     top_40_nmr_countries = top_40_nmr["REF_AREA"].unique()
 
-    st.write("#### Indicator Groups and Filters:")
-    row1_col1, row1_col2, = st.columns([4, 4])
-    with row1_col1:
-        indicator_group_selected = st.selectbox("**Indictator Group:**", [
-            "Demographic", 
-            "Economic", 
-            "Migratory", 
-            "Maternal, Newborn, and Child Health",
-            "Water Services", 
-            "Youth Workforce",
-            "Education", 
-            "PT_",
-            "GN_", 
-            "HVA_", 
-            "IM_"
-            ]
+    if st.checkbox("Show NMR rank stability"):
+        st.write(f"**Countries among the {num_extremes} lowest or highest NMR, by number of years ({yrs[0]} - {yrs[-1]})**")
+        st.dataframe(decode(ranking.stability(num_extremes, yrs)))
+
+    analysis_mode = st.radio("**Analysis mode:**", ('Single indicator', 'Rank all indicators'), horizontal=True)
+
+    if analysis_mode == 'Rank all indicators':
+        st.write("#### NMR Risk-Factor Ranking:")
+        row1_col1, row1_col2, = st.columns([4, 4])
+        with row1_col1:
+            lag = st.selectbox("**Indicator leads NMR by (years):**", DEFAULT_LAGS)
+
+        # Correlation of every indicator with NMR over all countries, 2011 onwards.
+        with timer.span("associations"):
+            scores = get_scores()
+        scores = scores[(scores.LAG == lag) & scores.SPEARMAN.notna()].copy()
+        scores["GROUP"] = scores["GROUP"].fillna(scores["INDICATOR"].str.split("_").str[0] + "_")
+        scores = scores[scores.GROUP.isin(DATASETS)]
+        if scores.empty:
+            st.info(f"No indicator has enough country-years to correlate with NMR at a lag of {lag} years.")
+            st.stop()
+        st.dataframe(
+            decode(scores, ["INDICATOR"]).rename(columns={
+                "INDICATOR": "Indicator", "GROUP": "Group", "LAG": "Lag (years)",
+                "N": "Country-years", "PEARSON": "Pearson r", "SPEARMAN": "Spearman rho",
+            }),
+            hide_index=True,
         )
-        indicator_group = indicator_group_dict[indicator_group_selected]      
-  
-    indicator_df = get_indicator_data(data_links["indicator"][indicator_group])
-    indicator_df = indicator_df[indicator_df.INDICATOR!="Net migration rate (per 1,000 population)"]
 
+        with row1_col2:
+            this_indicator = st.selectbox("**Drill down into:**", scores["INDICATOR"].tolist(), format_func=dimension('INDICATOR').label)
+        this_indicator_label = dimension('INDICATOR').label(this_indicator)
+        indicator_group = scores.loc[scores.INDICATOR == this_indicator, "GROUP"].iloc[0]
+
+    else:
+        st.write("#### Indicator Groups and Filters:")
+        row1_col1, row1_col2, = st.columns([4, 4])
+        with row1_col1:
+            indicator_group_selected = st.selectbox("**Indictator Group:**", [
+                "Demographic", 
+                "Economic", 
+                "Migratory", 
+                "Maternal, Newborn, and Child Health",
+                "Water Services", 
+                "Youth Workforce",
+                "Education", 
+                "PT_",
+                "GN_", 
+                "HVA_", 
+                "IM_"
+                ]
+            )
+            indicator_group = indicator_group_dict[indicator_group_selected]      
+
+        with row1_col2:
+            this_ind_list = [c for c in indicators(dataset_path(indicator_group, remote), year_min=2011) if c != "DM_NET_MG_RATE"]
+            this_ind_list = search_indicators(this_ind_list)
+            this_indicator = st.selectbox(f"**{indicator_group_selected}** Indicators:", this_ind_list, format_func=dimension('INDICATOR').label)
+            this_indicator_label = dimension('INDICATOR').label(this_indicator)
+
+    # One AGE/SEX slice of the indicator, so each NMR country-year gets one value
+    indicator_table = table(dataset_path(indicator_group, remote))
     with row1_col2:
-        this_ind_list = indicator_df["INDICATOR"].unique().tolist()
-        this_indicator = st.selectbox(f"**{indicator_group_selected}** Indicators:", this_ind_list)
-    
-    # Remove non-numeric values for this vizualization
-    if indicator_df.OBS_VALUE.dtypes == object:
-        indicator_df = indicator_df[indicator_df["OBS_VALUE"].str.contains("<|>|_| |Yes|yes|No|no|Very|High|high|Medium|medium|Low|low") == False].copy()
-    
-    indicator_df["OBS_VALUE"] = indicator_df["OBS_VALUE"].astype(float)
+        codes = dimension_selectors(indicator_table, this_indicator)
 
-    top_40_others = indicator_df[indicator_df["REF_AREA"].isin(top_40_nmr_countries)]
+    # Qualitative values were split into OBS_FLAG at ingest; keep the numeric rows.
+    with timer.span("load"):
+        indicator_df = view(dataset_path(indicator_group, remote), year_min=2011)
+        indicator_df = indicator_df[(indicator_df.INDICATOR != "DM_NET_MG_RATE") & indicator_df["OBS_VALUE"].notna()]
 
-    top_40_merged = pd.concat([top_40_nmr,top_40_others])
-    top_40_merged.sort_values(by=["REF_AREA", "TIME_PERIOD", "INDICATOR"], inplace=True)
-    
-    # Enumerate REF_AREA
-    net_mg_rate = net_mg_rate.replace({"REF_AREA": REF_AREA_dict}).copy()
-    top_40_nmr = top_40_nmr.replace({"REF_AREA": REF_AREA_dict}).copy()
-    top_40_merged = top_40_merged.replace({"REF_AREA": REF_AREA_dict}).copy()
-    top_40_others = top_40_others.replace({"REF_AREA": REF_AREA_dict}).copy()
+        top_40_others = indicator_df[indicator_df["REF_AREA"].isin(top_40_nmr_countries)]
 
-    top_40_nmr_sorted = top_40_merged.sort_values(by=["REF_AREA", "OBS_VALUE"]).copy()
-    nmr_df = top_40_nmr_sorted[top_40_nmr_sorted.INDICATOR=="Net migration rate (per 1,000 population)"].copy()
-    ind_df = top_40_merged[top_40_merged.INDICATOR==this_indicator].copy()
+    # The indicator value of each extreme NMR country-year, looked up on the slice's index.
+    with timer.span("top_n_merge"):
+        merged_df = top_40_nmr[["REF_AREA", "TIME_PERIOD", "OBS_VALUE"]].copy()
+        merged_df[this_indicator_label] = indicator_table.lookup(
+            this_indicator, merged_df["REF_AREA"], merged_df["TIME_PERIOD"], **codes)
+        merged_df = merged_df.dropna(subset=[this_indicator_label])
 
-    merged_df = nmr_df.merge(ind_df, on=["REF_AREA", "TIME_PERIOD"], how='inner').copy()
-    merged_df.rename(columns={"REF_AREA": "Country", "OBS_VALUE_x": "Net Migration Rate", "OBS_VALUE_y": this_indicator}, inplace=True)
+        # Enumerate REF_AREA for rendering
+        merged_df = decode(merged_df, ["REF_AREA"])
+        merged_df.sort_values(by=["REF_AREA", "OBS_VALUE"], inplace=True)
+    merged_df.rename(columns={"REF_AREA": "Country", "OBS_VALUE": "Net Migration Rate"}, inplace=True)
 
     show_tables = "no"
     show_tables = st.checkbox("Show Dataframes")
@@ -208,15 +218,21 @@ def app():
 
         with row1a_col1:
             st.write("**Top-10 NMR (2012 - 2022)**")
-            st.write(top_40_nmr)
+            st.write(decode(top_40_nmr))
 
         with row1a_col2:
             st.write("**Top-10 NMR All Indicators (2012 - 2022)**")
-            st.write(top_40_others)
+            st.write(decode(top_40_others))
 
         st.write("**Merged Tables**")
         st.dataframe(merged_df)
 
-    st.line_chart(merged_df, y=['Net Migration Rate', this_indicator], x='Country', height=500)
+    with timer.span("line_chart"):
+        st.line_chart(merged_df, y=['Net Migration Rate', this_indicator_label], x='Country', height=500)
+
+    finish_timing(timer, {
+        "mode": analysis_mode, "n": num_extremes, "year": None if all_year_toggle == 'Yes' else year_selected,
+        "group": indicator_group, "indicator": this_indicator, **codes, "remote": remote,
+    })
 
 app()
@@ -1,17 +1,15 @@
-import os
 import sys
-import time
-import math
-import pathlib
-import requests
-import datetime
-import pandas as pd
 import streamlit as st
 
 sys.path.append("..")
-from data.dictionary import get_dictionary
-INDICATOR_dict = get_dictionary('INDICATOR')
-REF_AREA_dict = get_dictionary('REF_AREA')
+from src.utils.loader import warm_up_with_notification
+from src.utils.artifacts import cached_artifact
+from src.utils.datasets import dataset_path
+from src.utils.dimensions import decode, dimension
+from src.utils.nmr_smr import MAX_CHART_POINTS, age_bands, chart_frame, chart_points
+from src.utils.pipelines import nmr_smr_tables
+from src.utils.streamlit_gui import finish_timing
+from src.utils.timing import Timer
 
 # Initialize a session state variable that tracks the sidebar state (either 'expanded' or 'collapsed').
 if 'sidebar_state' not in st.session_state:
@@ -20,6 +18,12 @@ if 'sidebar_state' not in st.session_state:
 # Streamlit set_page_config method has a 'initial_sidebar_state' argument that controls sidebar state.
 st.set_page_config(initial_sidebar_state=st.session_state.sidebar_state, layout="wide")
 
+timer = Timer("NMR SMR")
+
+# Load every dataset in parallel on the first visit to this server process.
+with timer.span("warm_up"):
+    warm_up_with_notification()
+
 # Show title and description of the app.
 st.title("SMR/NMR Study")
 st.sidebar.write("""
@@ -34,38 +38,25 @@ with st.sidebar:
     "Fetch data from github?",
     ('No', 'Yes'))
 
-if fetch_from_cloud == 'Yes':
-    link_prefix = "https://raw.githubusercontent.com/harry-oestreicher/umr_eda/main/data/"
-else:
-    link_prefix = "data/"
+remote = fetch_from_cloud == 'Yes'
 
-data_links = {
-    "indicator": {
-        "NMR_SMR_": link_prefix + "nmr_smr_merged.csv",
-    },
-}
+@st.cache_data
+def get_tables(url):
+    return cached_artifact("nmr_smr_tables", (url,), lambda: nmr_smr_tables(url))
 
 @st.cache_data
-def get_indicator_data(url):
-    df = pd.read_csv(url)
-    df.drop(columns=["Unnamed: 0"], inplace=True)
-    return df
-
-def get_indicator_dict(name):
-    in_csv = os.path.join(os.getcwd(), "data/umr_data_dict_INDICATOR.csv")
-    df = pd.read_csv(in_csv)
-    value = df[df.key==name]["value"].values[0]
-    return value
-
-def enumerate_column(col_in):
-    if col_in == "REF_AREA":
-        REF_AREA = REF_AREA_dict
-        val = REF_AREA.get(col_in)
-
-    elif col_in == "INDICATOR":
-        INDICATOR = INDICATOR_dict
-        val = INDICATOR.get(col_in)
-    return val
+def get_chart_data(url, age, year):
+    # One row per country, and at most MAX_CHART_POINTS of them sent to the browser
+    nmr, smr = get_tables(url)
+    chart = chart_frame(nmr, smr, age, year)
+    points, dropped = chart_points(chart, MAX_CHART_POINTS)
+    points = decode(points, ["REF_AREA"])
+    points = points.rename(columns={
+        "REF_AREA": "Country",
+        "NMR": "Net Migration Rate",
+        "SMR": "Suicide/Mortality Rate",
+    })
+    return chart, points, dropped
 
 def app():
     st.write(
@@ -77,28 +68,38 @@ def app():
     st.write("---")
     st.write("https://raw.githubusercontent.com/harry-oestreicher/umr_eda/main/data/nmr_smr_merged.csv")
 
-    df = get_indicator_data(data_links["indicator"]["NMR_SMR_"])
-    sorted = df.sort_values(by=["REF_AREA", "TIME_PERIOD"]).copy()
-    sorted = sorted.replace({"REF_AREA": REF_AREA_dict}).copy()
+    with timer.span("tables"):
+        nmr, smr = get_tables(dataset_path("NMR_SMR", remote))
+
+    row0_col1, row0_col2 = st.columns([4, 4])
+    with row0_col1:
+        age = st.selectbox("**SMR age band:**", age_bands(smr), format_func=dimension('AGE').label)
+    with row0_col2:
+        years = sorted(int(y) for y in nmr["TIME_PERIOD"].unique())
+        year = st.selectbox("**Year:**", [None] + years, format_func=lambda y: "All years (mean)" if y is None else str(y))
+
+    with timer.span("chart_data"):
+        chart, chart_data, dropped = get_chart_data(dataset_path("NMR_SMR", remote), age, year)
+    st.caption(f"{len(chart):,} countries, {len(chart_data):,} points charted")
+    if dropped:
+        with st.expander(f"{len(dropped):,} countries not charted"):
+            st.write(", ".join(dimension('REF_AREA').label(code) for code in dropped))
 
     show_tables = "no"
     show_tables = st.checkbox("Show Dataframes")
     if show_tables:
         row1a_col1, row1a_col2 = st.columns([4, 4])
         with row1a_col1:
-            st.write(sorted)
+            st.write("**Net migration rate**")
+            st.write(decode(nmr, ["REF_AREA"]))
         with row1a_col2:
-            st.write(".")
+            st.write("**Suicide/mortality rate**")
+            st.write(decode(smr, ["REF_AREA"]))
 
-    chart_data = sorted[['REF_AREA', 'TIME_PERIOD', 'AGE_x','SMR','RANK','AGE_y','NMR']].sort_values('REF_AREA').copy()
-    chart_data.rename(columns={
-        "REF_AREA": "Country", 
-        "AGE_x": "NMR Age",
-        "AGE_y": "SMR Age",
-        "NMR": "Net Migration Rate",
-        "SMR": "Suicide/Mortality Rate",
-    }, inplace=True)
+    with timer.span("line_chart"):
+        st.line_chart(chart_data, y=["Net Migration Rate", "Suicide/Mortality Rate" ], x='Country', height=500)
 
-    st.line_chart(chart_data, y=["Net Migration Rate", "Suicide/Mortality Rate" ], x='Country', height=500)
+    finish_timing(timer, {"remote": remote, "age": age, "year": year, "points": len(chart_data),
+                         "show_tables": show_tables})
 
 app()
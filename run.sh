@@ -1 +1,2 @@
-streamlit run app.py
+python -m src.utils.precompute
+streamlit run Home.py
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+The "_ALL_" indicator dataset, materialized from the per-group
+data/umr_data_<GROUP>_.csv files.
+
+Each group is written as its own partition under data/store/_ALL_/GROUP=<GROUP>/
+and data/store/_ALL_/_manifest.json records the mtime, size and sha256 of the
+source CSV it was built from.  refresh_view() only rebuilds the partitions whose
+source changed, so keeping the view current costs one stat() per group.
+Refreshes run under view_lock; hold it too while reading a view that may be
+refreshed concurrently.
+
+Build the view from the repository root with:
+
+    python -m src.utils.all_indicators
+"""
+import os
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+import threading
+import pandas as pd
+
+from src.utils.data_store import DATA_DIR, STORE_DIR, STORE_FORMAT, ds, pa, pq, concat_chunks, iter_csv, list_sources
+from src.utils.dimensions import encode
+from src.utils.observations import format_report, merge_reports, parse_report, split_observations
+
+VIEW_NAME = "_ALL_"
+VIEW_DIR = os.path.join(STORE_DIR, VIEW_NAME)
+MANIFEST_FILE = "_manifest.json"
+GROUP_PREFIX = "umr_data_"
+
+view_lock = threading.RLock()
+COLUMNS = ["REF_AREA", "TIME_PERIOD", "INDICATOR", "AGE", "SEX", "OBS_VALUE", "OBS_FLAG"]
+KEY_COLUMNS = ["REF_AREA", "TIME_PERIOD", "INDICATOR", "AGE", "SEX"]
+
+if pa is not None:
+    SCHEMA = pa.schema([
+        ("REF_AREA", pa.string()),
+        ("TIME_PERIOD", pa.int64()),
+        ("INDICATOR", pa.string()),
+        ("AGE", pa.string()),
+        ("SEX", pa.string()),
+        ("OBS_VALUE", pa.float64()),
+        ("OBS_FLAG", pa.string()),
+    ])
+
+
+def list_groups(data_dir=DATA_DIR):
+    """
+    Return the indicator group CSVs keyed by group prefix, e.g. {"DM_": "data/umr_data_DM_.csv"}.
+    """
+    return {
+        name[len(GROUP_PREFIX):]: path
+        for name, path in list_sources(data_dir).items()
+        if name.startswith(GROUP_PREFIX)
+    }
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_manifest(view_dir=VIEW_DIR):
+    try:
+        with open(os.path.join(view_dir, MANIFEST_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"groups": {}}
+
+
+def write_manifest(manifest, view_dir=VIEW_DIR):
+    path = os.path.join(view_dir, MANIFEST_FILE)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def manifest_version(manifest):
+    """
+    A short hash of the source hashes, used as a cache key for the view contents.
+    """
+    hashes = sorted((g, e["sha256"]) for g, e in manifest["groups"].items())
+    key = [manifest.get("format"), hashes]
+    return hashlib.sha256(json.dumps(key).encode()).hexdigest()[:16]
+
+
+def normalize_group(df):
+    """
+    Give a group frame the common _ALL_ schema: AGE/SEX default to the "_T"
+    total code where a group has no such dimension.
+    """
+    df = df.copy()
+    for col in ["AGE", "SEX"]:
+        if col not in df.columns:
+            df[col] = "_T"
+    return encode(df[COLUMNS])
+
+
+def iter_group(path):
+    """
+    Yield the normalized chunks of a group CSV.
+    """
+    for df in iter_csv(path):
+        yield normalize_group(df)
+
+
+def read_group(path):
+    return concat_chunks(list(iter_group(path)))
+
+
+def _partition_dir(group, view_dir):
+    return os.path.join(view_dir, f"GROUP={group}")
+
+
+def _write_partition(path, group, view_dir):
+    """
+    Write a group CSV to its partition one chunk at a time, and return the
+    number of rows and the parse report.
+    """
+    out = _partition_dir(group, view_dir)
+    if os.path.exists(out):
+        shutil.rmtree(out)
+    os.makedirs(out)
+    rows = 0
+    reports = []
+    with pq.ParquetWriter(os.path.join(out, "part-0.parquet"), SCHEMA) as writer:
+        for df in iter_group(path):
+            writer.write_table(pa.Table.from_pandas(df, preserve_index=False).cast(SCHEMA))
+            rows += len(df)
+            reports.append(parse_report(df, top=None))
+    return rows, merge_reports(reports)
+
+
+def refresh_view(data_dir=DATA_DIR, view_dir=VIEW_DIR, force=False):
+    """
+    Rebuild the partitions whose source CSV changed since the last build and
+    drop partitions of groups that no longer exist.  Returns the view version,
+    or None when pyarrow is unavailable and read_view() reads the CSVs instead.
+    """
+    if ds is None:
+        return None
+    with view_lock:
+        return _refresh_view(data_dir, view_dir, force)
+
+
+def _refresh_view(data_dir, view_dir, force):
+    manifest = read_manifest(view_dir)
+    if manifest.get("format") != STORE_FORMAT:
+        # Partitions written in an older layout are rebuilt from scratch.
+        shutil.rmtree(view_dir, ignore_errors=True)
+        manifest = {"format": STORE_FORMAT, "groups": {}}
+    os.makedirs(view_dir, exist_ok=True)
+    entries = manifest["groups"]
+    groups = list_groups(data_dir)
+    changed = False
+
+    for group, path in groups.items():
+        st = os.stat(path)
+        entry = entries.get(group)
+        partition_exists = os.path.exists(_partition_dir(group, view_dir))
+        if not force and partition_exists and entry is not None \
+                and entry["mtime"] == st.st_mtime and entry["size"] == st.st_size:
+            continue
+
+        sha = file_sha256(path)
+        if not force and partition_exists and entry is not None and entry["sha256"] == sha:
+            # Touched but unchanged: remember the new mtime, keep the partition.
+            entry["mtime"] = st.st_mtime
+            changed = True
+            continue
+
+        rows, report = _write_partition(path, group, view_dir)
+        entries[group] = {
+            "source": path,
+            "mtime": st.st_mtime,
+            "size": st.st_size,
+            "sha256": sha,
+            "rows": rows,
+            "parse": report,
+        }
+        changed = True
+
+    for group in sorted(set(entries) - set(groups)):
+        shutil.rmtree(_partition_dir(group, view_dir), ignore_errors=True)
+        del entries[group]
+        changed = True
+
+    if changed:
+        write_manifest(manifest, view_dir)
+    return manifest_version(manifest)
+
+
+def _read_groups_csv(data_dir, groups):
+    frames = [read_group(path) for group, path in list_groups(data_dir).items()
+              if groups is None or group in groups]
+    return pd.concat(frames, ignore_index=True)
+
+
+def read_view(columns=None, year_min=None, year_max=None, groups=None,
+              data_dir=DATA_DIR, view_dir=VIEW_DIR):
+    """
+    Load the _ALL_ indicator table, optionally restricted to some columns,
+    years and groups.  Indicators published by several groups (e.g.
+    DM_NET_MG_RATE in DM_ and MG_) appear once.  Without pyarrow the table is
+    assembled from the group CSVs instead.
+    """
+    if ds is None:
+        df = _read_groups_csv(data_dir, groups)
+        if year_min is not None:
+            df = df[df.TIME_PERIOD >= year_min]
+        if year_max is not None:
+            df = df[df.TIME_PERIOD <= year_max]
+    else:
+        partitioning = ds.partitioning(pa.schema([("GROUP", pa.string())]), flavor="hive")
+        dataset = ds.dataset(view_dir, format="parquet", schema=SCHEMA.append(pa.field("GROUP", pa.string())),
+                             partitioning=partitioning)
+        expr = None
+        for cond in [
+            ds.field("TIME_PERIOD") >= year_min if year_min is not None else None,
+            ds.field("TIME_PERIOD") <= year_max if year_max is not None else None,
+            ds.field("GROUP").isin(list(groups)) if groups is not None else None,
+        ]:
+            if cond is not None:
+                expr = cond if expr is None else expr & cond
+        df = dataset.to_table(columns=COLUMNS, filter=expr).to_pandas()
+
+    df = split_observations(encode(df)).drop_duplicates(subset=KEY_COLUMNS).reset_index(drop=True)
+    if columns is not None:
+        df = df[[c for c in COLUMNS if c in columns]]
+    return df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the _ALL_ indicator view from data/umr_data_*_.csv")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--view-dir", default=VIEW_DIR)
+    parser.add_argument("--force", action="store_true", help="rebuild every partition")
+    args = parser.parse_args(argv)
+
+    version = refresh_view(args.data_dir, args.view_dir, force=args.force)
+    if version is None:
+        print("pyarrow is required to build the _ALL_ view")
+        return 1
+    manifest = read_manifest(args.view_dir)
+    rows = sum(e["rows"] for e in manifest["groups"].values())
+    print(f"{args.view_dir}: {len(manifest['groups'])} groups, {rows} rows, version {version}")
+    for group, entry in sorted(manifest["groups"].items()):
+        print("  " + format_report(group, entry["parse"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+On-disk cache of derived page data.
+
+Each artifact (a joined GeoDataFrame, a point layer, a chart frame, ...) is
+pickled under data/cache/artifacts/<data version>/<name>/, keyed by a hash of
+its parameters.  The data version covers every source CSV and geometry file,
+so editing any of them moves the pages to a fresh, empty directory instead of
+serving stale results.  Inputs read from URLs are never persisted.
+"""
+import os
+import json
+import shutil
+import hashlib
+import pandas as pd
+
+from src.utils.data_store import STORE_FORMAT, list_sources
+from src.utils.geometry import LAYERS, local_path
+from src.utils.http_cache import is_url
+
+ARTIFACT_DIR = os.path.join("data", "cache", "artifacts")
+
+
+def data_version():
+    """
+    A hash of the size and mtime of every source the pipelines read.
+    """
+    paths = sorted(list_sources().values()) + sorted(local_path(name) for name in LAYERS)
+    stats = [(p, os.stat(p).st_mtime, os.stat(p).st_size) for p in paths if os.path.exists(p)]
+    return hashlib.sha256(json.dumps([STORE_FORMAT, stats]).encode()).hexdigest()[:16]
+
+
+def artifact_path(name, key, version, artifact_dir=ARTIFACT_DIR):
+    digest = hashlib.sha256(repr(key).encode()).hexdigest()[:24]
+    return os.path.join(artifact_dir, version, name, digest + ".pkl")
+
+
+def save_artifact(obj, name, key, version, artifact_dir=ARTIFACT_DIR):
+    path = artifact_path(name, key, version, artifact_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    pd.to_pickle(obj, tmp)
+    os.replace(tmp, path)
+    return path
+
+
+def load_artifact(name, key, version, artifact_dir=ARTIFACT_DIR):
+    path = artifact_path(name, key, version, artifact_dir)
+    if not os.path.exists(path):
+        return None
+    return pd.read_pickle(path)
+
+
+def cached_artifact(name, key, build, version=None, artifact_dir=ARTIFACT_DIR):
+    """
+    Return the stored artifact for key, building and storing it when missing.
+    key is a tuple of the build parameters.
+    """
+    if any(is_url(part) for part in key):
+        return build()
+    if version is None:
+        version = data_version()
+    obj = load_artifact(name, key, version, artifact_dir)
+    if obj is None:
+        obj = build()
+        save_artifact(obj, name, key, version, artifact_dir)
+    return obj
+
+
+def prune(version, artifact_dir=ARTIFACT_DIR):
+    """
+    Remove the artifacts of every other data version.
+    """
+    if not os.path.isdir(artifact_dir):
+        return []
+    removed = [d for d in os.listdir(artifact_dir) if d != version]
+    for d in removed:
+        shutil.rmtree(os.path.join(artifact_dir, d), ignore_errors=True)
+    return removed
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of the page data pipelines at several data scales.
+
+Each scale is a synthetic copy of the bundled NMR and map group files in
+which every indicator is repeated under new codes (DM_BRTS, DM_BRTS~1, ...),
+written as CSV to a work directory.  The stages below run on those files the
+way the pages call them; for each, the best wall time of --repeat runs and
+the tracemalloc peak of one extra run are recorded:
+
+  load             parse the group CSVs (the pages' get_indicator_data)
+  index            sort and index them for view() (src/utils/datasets.py)
+  view             slice the map year
+  centroids        centroid step of the point layer
+  join_attributes  NMR choropleth join
+  join_indicator   indicator point join
+  gen_colors       classification and colors of the point layer
+  cube             indicator cube of the Top-N page
+  ranking          NMR extremes (formerly trim_the_fat)
+  top_n_merge      one indicator's values of the extreme country-years, at
+                   its default AGE/SEX codes (the page's Table.lookup)
+
+With --data-dir the stages run once on a directory written by
+src/utils/synthetic.py instead, with its countries.json as the geometry.
+
+Results are written to benchmarks/<commit>.json; --compare prints the ratio
+to an earlier run.
+
+    python -m src.utils.benchmark                        # 1x, 10x and 100x
+    python -m src.utils.benchmark --scales 1 10 --compare benchmarks/564f0dc.json
+    python -m src.utils.benchmark --data-dir /tmp/umr_x100
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import subprocess
+import tracemalloc
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from src.utils import pipelines
+from src.utils.all_indicators import normalize_group
+from src.utils.centroids import compute_centroids
+from src.utils.classify import apply_colors
+from src.utils.cube import Cube, build_cube, headline_rows
+from src.utils.data_store import read_csv
+from src.utils.datasets import DATASETS, Table, dataset_path
+from src.utils.geometry import gpd, read_layer
+from src.utils.ranking import RankingIndex
+
+RESULT_DIR = "benchmarks"
+DEFAULT_SCALES = (1, 10, 100)
+DEFAULT_GROUPS = tuple(pipelines.MAP_GROUPS.values())
+COLORS = ["f7fcf5", "c7e9c0", "74c476", "238b45", "00441b"]
+TOP_N = 10
+
+
+def write_scaled(path, out_path, factor):
+    """
+    Write path to out_path with every indicator repeated factor times.
+    Copies are appended one at a time, so memory stays at one copy.
+    """
+    df = pd.read_csv(path).drop(columns=["Unnamed: 0"], errors="ignore")
+    codes = df["INDICATOR"].astype(str)
+    with open(out_path, "w", newline="") as f:
+        for k in range(factor):
+            copy = df if k == 0 else df.assign(INDICATOR=codes + f"~{k}")
+            copy.to_csv(f, index=False, header=(k == 0))
+    return out_path
+
+
+def measure(func, repeat=1):
+    """
+    Run func repeat times untraced and once under tracemalloc.
+    Returns (result, best seconds, peak bytes).
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        del result
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, best, peak
+
+
+def _rows(result):
+    if isinstance(result, dict):
+        return sum(_rows(v) for v in result.values())
+    if isinstance(result, Cube):
+        return len(result.indicators) * len(result.areas) * len(result.years)
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+
+def run_scale(factor, groups, work_dir, year=pipelines.MAP_YEAR, repeat=1, category=pipelines.MAP_SCALE):
+    """
+    Run every stage on a copy of the data scaled by factor.
+    Returns a list of {"stage", "rows", "seconds", "peak_bytes"} records.
+    """
+    reference = write_scaled(dataset_path("NMR"), os.path.join(work_dir, f"NMR.x{factor}.csv"), factor)
+    sources = {g: write_scaled(dataset_path(g), os.path.join(work_dir, f"{g}.x{factor}.csv"), factor) for g in groups}
+    try:
+        records = run_stages(reference, sources, read_layer(category), year, repeat, f"{factor}x", category)
+    finally:
+        for path in [reference] + list(sources.values()):
+            os.remove(path)
+    return [dict(record, scale=factor) for record in records]
+
+
+def run_data_dir(data_dir, groups, year=pipelines.MAP_YEAR, repeat=1, category=pipelines.MAP_SCALE):
+    """
+    Run every stage on the files of a synthetic data directory.
+    """
+    reference = os.path.join(data_dir, DATASETS["NMR"][0])
+    sources = {g: os.path.join(data_dir, DATASETS[g][0]) for g in groups}
+    layer = gpd.read_file(os.path.join(data_dir, "countries.json"))
+    records = run_stages(reference, sources, layer, year, repeat, "dir", category)
+    return [dict(record, scale=data_dir) for record in records]
+
+
+def run_stages(reference, sources, layer, year, repeat, tag, category):
+    records = []
+
+    def stage(name, func):
+        result, seconds, peak = measure(func, repeat)
+        records.append({"stage": name, "rows": _rows(result), "seconds": seconds, "peak_bytes": peak})
+        print(f"  {tag:>5}  {name:<16} {seconds * 1000:10,.1f} ms  {peak / 2 ** 20:9,.1f} MB", flush=True)
+        return result
+
+    frames = stage("load", lambda: {g: read_csv(path) for g, path in sources.items()})
+    tables = stage("index", lambda: {g: Table(df) for g, df in frames.items()})
+    views = stage("view", lambda: {g: t.view(year, year) for g, t in tables.items()})
+
+    centroids = stage("centroids", lambda: compute_centroids(layer))
+
+    nmr = Table(read_csv(reference)).view(year, year, columns=["REF_AREA", "TIME_PERIOD", "INDICATOR", "OBS_VALUE"])
+    stage("join_attributes", lambda: pipelines.join_attributes(layer, nmr, category))
+
+    def join_points():
+        points = {}
+        for g, df in views.items():
+            if g not in DEFAULT_GROUPS:
+                continue  # only the map page's groups have point layers
+            df = df[df.INDICATOR != pipelines.NMR_INDICATOR].reset_index(drop=True)
+            if "AGE" in df.columns:
+                df = headline_rows(df)  # the default AGE/SEX slice the page shows
+            gdf = pipelines.join_indicator(centroids, df, g)
+            points[g] = pipelines.select_non_null(gdf, "OBS_VALUE")
+        return points
+    points = stage("join_indicator", join_points)
+    stage("gen_colors", lambda: {g: apply_colors(gdf, "OBS_VALUE", COLORS)[0] for g, gdf in points.items()})
+
+    cube = stage("cube", lambda: build_cube(pd.concat(
+        [normalize_group(t.view(year_min=2011)) for t in tables.values()], ignore_index=True)))
+    extremes = stage("ranking", lambda: RankingIndex.from_cube(cube, year_min=2011).extremes(TOP_N))
+
+    # The page's first indicator of the first group, at the codes its selectors default to.
+    indicator_table = next(iter(tables.values()))
+    indicator = next(ind for ind in indicator_table.indicators(year_min=2011) if ind != pipelines.NMR_INDICATOR)
+    codes = indicator_table.default_codes(indicator)
+
+    def top_n_merge():
+        merged = extremes[["REF_AREA", "TIME_PERIOD", "OBS_VALUE"]].copy()
+        merged[indicator] = indicator_table.lookup(indicator, merged["REF_AREA"], merged["TIME_PERIOD"], **codes)
+        return merged.dropna(subset=[indicator])
+    stage("top_n_merge", top_n_merge)
+    return records
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results, baseline):
+    """
+    Lines of time and peak memory ratios against a baseline result file.
+    """
+    before = {(r["scale"], r["stage"]): r for r in baseline["results"]}
+    lines = [f"against {baseline['commit']}:"]
+    for r in results:
+        old = before.get((r["scale"], r["stage"]))
+        if old is None or not old["seconds"] or not old["peak_bytes"]:
+            continue
+        lines.append(f"  {r['scale']!s:>5}  {r['stage']:<16} time {r['seconds'] / old['seconds']:6.2f}x"
+                     f"  peak {r['peak_bytes'] / old['peak_bytes']:6.2f}x")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the page data pipelines at several data scales")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES))
+    parser.add_argument("--data-dir", default=None, help="run on a synthetic data directory instead of scaled copies")
+    parser.add_argument("--groups", nargs="+", default=list(DEFAULT_GROUPS), help="indicator groups to load")
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per stage; the best is kept")
+    parser.add_argument("--output", default=None, help=f"result file (default {RESULT_DIR}/<commit>.json)")
+    parser.add_argument("--compare", default=None, help="earlier result file to compare against")
+    args = parser.parse_args(argv)
+
+    commit = git_commit()
+    results = []
+    if args.data_dir:
+        results += run_data_dir(args.data_dir, args.groups, repeat=args.repeat)
+    else:
+        with tempfile.TemporaryDirectory() as work_dir:
+            for factor in args.scales:
+                results += run_scale(factor, args.groups, work_dir, repeat=args.repeat)
+
+    output = args.output or os.path.join(RESULT_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "commit": commit,
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "groups": args.groups,
+            "repeat": args.repeat,
+            "results": results,
+        }, f, indent=2)
+    print(f"results written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            print(compare(results, json.load(f)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Indicator metadata catalog.
+
+data/umr_data_dict_INDICATOR.csv is read once per process into an
+IndicatorCatalog with a hash index by code and case-folded labels for
+type-ahead search, so selectboxes can filter without any file I/O per
+keystroke.
+"""
+import os
+import difflib
+import functools
+from types import MappingProxyType
+
+import pandas as pd
+
+CATALOG_CSV = os.path.join("data", "umr_data_dict_INDICATOR.csv")
+
+# Minimum difflib ratio for a query word to fuzzily match a label word.
+FUZZY_CUTOFF = 0.75
+
+
+class IndicatorCatalog:
+    """
+    Read-only indicator code -> label index.
+    """
+    def __init__(self, labels):
+        self.labels = MappingProxyType(dict(labels))
+        self._folded = {code: label.casefold() for code, label in self.labels.items()}
+        self._words = {code: label.split() for code, label in self._folded.items()}
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, code):
+        return code in self.labels
+
+    def __getitem__(self, code):
+        return self.labels[code]
+
+    def label(self, code):
+        return self.labels.get(code, code)
+
+    def _fuzzy_score(self, code, tokens):
+        words = self._words[code]
+        score = 0.0
+        for token in tokens:
+            best = max((difflib.SequenceMatcher(None, token, w).ratio() for w in words), default=0.0)
+            if best < FUZZY_CUTOFF:
+                return 0.0
+            score += best
+        return score / len(tokens)
+
+    def search(self, query, codes=None, limit=None, fuzzy=True):
+        """
+        Return codes whose code or label contains query (case-insensitive),
+        earliest match first.  If nothing matches and fuzzy is set, fall back
+        to labels whose words all approximately match the query words.
+        codes restricts the search to a subset, e.g. one group's indicators.
+        """
+        candidates = list(self.labels) if codes is None else list(codes)
+        q = query.strip().casefold()
+        if not q:
+            return candidates[:limit]
+
+        hits = []
+        for code in candidates:
+            pos = self._folded.get(code, code.casefold()).find(q)
+            if pos < 0 and q in code.casefold():
+                pos = 0
+            if pos >= 0:
+                hits.append((pos, code))
+        if hits or not fuzzy:
+            return [code for _, code in sorted(hits, key=lambda h: h[0])][:limit]
+
+        tokens = q.split()
+        scored = [(self._fuzzy_score(code, tokens), code) for code in candidates if code in self._words]
+        return [code for score, code in sorted(scored, key=lambda s: -s[0]) if score > 0][:limit]
+
+
+@functools.lru_cache(maxsize=None)
+def load_catalog(path=CATALOG_CSV):
+    df = pd.read_csv(path, usecols=["key", "value"])
+    return IndicatorCatalog(zip(df["key"], df["value"]))
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent centroid index for the indicator point layers.
+
+Centroids are computed once per geometry source on an equal-area projection,
+then saved as data/cache/<source>.<fingerprint>.centroids.csv with one row per
+feature id.  The fingerprint covers the feature ids and bounds, so a changed
+geometry file gets a fresh index instead of stale points.
+"""
+import os
+import hashlib
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = os.path.join("data", "cache")
+EQUAL_AREA_CRS = "+proj=cea"
+
+
+def geometry_fingerprint(gdf, id_col="id"):
+    digest = hashlib.sha256()
+    digest.update(gdf[id_col].astype(str).str.cat(sep="\n").encode())
+    digest.update(np.ascontiguousarray(gdf.bounds.to_numpy(dtype=np.float64)).tobytes())
+    return digest.hexdigest()[:12]
+
+
+def centroid_path(source, fingerprint, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, f"{source}.{fingerprint}.centroids.csv")
+
+
+def compute_centroids(gdf, id_col="id", columns=("name",)):
+    """
+    Return a DataFrame of feature id, the requested attribute columns and the
+    long/lat of each feature's centroid, taken on an equal-area projection.
+    """
+    points = gdf.geometry.to_crs(EQUAL_AREA_CRS).centroid.to_crs(gdf.crs)
+    df = pd.DataFrame({id_col: gdf[id_col].to_numpy()})
+    for col in columns:
+        if col in gdf.columns:
+            df[col] = gdf[col].to_numpy()
+    df["long"] = np.round(points.x.to_numpy(), 5)
+    df["lat"] = np.round(points.y.to_numpy(), 5)
+    return df[df[id_col].notna()].reset_index(drop=True)
+
+
+def load_centroids(gdf, source, id_col="id", columns=("name",), cache_dir=CACHE_DIR):
+    """
+    Return the centroid index of gdf, reading it from disk when it was already
+    computed for this source and geometry.
+    """
+    path = centroid_path(source, geometry_fingerprint(gdf, id_col), cache_dir)
+    if os.path.exists(path):
+        return pd.read_csv(path, keep_default_na=False, na_values=[""])
+
+    df = compute_centroids(gdf, id_col, columns)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = path + ".tmp"
+    df.to_csv(tmp, index=False)
+    os.replace(tmp, path)
+    return df
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Choropleth classification with NumPy.
+
+classify() assigns every value to one of k classes and returns the class
+edges for the legend; apply_colors() turns the classes into the R/G/B columns
+used by the pydeck layers in one array assignment.
+"""
+import numpy as np
+
+SCHEMES = {
+    "Equal count": "equal_count",
+    "Quantile": "quantile",
+    "Equal interval": "equal_interval",
+    "Natural breaks": "natural_breaks",
+}
+
+# Natural breaks are fitted on at most this many (evenly spaced, sorted)
+# values, which keeps the O(k * n^2) Fisher-Jenks fit interactive for any n.
+JENKS_SAMPLE_SIZE = 1000
+
+NODATA_COLOR = (0, 0, 0)
+
+
+def hex_to_rgb_array(colors):
+    """
+    Convert a list of "#rrggbb" / "rrggbb" strings into a (k, 3) uint8 array.
+    """
+    hexes = [c.lstrip("#") for c in colors]
+    return np.array([[int(h[i:i + 2], 16) for i in (0, 2, 4)] for h in hexes], dtype=np.uint8)
+
+
+def _equal_count(values, k):
+    order = np.argsort(values, kind="stable")
+    n = len(values)
+    bins = np.empty(n, dtype=np.int64)
+    bins[order] = np.arange(n) * k // n
+    ranked = values[order]
+    starts = np.searchsorted(bins[order], np.arange(1, k))
+    edges = np.concatenate([[ranked[0]], ranked[np.minimum(starts, n - 1)], [ranked[-1]]])
+    return bins, edges
+
+
+def _bins_from_edges(values, edges):
+    bins = np.searchsorted(edges[1:-1], values, side="right")
+    return bins, edges
+
+
+def _quantile(values, k):
+    edges = np.quantile(values, np.linspace(0, 1, k + 1))
+    return _bins_from_edges(values, edges)
+
+
+def _equal_interval(values, k):
+    edges = np.linspace(values.min(), values.max(), k + 1)
+    return _bins_from_edges(values, edges)
+
+
+def jenks_breaks(values, k, sample_size=JENKS_SAMPLE_SIZE):
+    """
+    Fisher-Jenks natural breaks: the k+1 edges minimizing the within-class
+    sum of squared deviations of the sorted values.
+    """
+    data = np.sort(values)
+    if len(data) > sample_size:
+        data = data[np.linspace(0, len(data) - 1, sample_size).round().astype(np.int64)]
+    n = len(data)
+    k = min(k, n)
+
+    s1 = np.concatenate([[0.0], np.cumsum(data)])
+    s2 = np.concatenate([[0.0], np.cumsum(data * data)])
+    start = np.arange(n)[:, None]
+    end = np.arange(n)[None, :]
+    count = end - start + 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # ssd[i, l] is the squared deviation of the class data[i..l]
+        ssd = (s2[end + 1] - s2[start]) - (s1[end + 1] - s1[start]) ** 2 / count
+    ssd[count <= 0] = np.inf
+
+    cost = ssd[0].copy()
+    back = np.zeros((k, n), dtype=np.int64)
+    for j in range(1, k):
+        # a class starting at i follows a (j-1)-class split of data[..i-1]
+        prev = np.concatenate([[np.inf], cost[:-1]])
+        total = prev[:, None] + ssd
+        back[j] = np.argmin(total, axis=0)
+        cost = total[back[j], np.arange(n)]
+
+    starts = []
+    last = n - 1
+    for j in range(k - 1, 0, -1):
+        i = back[j, last]
+        starts.append(i)
+        last = i - 1
+    starts = starts[::-1]
+    return np.concatenate([[data[0]], data[starts], [data[-1]]])
+
+
+def _natural_breaks(values, k):
+    return _bins_from_edges(values, jenks_breaks(values, k))
+
+
+_CLASSIFIERS = {
+    "equal_count": _equal_count,
+    "quantile": _quantile,
+    "equal_interval": _equal_interval,
+    "natural_breaks": _natural_breaks,
+}
+
+
+def classify(values, k, scheme="equal_count"):
+    """
+    Assign values to k classes.  Returns (bins, edges): an int array with the
+    class of every value (-1 for NaN) and the k+1 class edges.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    bins = np.full(len(values), -1, dtype=np.int64)
+    valid = ~np.isnan(values)
+    if not valid.any():
+        return bins, np.full(k + 1, np.nan)
+
+    valid_bins, edges = _CLASSIFIERS[scheme](values[valid], k)
+    bins[valid] = np.clip(valid_bins, 0, k - 1)
+    return bins, edges
+
+
+def apply_colors(gdf, column, colors, scheme="equal_count"):
+    """
+    Classify gdf[column] and write the class colors to the R, G and B columns.
+    Returns a shallow copy of gdf and the class edges.
+    """
+    palette = np.vstack([hex_to_rgb_array(colors), NODATA_COLOR])
+    bins, edges = classify(gdf[column].to_numpy(dtype=np.float64), len(colors), scheme)
+    rgb = palette[bins]
+
+    gdf = gdf.copy(deep=False)
+    gdf[["R", "G", "B"]] = rgb
+    return gdf, edges
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+Dense indicator cube.
+
+All numeric indicator values are held in one float64 array of shape
+(indicator, REF_AREA, TIME_PERIOD), with NaN where a country has no value for
+a year.  Looking up "indicator X for these countries and years" is then an
+array index instead of a merge of long-format frames.
+
+Indicators broken down by AGE/SEX contribute one headline slice: the "_T"
+total where the indicator has one, otherwise its most common AGE and SEX code.
+Qualitative values (Yes/No, "<100", ...) are left out.
+
+The cube of each version of the group files is saved under
+data/cache/cube/<version>/ and memory-mapped read-only, so every Streamlit
+process shares the same pages of the file instead of holding its own copy.
+cube_version() only stats the files, so pages may call it on every rerun; the
+_ALL_ view is refreshed when a cube of a new version is built.  Build it ahead
+of time with:
+
+    python -m src.utils.cube
+"""
+import os
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+import functools
+import numpy as np
+import pandas as pd
+
+from src.utils.data_store import DATA_DIR
+from src.utils.all_indicators import list_groups, read_view, refresh_view, view_lock
+
+CUBE_DIR = os.path.join(DATA_DIR, "cache", "cube")
+VALUES_FILE = "values.npy"
+AXES_FILE = "axes.json"
+
+
+class Cube:
+    """
+    values[indicator, area, year] with the axis labels and their positions.
+    groups maps a group prefix ("DM_") to the indicators read from its file.
+    """
+    def __init__(self, values, indicators, areas, years, groups=None):
+        self.values = values
+        self.indicators = list(indicators)
+        self.areas = list(areas)
+        self.years = np.asarray(years, dtype=np.int64)
+        self.groups = dict(groups or {})
+        self._indicator_pos = {code: i for i, code in enumerate(self.indicators)}
+        self._area_pos = {code: i for i, code in enumerate(self.areas)}
+
+    def __repr__(self):
+        return "<Cube {} indicators x {} areas x {} years>".format(*self.values.shape)
+
+    def __contains__(self, indicator):
+        return indicator in self._indicator_pos
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes
+
+    def group_indicators(self, group):
+        return self.groups.get(group, [])
+
+    def area_positions(self, areas):
+        """
+        Positions of the given REF_AREA codes; unknown codes map to -1.
+        """
+        return np.array([self._area_pos.get(a, -1) for a in areas], dtype=np.int64)
+
+    def year_positions(self, years):
+        years = np.asarray(years, dtype=np.int64)
+        pos = np.searchsorted(self.years, years)
+        pos = np.minimum(pos, len(self.years) - 1)
+        return np.where(self.years[pos] == years, pos, -1)
+
+    def matrix(self, indicator):
+        """
+        The (area, year) array of one indicator; all NaN when it is not in the cube.
+        """
+        if indicator not in self._indicator_pos:
+            return np.full(self.values.shape[1:], np.nan)
+        return self.values[self._indicator_pos[indicator]]
+
+    def lookup(self, indicator, areas, years):
+        """
+        Values of indicator at the (area, year) pairs, NaN where missing.
+        """
+        a = self.area_positions(areas)
+        y = self.year_positions(years)
+        out = np.full(len(a), np.nan)
+        found = (a >= 0) & (y >= 0)
+        out[found] = self.matrix(indicator)[a[found], y[found]]
+        return out
+
+    def frame(self, indicator, areas=None, year_min=None, year_max=None):
+        """
+        Long-format REF_AREA, TIME_PERIOD, INDICATOR, OBS_VALUE rows of one
+        indicator, optionally restricted to some countries and years.
+        """
+        m = self.matrix(indicator)
+        area_idx = np.arange(len(self.areas)) if areas is None else self.area_positions(areas)
+        area_idx = area_idx[area_idx >= 0]
+        year_mask = np.ones(len(self.years), dtype=bool)
+        if year_min is not None:
+            year_mask &= self.years >= year_min
+        if year_max is not None:
+            year_mask &= self.years <= year_max
+        year_idx = np.flatnonzero(year_mask)
+
+        block = m[np.ix_(area_idx, year_idx)]
+        a, y = np.nonzero(~np.isnan(block))
+        df = pd.DataFrame({
+            "REF_AREA": pd.Categorical.from_codes(area_idx[a], self.areas),
+            "TIME_PERIOD": self.years[year_idx[y]],
+            "INDICATOR": pd.Categorical([indicator] * len(a)),
+            "OBS_VALUE": block[a, y],
+        })
+        return df
+
+
+def headline_rows(df):
+    """
+    Keep one AGE/SEX slice per indicator: "_T" if the indicator has it,
+    otherwise its most common code.  df must have a default RangeIndex.
+    """
+    keep = np.zeros(len(df), dtype=bool)
+    for _, rows in df.groupby("INDICATOR", observed=True, sort=False):
+        mask = np.ones(len(rows), dtype=bool)
+        for col in ["AGE", "SEX"]:
+            values = rows[col].astype(str).to_numpy()
+            subset = values[mask]
+            choice = "_T" if (subset == "_T").any() else pd.Series(subset).mode().iloc[0]
+            mask &= values == choice
+        keep[rows.index[mask]] = True
+    return df[keep]
+
+
+def build_cube(df, groups=None):
+    """
+    Pivot a long-format indicator table (the _ALL_ view columns) into a Cube.
+    A missing AGE or SEX column is taken as the "_T" total, as in the view.
+    """
+    df = df.assign(**{col: "_T" for col in ["AGE", "SEX"] if col not in df.columns})
+    df = df[["REF_AREA", "TIME_PERIOD", "INDICATOR", "AGE", "SEX", "OBS_VALUE"]].copy()
+    df["OBS_VALUE"] = pd.to_numeric(df["OBS_VALUE"], errors="coerce")
+    df = df.dropna(subset=["OBS_VALUE"]).reset_index(drop=True)
+    df = headline_rows(df).drop_duplicates(subset=["INDICATOR", "REF_AREA", "TIME_PERIOD"])
+
+    indicators, i = np.unique(df["INDICATOR"].astype(str).to_numpy(), return_inverse=True)
+    areas, a = np.unique(df["REF_AREA"].astype(str).to_numpy(), return_inverse=True)
+    years, y = np.unique(df["TIME_PERIOD"].to_numpy(dtype=np.int64), return_inverse=True)
+
+    values = np.full((len(indicators), len(areas), len(years)), np.nan)
+    values[i, a, y] = df["OBS_VALUE"].to_numpy()
+    return Cube(values, indicators.tolist(), areas.tolist(), years, groups)
+
+
+def view_groups(data_dir=DATA_DIR):
+    """
+    Indicator codes published by each group file of the _ALL_ view.
+    """
+    groups = {}
+    for group in list_groups(data_dir):
+        codes = read_view(columns=["INDICATOR"], groups=[group], data_dir=data_dir)["INDICATOR"]
+        groups[group] = sorted(codes.astype(str).unique())
+    return groups
+
+
+def cube_version(data_dir=DATA_DIR):
+    """
+    A hash of the group files' mtime and size.
+    """
+    stats = [(p, os.stat(p).st_mtime, os.stat(p).st_size) for p in list_groups(data_dir).values()]
+    return hashlib.sha256(json.dumps(stats).encode()).hexdigest()[:16]
+
+
+def cube_path(version, cube_dir=CUBE_DIR):
+    return os.path.join(cube_dir, version)
+
+
+def save_cube(cube, path):
+    """
+    Write the cube atomically: a temporary directory is renamed into place.
+    """
+    tmp = path + ".tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    np.save(os.path.join(tmp, VALUES_FILE), np.ascontiguousarray(cube.values))
+    axes = {
+        "indicators": cube.indicators,
+        "areas": cube.areas,
+        "years": cube.years.tolist(),
+        "groups": cube.groups,
+    }
+    with open(os.path.join(tmp, AXES_FILE), "w") as f:
+        json.dump(axes, f)
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp, path)
+    return path
+
+
+def open_cube(path):
+    """
+    Open a saved cube with its values memory-mapped read-only.
+    """
+    with open(os.path.join(path, AXES_FILE)) as f:
+        axes = json.load(f)
+    values = np.load(os.path.join(path, VALUES_FILE), mmap_mode="r")
+    return Cube(values, axes["indicators"], axes["areas"], axes["years"], axes["groups"])
+
+
+@functools.lru_cache(maxsize=4)
+def load_cube(version, data_dir=DATA_DIR, cube_dir=CUBE_DIR):
+    """
+    Return the cube of a version, refreshing the view and building and saving
+    the cube on first use.  Older versions are removed when a new one is saved.
+    """
+    path = cube_path(version, cube_dir)
+    with view_lock:
+        if not os.path.exists(os.path.join(path, AXES_FILE)):
+            refresh_view(data_dir)
+            cube = build_cube(read_view(data_dir=data_dir), view_groups(data_dir))
+            os.makedirs(cube_dir, exist_ok=True)
+            for name in os.listdir(cube_dir):
+                if name != version:
+                    shutil.rmtree(os.path.join(cube_dir, name), ignore_errors=True)
+            save_cube(cube, path)
+    return open_cube(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the dense indicator cube from the _ALL_ view")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--cube-dir", default=CUBE_DIR)
+    args = parser.parse_args(argv)
+
+    version = cube_version(args.data_dir)
+    cube = load_cube(version, args.data_dir, args.cube_dir)
+    filled = np.count_nonzero(~np.isnan(cube.values))
+    print(f"{cube_path(version, args.cube_dir)}: {cube!r}, {filled} values, {cube.nbytes / 1e6:,.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
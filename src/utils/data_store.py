@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""
+Columnar store for the bundled CSV datasets.
+
+Every CSV in data/ is converted into a Parquet dataset under data/store/<name>/,
+hive-partitioned by TIME_PERIOD, so readers can load only the columns and years
+they need.  When a store is missing or older than its CSV, read_table() falls
+back to parsing the CSV.  Either way OBS_VALUE arrives as float64, with the
+qualitative entries moved to OBS_FLAG (see src/utils/observations.py); the
+store's _source.json records how each dataset parsed.
+
+CSVs are parsed, and stores read, in chunks sized to a memory budget: the
+year, indicator and area predicates and the dtype conversion are applied per
+chunk, so only the matching rows are ever held in full, and building the
+store never holds a whole file.
+
+Build the store from the repository root with:
+
+    python -m src.utils.data_store
+"""
+import os
+import sys
+import glob
+import json
+import shutil
+import argparse
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    ds = None
+    pq = None
+
+from src.utils.dimensions import DIMENSION_COLUMNS, encode
+from src.utils.http_cache import is_url, resolve
+from src.utils.observations import FLAG_COLUMN, format_report, merge_reports, parse_report, split_observations
+
+DATA_DIR = "data"
+STORE_DIR = os.path.join(DATA_DIR, "store")
+PARTITION_COLUMN = "TIME_PERIOD"
+META_FILE = "_source.json"
+
+# Bumped when the stored layout changes, so older stores are rebuilt.
+STORE_FORMAT = 3
+
+# Working memory a chunked read may use, on top of the rows it returns.
+MEMORY_BUDGET = 256 * 2 ** 20
+MIN_CHUNK_ROWS = 10_000
+SAMPLE_ROWS = 5_000
+# In-memory size of a parsed chunk relative to its raw text, while it is converted.
+PARSE_OVERHEAD = 4
+
+
+def list_sources(data_dir=DATA_DIR):
+    """
+    Return the CSV files that are converted into the store, keyed by store name.
+    """
+    paths = sorted(glob.glob(os.path.join(data_dir, "umr_data_*_.csv")))
+    paths += [
+        os.path.join(data_dir, "umr_eda_NMR.csv"),
+        os.path.join(data_dir, "nmr_smr_merged.csv"),
+    ]
+    return {store_name(path): path for path in paths if os.path.exists(path)}
+
+
+def store_name(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def store_path_for(path, store_dir=STORE_DIR):
+    return os.path.join(store_dir, store_name(path))
+
+
+def _partitioning():
+    return ds.partitioning(pa.schema([(PARTITION_COLUMN, pa.int64())]), flavor="hive")
+
+
+def _read_meta(store_path):
+    try:
+        with open(os.path.join(store_path, META_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _source_stat(path):
+    st = os.stat(path)
+    return {"mtime": st.st_mtime, "size": st.st_size}
+
+
+def is_current(path, store_path):
+    """
+    True when store_path holds a conversion of the CSV at path as it is now.
+    """
+    if ds is None or not os.path.exists(path):
+        return False
+    meta = _read_meta(store_path)
+    return meta is not None and meta.get("format") == STORE_FORMAT and meta.get("source") == _source_stat(path)
+
+
+def _typed(df):
+    df = df.drop(columns=["Unnamed: 0"], errors="ignore")
+    return split_observations(encode(df))
+
+
+def read_csv(path, usecols=None, dtype=None):
+    dtypes = {col: "category" for col in DIMENSION_COLUMNS}
+    dtypes.update(dtype or {})
+    return _typed(pd.read_csv(path, usecols=usecols, dtype=dtypes))
+
+
+def chunk_rows(path, memory_budget=MEMORY_BUDGET):
+    """
+    Rows per chunk that keep parsing path within memory_budget, estimated
+    from the bytes per line of its first rows.
+    """
+    with open(path, "rb") as f:
+        head = [line for _, line in zip(range(SAMPLE_ROWS + 1), f)]
+    if len(head) < 2:
+        return MIN_CHUNK_ROWS
+    row_bytes = sum(len(line) for line in head[1:]) / (len(head) - 1)
+    return max(MIN_CHUNK_ROWS, int(memory_budget / (row_bytes * PARSE_OVERHEAD)))
+
+
+def _predicate_mask(df, year_min, year_max, indicators, areas):
+    mask = np.ones(len(df), dtype=bool)
+    if year_min is not None:
+        mask &= (df[PARTITION_COLUMN] >= year_min).to_numpy()
+    if year_max is not None:
+        mask &= (df[PARTITION_COLUMN] <= year_max).to_numpy()
+    if indicators is not None:
+        mask &= df["INDICATOR"].isin(indicators).to_numpy()
+    if areas is not None:
+        mask &= df["REF_AREA"].isin(areas).to_numpy()
+    return mask
+
+
+def iter_csv(path, usecols=None, year_min=None, year_max=None, indicators=None, areas=None,
+             memory_budget=MEMORY_BUDGET):
+    """
+    Yield the typed rows of a CSV that match the predicates, one chunk at a
+    time.  Chunks keep every category of the rows they were parsed from.
+    """
+    dtypes = {col: "category" for col in DIMENSION_COLUMNS}
+    reader = pd.read_csv(path, usecols=usecols, dtype=dtypes, chunksize=chunk_rows(path, memory_budget))
+    with reader:
+        for chunk in reader:
+            chunk = _typed(chunk)
+            mask = _predicate_mask(chunk, year_min, year_max, indicators, areas)
+            yield chunk if mask.all() else chunk[mask]
+
+
+def concat_chunks(chunks):
+    """
+    Concatenate typed chunks into one frame with a fresh index; categorical
+    columns get the sorted union of the chunks' categories, as encode() gives.
+    No chunks give an empty frame.
+    """
+    if not chunks:
+        return _typed(pd.DataFrame())
+    if len(chunks) == 1:
+        return chunks[0].reset_index(drop=True)
+    columns = {}
+    for col in chunks[0].columns:
+        parts = [chunk[col] for chunk in chunks]
+        if isinstance(parts[0].dtype, pd.CategoricalDtype):
+            columns[col] = pd.Series(union_categoricals(parts, sort_categories=True))
+        else:
+            columns[col] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(columns)
+
+
+def _store_schema(df):
+    """
+    The Parquet schema of a typed frame, with every categorical stored as a
+    string dictionary, whatever the categories of the chunk it came from.
+    """
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(schema):
+        if pa.types.is_dictionary(field.type) or field.name == FLAG_COLUMN:
+            schema = schema.set(i, pa.field(field.name, pa.dictionary(pa.int32(), pa.string())))
+    return schema.remove_metadata()
+
+
+def convert(path, store_dir=STORE_DIR, memory_budget=MEMORY_BUDGET):
+    """
+    Convert one CSV into a Parquet dataset partitioned by TIME_PERIOD.
+    """
+    if ds is None:
+        raise ImportError("pyarrow is required to build the data store")
+
+    store_path = store_path_for(path, store_dir)
+    if os.path.exists(store_path):
+        shutil.rmtree(store_path)
+
+    # Chunks are written one at a time, as chunk-NNNNN files in each year
+    # partition, under one schema so their dictionaries can differ.
+    schema = None
+    columns = []
+    rows = 0
+    reports = []
+    for i, df in enumerate(iter_csv(path, memory_budget=memory_budget)):
+        if schema is None:
+            columns = df.columns.tolist()
+            schema = _store_schema(df)
+        ds.write_dataset(
+            pa.Table.from_pandas(df, schema=schema, preserve_index=False),
+            store_path,
+            format="parquet",
+            partitioning=_partitioning(),
+            basename_template=f"chunk-{i:05d}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        rows += len(df)
+        reports.append(parse_report(df, top=None))
+
+    meta = {
+        "format": STORE_FORMAT,
+        "source": _source_stat(path),
+        "columns": columns,
+        "rows": rows,
+        "parse": merge_reports(reports),
+    }
+    with open(os.path.join(store_path, META_FILE), "w") as f:
+        json.dump(meta, f, indent=2)
+    return store_path
+
+
+def build_store(data_dir=DATA_DIR, store_dir=STORE_DIR, force=False, memory_budget=MEMORY_BUDGET):
+    """
+    Convert every source CSV whose store is missing or out of date.
+    """
+    built = []
+    for name, path in list_sources(data_dir).items():
+        if not force and is_current(path, store_path_for(path, store_dir)):
+            continue
+        convert(path, store_dir, memory_budget)
+        built.append(name)
+    return built
+
+
+def _store_filter(year_min, year_max, indicators, areas):
+    expr = None
+    conditions = []
+    if year_min is not None:
+        conditions.append(ds.field(PARTITION_COLUMN) >= year_min)
+    if year_max is not None:
+        conditions.append(ds.field(PARTITION_COLUMN) <= year_max)
+    if indicators is not None:
+        conditions.append(ds.field("INDICATOR").isin(list(indicators)))
+    if areas is not None:
+        conditions.append(ds.field("REF_AREA").isin(list(areas)))
+    for condition in conditions:
+        expr = condition if expr is None else expr & condition
+    return expr
+
+
+def _typed_batch(batch):
+    df = encode(batch.to_pandas())
+    if FLAG_COLUMN in df.columns:
+        # Restore the categorical of flags that come back as plain strings.
+        df = split_observations(df)
+    return df
+
+
+def _read_store(store_path, columns, year_min, year_max, indicators=None, areas=None,
+                memory_budget=MEMORY_BUDGET):
+    meta = _read_meta(store_path)
+    dataset = ds.dataset(store_path, format="parquet", partitioning=_partitioning())
+    order = [c for c in meta["columns"] if columns is None or c in columns]
+    expr = _store_filter(year_min, year_max, indicators, areas)
+    # Decoded columns take at most about 8 bytes per value.
+    batch_rows = max(MIN_CHUNK_ROWS, int(memory_budget / (8 * len(order) * PARSE_OVERHEAD)))
+    chunks = [_typed_batch(batch) for batch in dataset.to_batches(columns=order, filter=expr, batch_size=batch_rows)]
+    if not chunks:
+        return _typed_batch(dataset.to_table(columns=order, filter=expr))
+    return concat_chunks(chunks)
+
+
+def _read_csv_filtered(path, columns, year_min, year_max, indicators=None, areas=None,
+                       memory_budget=MEMORY_BUDGET):
+    usecols = None
+    if columns is not None:
+        wanted = set(columns) | {PARTITION_COLUMN}
+        if indicators is not None:
+            wanted.add("INDICATOR")
+        if areas is not None:
+            wanted.add("REF_AREA")
+        usecols = lambda c: c in wanted
+    chunks = list(iter_csv(path, usecols, year_min, year_max, indicators, areas, memory_budget))
+    df = concat_chunks(chunks)
+    if columns is not None:
+        df = df[[c for c in df.columns if c in columns]]
+    return df
+
+
+def read_table(path, columns=None, year_min=None, year_max=None, indicators=None, areas=None,
+               memory_budget=MEMORY_BUDGET):
+    """
+    Load a dataset by its CSV path or URL, reading only the requested columns,
+    the years in [year_min, year_max] and, if given, the listed indicators and
+    areas.  Uses the Parquet store when it is current and falls back to the
+    CSV otherwise; either is read in chunks of about memory_budget bytes.
+    URLs are read through the on-disk HTTP cache (src/utils/http_cache.py).
+    """
+    if is_url(path):
+        return _read_csv_filtered(resolve(path), columns, year_min, year_max, indicators, areas, memory_budget)
+    store_path = store_path_for(path)
+    if is_current(path, store_path):
+        return _read_store(store_path, columns, year_min, year_max, indicators, areas, memory_budget)
+    return _read_csv_filtered(path, columns, year_min, year_max, indicators, areas, memory_budget)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the Parquet data store from data/*.csv")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--store-dir", default=STORE_DIR)
+    parser.add_argument("--force", action="store_true", help="rebuild every dataset")
+    parser.add_argument("--memory-budget-mb", type=float, default=MEMORY_BUDGET / 2 ** 20,
+                        help="working memory while parsing a CSV")
+    args = parser.parse_args(argv)
+
+    built = build_store(args.data_dir, args.store_dir, force=args.force,
+                        memory_budget=int(args.memory_budget_mb * 2 ** 20))
+    for name in built:
+        print(f"built {os.path.join(args.store_dir, name)}")
+        report = _read_meta(os.path.join(args.store_dir, name))["parse"]
+        if report is not None:
+            print("  " + format_report(name, report))
+    if not built:
+        print("store is up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
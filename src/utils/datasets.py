@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+Shared data access for the pages.
+
+Every dataset is read once per server process into one canonical frame,
+sorted by TIME_PERIOD, shared by all pages and sessions.  view() returns the
+rows of a year range as a positional slice found by binary search, and the
+rows of one indicator through a precomputed position index, so filtering
+never copies or scans the whole table.
+
+Views are slices of the shared frame and must be treated as read-only: copy
+one before assigning to it, or the change leaks into every session.
+
+Indicators broken down by AGE and SEX are read one slice at a time through
+select() and lookup(), which filter the indicator's rows found through the
+same position index, so each country-year has one row and no second copy of
+the table is kept.
+
+    from src.utils.datasets import dataset_path, view
+    df = view(dataset_path("WS_"), year_min=2011)
+"""
+import threading
+import numpy as np
+import pandas as pd
+
+from src.utils.data_store import PARTITION_COLUMN, read_table
+
+LOCAL_PREFIX = "data/"
+REMOTE_PREFIX = "https://raw.githubusercontent.com/harry-oestreicher/umr_eda/main/data/"
+
+# Dataset name -> file, relative to the local data/ directory or the remote prefix.
+# _ALL_ is remote-only: locally it is the view of src/utils/all_indicators.py.
+DATASETS = {
+    "NMR": ("umr_eda_NMR.csv", "streamlit/umr_eda_NMR.csv"),
+    "NMR_SMR": ("nmr_smr_merged.csv", "nmr_smr_merged.csv"),
+    "_ALL_": (None, "streamlit/all_indicators_2012-2022.csv"),
+}
+for _group in ["DM_", "ECON_", "ED_", "GN_", "HVA_", "IM_", "MG_", "MNCH_", "PT_", "PV_", "WS_", "WT_"]:
+    DATASETS[_group] = (f"umr_data_{_group}.csv", f"streamlit/umr_data_{_group}.csv")
+
+# Breakdown dimensions, and the code of their total.
+DIMENSIONS = ["AGE", "SEX"]
+TOTAL = "_T"
+SORT_COLUMNS = ["REF_AREA", "TIME_PERIOD"] + DIMENSIONS
+
+_tables = {}
+_tables_lock = threading.Lock()
+
+
+def dataset_path(name, remote=False):
+    """
+    The CSV path of a dataset in data/, or its GitHub URL when remote is set.
+    """
+    local, remote_file = DATASETS[name]
+    if remote:
+        return REMOTE_PREFIX + remote_file
+    if local is None:
+        raise ValueError(f"{name} has no local file; read it with src.utils.all_indicators.read_view()")
+    return LOCAL_PREFIX + local
+
+
+class Table:
+    """
+    A frame sorted by TIME_PERIOD with binary-searchable years and an
+    indicator -> row positions index.
+    """
+    def __init__(self, df):
+        if PARTITION_COLUMN in df.columns:
+            df = df.sort_values(PARTITION_COLUMN, kind="stable").reset_index(drop=True)
+            self.years = df[PARTITION_COLUMN].to_numpy()
+        else:
+            self.years = None
+        self.df = df
+        self.dimensions = [c for c in DIMENSIONS if c in df.columns]
+        self._positions = {}
+        if "INDICATOR" in df.columns:
+            self._positions = {str(k): v for k, v in df.groupby("INDICATOR", observed=True).indices.items()}
+
+    def __len__(self):
+        return len(self.df)
+
+    def _year_bounds(self, years, year_min, year_max):
+        lo = 0 if year_min is None else np.searchsorted(years, year_min, side="left")
+        hi = len(years) if year_max is None else np.searchsorted(years, year_max, side="right")
+        return lo, hi
+
+    def view(self, year_min=None, year_max=None, indicator=None, columns=None):
+        """
+        Rows in [year_min, year_max], optionally of one indicator, restricted to
+        columns.  The result shares data with the table; do not modify it.
+        """
+        df = self.df
+        if self.years is not None and indicator is None:
+            lo, hi = self._year_bounds(self.years, year_min, year_max)
+            df = df.iloc[lo:hi]
+        elif self.years is not None:
+            positions = self._positions.get(indicator, np.array([], dtype=np.intp))
+            lo, hi = self._year_bounds(self.years[positions], year_min, year_max)
+            df = df.take(positions[lo:hi])
+        if columns is not None:
+            df = df[[c for c in df.columns if c in columns]]
+        return df
+
+    def indicators(self, year_min=None, year_max=None):
+        """
+        Indicator codes with rows in [year_min, year_max], in order of first appearance.
+        """
+        if self.years is None:
+            return list(self._positions)
+        first = {}
+        for code, positions in self._positions.items():
+            lo, hi = self._year_bounds(self.years[positions], year_min, year_max)
+            if hi > lo:
+                first[code] = positions[lo]
+        return sorted(first, key=first.get)
+
+    def dimension_codes(self, indicator, dimension, **codes):
+        """
+        The codes of one dimension among the indicator's rows at the given codes
+        of the others: "_T" first, then by number of rows.  The first is the
+        slice the indicator cube keeps.
+        """
+        rows = self.view(indicator=indicator, columns=self.dimensions)
+        for col, code in codes.items():
+            if code is not None and col != dimension:
+                rows = rows[rows[col] == code]
+        counts = rows[dimension].astype(str).value_counts(sort=False)
+        return sorted(counts.index, key=lambda code: (code != TOTAL, -counts[code], code))
+
+    def default_codes(self, indicator):
+        """
+        The AGE/SEX codes of the indicator's headline slice.
+        """
+        codes = {}
+        for col in self.dimensions:
+            options = self.dimension_codes(indicator, col, **codes)
+            if options:
+                codes[col] = options[0]
+        return codes
+
+    def select(self, indicator, year_min=None, year_max=None, **codes):
+        """
+        Rows of one indicator in [year_min, year_max] at the given AGE/SEX codes.
+        With every dimension given, there is one row per REF_AREA and
+        TIME_PERIOD; of duplicates in the file, the first is kept.  Rows come
+        sorted by REF_AREA, TIME_PERIOD, AGE and SEX.
+        """
+        positions = self._positions.get(indicator, np.array([], dtype=np.intp))
+        if self.years is not None:
+            lo, hi = self._year_bounds(self.years[positions], year_min, year_max)
+            positions = positions[lo:hi]
+        df = self.df.take(positions)
+        for col in self.dimensions:
+            if codes.get(col) is not None:
+                df = df[df[col] == codes[col]]
+        keys = [c for c in SORT_COLUMNS if c in df.columns]
+        df = df.sort_values(keys, kind="stable").reset_index(drop=True)
+        if all(codes.get(c) is not None for c in self.dimensions):
+            df = df.drop_duplicates(subset=["REF_AREA", "TIME_PERIOD"])
+        return df
+
+    def lookup(self, indicator, areas, years, **codes):
+        """
+        OBS_VALUE of one indicator slice for each (area, year) pair, NaN where missing.
+        """
+        df = self.select(indicator, **codes).drop_duplicates(subset=["REF_AREA", "TIME_PERIOD"])
+        values = pd.Series(df["OBS_VALUE"].to_numpy(),
+                           index=pd.MultiIndex.from_arrays([df["REF_AREA"].astype(str), df["TIME_PERIOD"]]))
+        pairs = pd.MultiIndex.from_arrays([pd.Series(areas).astype(str).to_numpy(), np.asarray(years)])
+        return values.reindex(pairs).to_numpy()
+
+
+def table(path):
+    """
+    The canonical Table of a dataset path or URL, read once per process.
+    """
+    with _tables_lock:
+        if path in _tables:
+            return _tables[path]
+    loaded = Table(read_table(path))
+    with _tables_lock:
+        return _tables.setdefault(path, loaded)
+
+
+def view(path, year_min=None, year_max=None, indicator=None, columns=None):
+    return table(path).view(year_min, year_max, indicator, columns)
+
+
+def indicators(path, year_min=None, year_max=None):
+    return table(path).indicators(year_min, year_max)
+
+
+def select(path, indicator, year_min=None, year_max=None, **codes):
+    return table(path).select(indicator, year_min, year_max, **codes)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Dimension columns are held as pandas Categoricals of SDMX codes (e.g. "AFG",
+"DM_NET_MG_RATE").  Human-readable labels from data/dictionary.py are applied
+to the category index only, right before a table, tooltip or chart renders.
+
+dimension(name) returns the process-wide, read-only lookup for one dimension,
+built once on first use.
+"""
+import functools
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+from data.dictionary import get_dictionary
+
+DIMENSION_COLUMNS = ["REF_AREA", "INDICATOR", "AGE", "SEX"]
+
+
+class Dimension:
+    """
+    Read-only code <-> label lookup for one dimension.
+
+    labels maps code -> label and codes maps label -> tuple of codes, since
+    several codes can share a label (WHO_AFRO and UNDEV_002 are both "Africa").
+    Unknown codes decode to themselves.
+    """
+    def __init__(self, name, mapping):
+        self.name = name
+        self.labels = MappingProxyType(dict(mapping))
+        reverse = {}
+        for code, label in self.labels.items():
+            reverse.setdefault(label, []).append(code)
+        self.codes = MappingProxyType({label: tuple(codes) for label, codes in reverse.items()})
+
+    def __repr__(self):
+        return f"<Dimension {self.name}: {len(self.labels)} codes>"
+
+    def label(self, code):
+        return self.labels.get(code, code)
+
+    def code(self, label):
+        """
+        Return the first code with this label, or the label itself if none has it.
+        """
+        return self.codes.get(label, (label,))[0]
+
+    def lookup_table(self, codes):
+        """
+        Return an object array with the label of each code, indexable by position.
+        """
+        return np.array([self.labels.get(c, c) for c in codes], dtype=object)
+
+    def decode_categorical(self, values):
+        """
+        Return a Series of codes as a Categorical of labels, with categories in
+        alphabetical label order.  Only the categories are looked up; row codes
+        are remapped through an integer lookup table.
+        """
+        if not isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype("category")
+        lut, uniques = pd.factorize(self.lookup_table(values.cat.categories), sort=True)
+        codes = values.cat.codes.to_numpy()
+        # lut is empty when every value is NaN, so index it with clipped codes
+        codes = np.where(codes >= 0, lut[np.maximum(codes, 0)] if len(lut) else -1, -1)
+        return pd.Series(pd.Categorical.from_codes(codes, uniques), index=values.index, name=values.name)
+
+
+@functools.lru_cache(maxsize=None)
+def dimension(name):
+    return Dimension(name, get_dictionary(name))
+
+
+def encode(df, columns=DIMENSION_COLUMNS):
+    """
+    Store the dimension columns of df as Categoricals with sorted code categories.
+    """
+    for col in columns:
+        if col not in df.columns:
+            continue
+        values = df[col]
+        if not isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype("category")
+        elif not values.cat.categories.is_monotonic_increasing:
+            values = values.cat.reorder_categories(values.cat.categories.sort_values())
+        df[col] = values
+    return df
+
+
+def decode_column(values, col):
+    return dimension(col).decode_categorical(values)
+
+
+def decode(df, columns=None):
+    """
+    Return a shallow copy of df with its dimension columns decoded to labels.
+    columns is a list of dimension columns, or a dict mapping column names to
+    their dimension, e.g. {"INDICATOR_x": "INDICATOR"} after a merge.
+    """
+    if columns is None:
+        columns = DIMENSION_COLUMNS
+    if not isinstance(columns, dict):
+        columns = {col: col for col in columns}
+    out = df.copy(deep=False)
+    for col, dim in columns.items():
+        if col in out.columns:
+            out[col] = decode_column(out[col], dim)
+    return out
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Largest-Triangle-Three-Buckets downsampling of chart series.
+
+lttb() picks at most `threshold` points of a series that keep its visual
+shape: the first and last points, and from each bucket in between the point
+spanning the largest triangle with its neighbours.  Charts send those points
+to the browser instead of the whole series.
+"""
+import numpy as np
+
+
+def lttb(y, threshold, x=None):
+    """
+    Positions of the points of y (at x, default 0..n-1) to keep, ascending.
+    NaNs are dropped first; threshold is at least 3.
+    """
+    threshold = max(int(threshold), 3)
+    y = np.asarray(y, dtype=float)
+    x = np.arange(len(y), dtype=float) if x is None else np.asarray(x, dtype=float)
+    positions = np.flatnonzero(~np.isnan(y))
+    n = len(positions)
+    if threshold >= n:
+        return positions
+    px, py = x[positions], y[positions]
+
+    # Buckets of the points between the first and the last.
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    keep = np.empty(threshold, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # The next point is the average of the following bucket (or the last point).
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = px[nlo:nhi].mean(), py[nlo:nhi].mean()
+        area = np.abs((px[a] - cx) * (py[lo:hi] - py[a]) - (px[a] - px[lo:hi]) * (cy - py[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return positions[keep]
+
+
+def downsample(df, column, threshold, x=None):
+    """
+    The rows of df that LTTB keeps for column, in order.
+    """
+    if len(df) <= threshold:
+        return df
+    return df.iloc[lttb(df[column].to_numpy(), threshold, None if x is None else df[x].to_numpy())]
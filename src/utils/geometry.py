@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+Local geometry registry.
+
+Every map layer is served from disk: "countries" is bundled as
+data/countries.json, the other layers are downloaded once from the gis-data
+repository into data/geometry/.  Each polygon layer also keeps pre-simplified
+levels of detail under data/cache/geometry/, and select_lod() picks the
+coarsest one that still looks exact at the map's zoom and height.
+
+compact() turns a GeoDataFrame into the record list handed to a pydeck
+GeoJsonLayer, with rounded coordinates and only the properties the layer uses.
+
+Download the sources and build every level of detail with:
+
+    python -m src.utils.geometry
+"""
+import os
+import sys
+import json
+import argparse
+import tempfile
+import numpy as np
+
+from src.utils.resources import lazy_module
+
+gpd = lazy_module("geopandas")
+shapely = lazy_module("shapely")
+
+DATA_DIR = "data"
+GEOMETRY_DIR = os.path.join(DATA_DIR, "geometry")
+LOD_DIR = os.path.join(DATA_DIR, "cache", "geometry")
+REMOTE_PREFIX = "https://raw.githubusercontent.com/harry-oestreicher/gis-data/main/"
+
+LAYERS = {
+    "continents": {"remote": "world/continents.geojson"},
+    "countries": {"remote": "world/countries.json", "local": os.path.join(DATA_DIR, "countries.json")},
+    "countries_hires": {"remote": "world/countries_hires.geojson"},
+    "world_cities": {"remote": "world/world_cities.geojson", "polygons": False},
+    "us": {"remote": "us/us_nation.geojson"},
+    "state": {"remote": "us/us_states.geojson"},
+    "county": {"remote": "us/us_counties.geojson"},
+    "metro": {"remote": "us/us_metro_areas.geojson"},
+}
+
+# Simplification tolerance (degrees) of each level of detail; level 0 is the source.
+LOD_TOLERANCES = [0.0, 0.01, 0.05, 0.15]
+
+# Map height (pixels) the tolerances are tuned for; smaller maps may use coarser levels.
+REFERENCE_HEIGHT = 900
+
+# Decimal places kept by compact(); 3 is about 100 m at the equator.
+DEFAULT_PRECISION = 3
+
+
+def local_path(name):
+    layer = LAYERS[name]
+    return layer.get("local", os.path.join(GEOMETRY_DIR, os.path.basename(layer["remote"])))
+
+
+def lod_path(name, lod):
+    return os.path.join(LOD_DIR, f"{name}.lod{lod}.geojson")
+
+
+def remote_url(name):
+    return REMOTE_PREFIX + LAYERS[name]["remote"]
+
+
+def write_geojson(gdf, path):
+    """
+    Write gdf to path through a temporary file of its own, so concurrent
+    writers of the same path never interleave.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(suffix=".geojson", dir=os.path.dirname(path))
+    os.close(fd)
+    try:
+        gdf.to_file(tmp, driver="GeoJSON")
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def fetch_source(name):
+    """
+    Download a layer into data/geometry/ so later reads never touch the network.
+    """
+    path = local_path(name)
+    gdf = gpd.read_file(remote_url(name))
+    write_geojson(gdf, path)
+    return path
+
+
+def read_source(name):
+    path = local_path(name)
+    if not os.path.exists(path):
+        fetch_source(name)
+    return gpd.read_file(path)
+
+
+def build_lod(name, lod):
+    gdf = read_source(name)
+    gdf["geometry"] = gdf.geometry.simplify(LOD_TOLERANCES[lod], preserve_topology=True)
+    path = lod_path(name, lod)
+    write_geojson(gdf, path)
+    return gdf
+
+
+def read_layer(name, lod=0):
+    """
+    Load a layer at a level of detail (0 = full resolution) from disk.
+    """
+    if lod == 0 or not LAYERS[name].get("polygons", True):
+        return read_source(name)
+    path = lod_path(name, lod)
+    if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(local_path(name)):
+        return gpd.read_file(path)
+    return build_lod(name, lod)
+
+
+def select_lod(zoom, height=REFERENCE_HEIGHT, tile_size=512):
+    """
+    Return the coarsest level of detail whose tolerance stays below one pixel
+    at this zoom; maps shorter than REFERENCE_HEIGHT tolerate proportionally more.
+    """
+    degrees_per_pixel = 360.0 / (tile_size * 2 ** zoom)
+    budget = degrees_per_pixel * max(1.0, REFERENCE_HEIGHT / float(height))
+    lod = 0
+    for level, tolerance in enumerate(LOD_TOLERANCES):
+        if tolerance <= budget:
+            lod = level
+    return lod
+
+
+def payload_size(records):
+    return len(json.dumps(records, separators=(",", ":"), default=str).encode())
+
+
+def _geo_records(gdf):
+    # The records pydeck builds from a GeoDataFrame's __geo_interface__
+    records = []
+    for feature in gdf.__geo_interface__["features"]:
+        record = dict(feature["properties"])
+        record["geometry"] = feature["geometry"]
+        records.append(record)
+    return records
+
+
+def compact(gdf, columns=None, precision=DEFAULT_PRECISION, tolerance=0.0, report=False):
+    """
+    Build the GeoJsonLayer records for gdf: simplify by tolerance (degrees,
+    topology preserving), snap coordinates to precision decimal places and
+    keep only the properties in columns.  NaN properties become null.
+
+    Returns the records and, when report is set, a (before, after) tuple of
+    JSON byte sizes, where before is what pydeck would send for gdf as is.
+    """
+    geoms = gdf.geometry.to_numpy()
+    if tolerance:
+        geoms = shapely.simplify(geoms, tolerance, preserve_topology=True)
+    grid = 10.0 ** -precision
+    geoms = shapely.set_precision(geoms, grid)
+    geoms = shapely.transform(geoms, lambda coords: np.round(coords, precision))
+
+    if columns is None:
+        columns = [c for c in gdf.columns if c != gdf.geometry.name]
+    props = gdf[columns].astype(object)
+    props = props.where(props.notna(), None).to_dict(orient="records")
+
+    records = []
+    for record, geom in zip(props, geoms):
+        if geom is None or geom.is_empty:
+            continue
+        record["geometry"] = shapely.geometry.mapping(geom)
+        records.append(record)
+
+    if not report:
+        return records, None
+    return records, (payload_size(_geo_records(gdf)), payload_size(records))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Download map layers and build their levels of detail")
+    parser.add_argument("layers", nargs="*", default=list(LAYERS), help="layers to prepare (default: all)")
+    parser.add_argument("--offline", action="store_true", help="only build levels of detail for layers already on disk")
+    args = parser.parse_args(argv)
+
+    for name in args.layers:
+        if not os.path.exists(local_path(name)):
+            if args.offline:
+                print(f"{name}: not on disk, skipped")
+                continue
+            fetch_source(name)
+        if LAYERS[name].get("polygons", True):
+            for lod in range(1, len(LOD_TOLERANCES)):
+                build_lod(name, lod)
+        print(f"{name}: {local_path(name)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
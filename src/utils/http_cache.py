@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+On-disk HTTP cache for the "Fetch data from github?" option.
+
+Downloaded files are stored by content hash under data/cache/http/objects/,
+and data/cache/http/urls/ records, per URL, the object it resolved to with
+its ETag and Last-Modified headers.  A cached URL is revalidated with
+If-None-Match / If-Modified-Since, so an unchanged file costs one 304 round
+trip and survives server restarts.  When the remote cannot be reached (or
+keeps failing with 5xx) the last cached copy is used, and failing that the
+bundled file of the same name in data/; other error statuses are raised.
+
+All requests go through one pooled requests.Session with timeouts and
+retries; pass your own session (or point the URLs at a local server) to
+exercise the cache without GitHub.
+
+    python -m src.utils.http_cache https://raw.githubusercontent.com/.../umr_data_DM_.csv
+"""
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import functools
+import tempfile
+
+from src.utils.resources import lazy_module
+
+requests = lazy_module("requests")
+
+DATA_DIR = "data"
+CACHE_DIR = os.path.join(DATA_DIR, "cache", "http")
+
+# (connect, read) timeouts in seconds.
+TIMEOUT = (5, 60)
+RETRIES = 3
+
+
+def is_url(path):
+    return isinstance(path, str) and path.startswith(("http://", "https://"))
+
+
+def make_session(retries=RETRIES, pool_size=16):
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class HttpCache:
+    """
+    Content-addressed cache of HTTP GETs; fetch(url) returns a local path.
+    """
+    def __init__(self, cache_dir=CACHE_DIR, session=None, timeout=TIMEOUT, fallback_dir=DATA_DIR):
+        self.cache_dir = cache_dir
+        self.session = session if session is not None else make_session()
+        self.timeout = timeout
+        self.fallback_dir = fallback_dir
+
+    def _url_path(self, url):
+        return os.path.join(self.cache_dir, "urls", hashlib.sha256(url.encode()).hexdigest() + ".json")
+
+    def object_path(self, sha256):
+        return os.path.join(self.cache_dir, "objects", sha256[:2], sha256)
+
+    def entry(self, url):
+        try:
+            with open(self._url_path(url)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(self.object_path(entry["sha256"])):
+            return None
+        return entry
+
+    def _write_entry(self, url, entry):
+        path = self._url_path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(entry, f, indent=2)
+        os.replace(tmp, path)
+
+    def _store(self, response):
+        # Stream the body to a temporary file while hashing it, then move it into place.
+        objects = os.path.join(self.cache_dir, "objects")
+        os.makedirs(objects, exist_ok=True)
+        digest = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=objects, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    digest.update(chunk)
+                    f.write(chunk)
+            sha = digest.hexdigest()
+            path = self.object_path(sha)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        return sha
+
+    def fallback_path(self, url):
+        path = os.path.join(self.fallback_dir, os.path.basename(url.split("?")[0]))
+        return path if os.path.exists(path) else None
+
+    def fetch(self, url):
+        """
+        Return (local path, status), status being "downloaded", "not-modified",
+        "cached" (remote unreachable) or "fallback" (bundled data/ copy).
+        Any other HTTP error status raises requests.HTTPError.
+        """
+        entry = self.entry(url)
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+                if response.status_code == 304 and entry is not None:
+                    entry["checked"] = time.time()
+                    self._write_entry(url, entry)
+                    return self.object_path(entry["sha256"]), "not-modified"
+                response.raise_for_status()
+                sha = self._store(response)
+                self._write_entry(url, {
+                    "url": url,
+                    "sha256": sha,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "checked": time.time(),
+                })
+                return self.object_path(sha), "downloaded"
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.RetryError):
+            # Unreachable or failing remote; an HTTP error such as 404 or 403 is raised.
+            if entry is not None:
+                return self.object_path(entry["sha256"]), "cached"
+            fallback = self.fallback_path(url)
+            if fallback is not None:
+                return fallback, "fallback"
+            raise
+
+
+@functools.lru_cache(maxsize=None)
+def default_cache():
+    return HttpCache()
+
+
+def resolve(path):
+    """
+    Map a URL to a local copy through the default cache; local paths pass through.
+    """
+    if not is_url(path):
+        return path
+    return default_cache().fetch(path)[0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch URLs into the on-disk HTTP cache")
+    parser.add_argument("urls", nargs="+")
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    args = parser.parse_args(argv)
+
+    cache = HttpCache(args.cache_dir)
+    failed = 0
+    for url in args.urls:
+        try:
+            path, status = cache.fetch(url)
+            print(f"{status:12} {url} -> {path}")
+        except requests.RequestException as e:
+            print(f"{'failed':12} {url}: {e}")
+            failed += 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel warm-up of the shared datasets.
+
+warm_up() reads every indicator group, the reference NMR and SMR files and
+the indicator cube concurrently on a thread pool (pandas and pyarrow release
+the GIL while parsing) into the process-wide tables of src/utils/datasets.py,
+so the first visitor pays for one parallel load and every later group switch,
+in any session, is served from memory.
+
+A task that fails is recorded in failed_tasks() and otherwise ignored: the
+warm-up only fills caches, and a page that needs that dataset loads it
+itself on first use.
+"""
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from src.utils.data_store import list_sources
+from src.utils.datasets import table
+
+_warm_lock = threading.Lock()
+_warm = False
+_failures = {}
+
+
+def _load_cube():
+    from src.utils.cube import cube_version, load_cube
+    return load_cube(cube_version())
+
+
+def warm_up_tasks():
+    """
+    Name -> zero-argument loader for everything warm_up() preloads.
+    """
+    tasks = {name: (lambda path=path: table(path)) for name, path in list_sources().items()}
+    tasks["indicator cube"] = _load_cube
+    return tasks
+
+
+def _timed(task):
+    start = time.perf_counter()
+    task()
+    return time.perf_counter() - start
+
+
+def is_warm():
+    return _warm
+
+
+def failed_tasks():
+    """
+    Name -> exception of the warm-up tasks that raised.
+    """
+    return dict(_failures)
+
+
+def warm_up(max_workers=None, progress=None):
+    """
+    Run every warm-up task on a thread pool, once per process.  progress, if
+    given, is called from the calling thread as progress(done, total, name)
+    after each task.  Returns {name: seconds} of the tasks that succeeded;
+    empty when already warm.
+    """
+    global _warm
+    with _warm_lock:
+        if _warm:
+            return {}
+        tasks = warm_up_tasks()
+        timings = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(_timed, task): name for name, task in tasks.items()}
+            for done, future in enumerate(as_completed(futures), start=1):
+                name = futures[future]
+                try:
+                    timings[name] = future.result()
+                except Exception as e:
+                    _failures[name] = e
+                if progress is not None:
+                    progress(done, len(tasks), name)
+        _warm = True
+        return timings
+
+
+def warm_up_with_notification():
+    """
+    In a Streamlit script: warm up on the first visit, reporting progress in
+    the stNotification banner.
+    """
+    if _warm:
+        return
+    from src.utils.streamlit_gui import stNotification
+
+    with stNotification("Loading indicator data ...") as notification:
+        warm_up(progress=lambda done, total, name: notification.update(f"Loaded {name} ({done}/{total})"))
+    failures = failed_tasks()
+    if failures:
+        import streamlit as st
+        st.sidebar.caption("Not preloaded: " + ", ".join(sorted(failures)))
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Normalized NMR/SMR tables of the NMR_SMR page.
+
+nmr_smr_merged.csv repeats each country-year NMR on every SMR row, once per
+age band and rank.  split() keeps one NMR row per country-year and the SMR
+rows without it; chart_frame() joins them on demand for one age band and
+year, with the SMR rows of a country-year averaged, so the chart has one
+point per country.  chart_points() cuts more countries than
+MAX_CHART_POINTS down with LTTB (src/utils/downsample.py) before they reach
+the browser.
+
+    nmr, smr = split(view(dataset_path("NMR_SMR")))
+    chart = chart_frame(nmr, smr, age="Y10T19")
+"""
+import re
+
+from src.utils.downsample import downsample
+
+MAX_CHART_POINTS = 500
+KEYS = ["REF_AREA", "TIME_PERIOD"]
+
+
+def split(df):
+    """
+    The (nmr, smr) tables of a merged NMR/SMR frame:
+    nmr has REF_AREA, TIME_PERIOD, AGE, NMR and smr has REF_AREA, TIME_PERIOD, AGE, SMR, RANK.
+    """
+    nmr = (df[KEYS + ["AGE_y", "NMR"]].rename(columns={"AGE_y": "AGE"})
+           .drop_duplicates(subset=KEYS).sort_values(KEYS).reset_index(drop=True))
+    smr = (df[KEYS + ["AGE_x", "SMR", "RANK"]].rename(columns={"AGE_x": "AGE"})
+           .sort_values(KEYS, kind="stable").reset_index(drop=True))
+    return nmr, smr
+
+
+def age_bands(smr):
+    """
+    The SMR age bands, widest first.
+    """
+    def width(code):
+        bounds = re.match(r"Y(\d+)T(\d+)$", code)
+        return int(bounds.group(2)) - int(bounds.group(1)) if bounds else -1
+    return sorted(smr["AGE"].astype(str).unique(), key=lambda code: (-width(code), code))
+
+
+def chart_frame(nmr, smr, age, year=None):
+    """
+    NMR and mean SMR of one age band per country, in one year or averaged
+    over the years that have both.
+    """
+    rates = smr[smr["AGE"] == age]
+    if year is not None:
+        rates = rates[rates["TIME_PERIOD"] == year]
+        nmr = nmr[nmr["TIME_PERIOD"] == year]
+    rates = rates.groupby(KEYS, observed=True, as_index=False)["SMR"].mean()
+    df = nmr[KEYS + ["NMR"]].merge(rates, on=KEYS, how="inner")
+    if year is None:
+        df = df.groupby("REF_AREA", observed=True, as_index=False)[["NMR", "SMR"]].mean()
+    return df.sort_values("REF_AREA").reset_index(drop=True)
+
+
+def chart_points(chart, max_points=MAX_CHART_POINTS):
+    """
+    At most max_points rows of a chart_frame(), and the REF_AREA codes left
+    out.  The SMR is downsampled as a series over the NMR, so the countries
+    kept follow the shape of the SMR/NMR relation rather than the order of
+    their names.
+    """
+    if len(chart) <= max_points:
+        return chart, []
+    by_rate = chart.dropna(subset=["NMR", "SMR"]).sort_values("NMR", kind="stable")
+    kept = downsample(by_rate, "SMR", max_points, x="NMR").sort_values("REF_AREA")
+    dropped = chart.loc[~chart.index.isin(kept.index), "REF_AREA"].astype(str).tolist()
+    return kept.reset_index(drop=True), dropped
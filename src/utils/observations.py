@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Typed observation values.
+
+The OBS_VALUE column of the SDMX exports mixes numbers with qualitative or
+censored entries ("Yes", "No", "Very_High", "<100", ">95", ...).  At ingest it
+is split into a float64 OBS_VALUE, NaN where the entry is not a number, and a
+categorical OBS_FLAG holding the original text of those entries.  Pages can
+then use OBS_VALUE directly, without scanning strings.
+"""
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+VALUE_COLUMN = "OBS_VALUE"
+FLAG_COLUMN = "OBS_FLAG"
+
+
+def split_observations(df, column=VALUE_COLUMN, flag_column=FLAG_COLUMN):
+    """
+    Replace df[column] by its numeric values and add flag_column right after
+    it with the non-numeric entries.  Frames that were already split only get
+    their dtypes restored (float64 values, categorical flags).
+    """
+    if column not in df.columns:
+        return df
+    raw = df[column]
+    if flag_column in df.columns:
+        flags = df[flag_column]
+        values = raw
+    elif is_numeric_dtype(raw):
+        flags = pd.Series(pd.NA, index=df.index, dtype=object)
+        values = raw
+    else:
+        values = pd.to_numeric(raw, errors="coerce")
+        text = raw.astype(str).str.strip()
+        flags = text.where(values.isna() & raw.notna())
+
+    df[column] = values.astype("float64")
+    if not isinstance(flags.dtype, pd.CategoricalDtype):
+        flags = flags.astype("category")
+    if flag_column in df.columns:
+        df[flag_column] = flags
+    else:
+        df.insert(df.columns.get_loc(column) + 1, flag_column, flags)
+    return df
+
+
+def parse_report(df, column=VALUE_COLUMN, flag_column=FLAG_COLUMN, top=10):
+    """
+    Summarize a split frame: how many rows are numeric, flagged or empty, and
+    the most frequent flags.
+    """
+    if column not in df.columns:
+        return None
+    numeric = int(df[column].notna().sum())
+    flagged = int(df[flag_column].notna().sum()) if flag_column in df.columns else 0
+    report = {
+        "rows": len(df),
+        "numeric": numeric,
+        "flagged": flagged,
+        "missing": len(df) - numeric - flagged,
+    }
+    if flagged:
+        counts = df[flag_column].value_counts()
+        if top is not None:
+            counts = counts.head(top)
+        report["flags"] = {str(k): int(v) for k, v in counts.items() if v}
+    return report
+
+
+def merge_reports(reports, top=10):
+    """
+    Combine the parse reports of the chunks of one file.
+    """
+    reports = [r for r in reports if r is not None]
+    if not reports:
+        return None
+    merged = {key: sum(r[key] for r in reports) for key in ["rows", "numeric", "flagged", "missing"]}
+    flags = {}
+    for r in reports:
+        for flag, count in r.get("flags", {}).items():
+            flags[flag] = flags.get(flag, 0) + count
+    if flags:
+        merged["flags"] = dict(sorted(flags.items(), key=lambda kv: -kv[1])[:top])
+    return merged
+
+
+def format_report(name, report):
+    line = f"{name}: {report['numeric']} numeric, {report['flagged']} flagged, {report['missing']} missing"
+    if report.get("flags"):
+        line += " (" + ", ".join(f"{k}: {v}" for k, v in report["flags"].items()) + ")"
+    return line
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Data pipelines behind the pages, importable without Streamlit.
+
+The pages call these through st.cache_data and the on-disk artifact cache
+(src/utils/artifacts.py); `python -m src.utils.precompute` runs them for every
+group, indicator and year ahead of the first visitor.
+"""
+import pandas as pd
+
+from src.utils.centroids import load_centroids
+from src.utils.dimensions import decode
+from src.utils.geometry import DEFAULT_PRECISION, compact, read_layer
+from src.utils.nmr_smr import split
+from src.utils.datasets import select, view
+from src.utils.timing import span
+
+NMR_INDICATOR = "DM_NET_MG_RATE"
+
+# Indicator groups offered on the map page, by label.
+MAP_GROUPS = {
+    "Demographic": "DM_",
+    "Migratory": "MG_",
+    "Water Services": "WS_",
+    "Maternal, Newborn, and Child Health": "MNCH_",
+    "PT_": "PT_",
+}
+MAP_YEAR = 2021
+MAP_SCALE = "countries"
+POINT_COLUMNS = ["id", "name", "TIME_PERIOD", "INDICATOR", "OBS_VALUE", "long", "lat"]
+
+
+def join_attributes(gdf, df, category):
+    new_gdf = None
+    if category == "county":
+        new_gdf = gdf.merge(df, left_on="GEOID", right_on="county_fips", how="outer")
+    elif category == "state":
+        new_gdf = gdf.merge(df, left_on="STUSPS", right_on="STUSPS", how="outer")
+    elif category == "us":
+        if "geo_country" in df.columns.values.tolist():
+            df = df.copy()  # df may be a read-only view of a shared table
+            df["country"] = None
+            df.loc[0, "country"] = "United States"
+        new_gdf = gdf.merge(df, left_on="NAME", right_on="country", how="outer")
+    elif category == "countries":
+        new_gdf = gdf.merge(df, left_on="id", right_on="REF_AREA", how="outer")
+    elif category == "countries_hires":
+        new_gdf = gdf.merge(df, left_on="ISO_A3", right_on="REF_AREA", how="outer")
+        new_gdf.rename(columns={'ISO_A3': 'id'}, inplace=True)
+
+    # new_gdf['INDICATOR'] = 'Net Migration Rate'
+
+    new_gdf = new_gdf[~new_gdf["id"].isna()]
+    new_gdf = new_gdf.drop(columns=["REF_AREA"])
+    return new_gdf
+
+
+def join_indicator(gdf, df, indicator):
+    new_gdf = None
+    if indicator == "DM_":
+        new_gdf = gdf.merge(df, left_on=["id"], right_on=["REF_AREA"], how="outer")
+    elif indicator == "ECON_":
+        new_gdf = gdf.merge(df, left_on=["id"], right_on=["REF_AREA"], how="outer")
+    elif indicator == "MG_":
+        new_gdf = gdf.merge(df, left_on=["id"], right_on=["REF_AREA"], how="outer")
+    elif indicator == "MNCH_":
+        new_gdf = gdf.merge(df, left_on=["id"], right_on=["REF_AREA"], how="outer")
+    elif indicator == "PT_":
+        new_gdf = gdf.merge(df, left_on=["id"], right_on=["REF_AREA"], how="outer")
+    elif indicator == "WS_":
+        new_gdf = gdf.merge(df, left_on=["id"], right_on=["REF_AREA"], how="outer")
+        new_gdf = new_gdf[~new_gdf["id"].isna()]
+    new_gdf = new_gdf[~new_gdf["long"].isna()]
+    return new_gdf
+
+
+def select_non_null(gdf, col_name):
+    new_gdf = gdf[~gdf[col_name].isna()]
+    return new_gdf
+
+
+def select_null(gdf, col_name):
+    new_gdf = gdf[gdf[col_name].isna()]
+    return new_gdf
+
+
+def scale_centroids(category):
+    gdf = read_layer(category)
+    if category == "countries_hires":
+        gdf = gdf.rename(columns={"ISO_A3": "id"})
+    return load_centroids(gdf, category)
+
+
+def choropleth_frames(category, year, lod, reference_path):
+    """
+    The NMR choropleth of one year: geometry joined with the reference rates,
+    split into the features with a value (sorted by it) and those without.
+    """
+    df = view(reference_path, year_min=year, year_max=year,
+              columns=["REF_AREA", "TIME_PERIOD", "INDICATOR", "OBS_VALUE"])
+    with span("read_layer"):
+        layer = read_layer(category, lod)
+    with span("join_attributes"):
+        gdf = join_attributes(layer, df, category)
+    gdf_null = select_null(gdf, "OBS_VALUE")
+    gdf = select_non_null(gdf, "OBS_VALUE").sort_values(by="OBS_VALUE", ascending=True)
+    return gdf, gdf_null
+
+
+def choropleth_records(category, year, lod, reference_path, precision=DEFAULT_PRECISION):
+    """
+    choropleth_frames() as compact GeoJsonLayer records, with the INDICATOR
+    decoded for the tooltip: a frame of the features with a value, the record
+    list of those without, and the (before, after) JSON sizes of the former.
+    """
+    gdf, gdf_null = choropleth_frames(category, year, lod, reference_path)
+    columns = ["name", "INDICATOR", "OBS_VALUE"]
+    with span("compact"):
+        records, sizes = compact(decode(gdf, ["INDICATOR"]), columns, precision, report=True)
+        null_records, _ = compact(decode(gdf_null, ["INDICATOR"]), columns, precision)
+    return pd.DataFrame(records, columns=columns + ["geometry"]), null_records, sizes
+
+
+def indicator_points(category, group, indicator, year, indicator_path, age=None, sex=None):
+    """
+    Centroid points of one indicator slice for one year, one per country with
+    a value, sorted by value.
+    """
+    df = select(indicator_path, indicator, year, year, AGE=age, SEX=sex)
+    with span("centroids"):
+        centroids = scale_centroids(category)
+    with span("join_indicator"):
+        gdf = join_indicator(centroids, df, group)
+    gdf = gdf.drop(columns=["REF_AREA"])[POINT_COLUMNS]
+    return select_non_null(gdf, "OBS_VALUE").sort_values(by="OBS_VALUE", ascending=True)
+
+
+def nmr_smr_tables(path):
+    """
+    The normalized NMR and SMR tables of the merged NMR/SMR file.
+    """
+    return split(view(path))
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Pre-traffic warm-up: build every derived artifact the pages read.
+
+Runs the page pipelines without the UI and stores their results in the
+on-disk artifact cache, so a freshly deployed instance serves its first
+request warm:
+
+  * the Parquet store, the _ALL_ view, the indicator cube and the NMR
+    association table of the Top-N page;
+  * map geometry levels of detail and centroids;
+  * the map page's NMR choropleth and the point layer of every indicator in
+    each of its groups, at its default AGE/SEX slice;
+  * the normalized NMR and SMR tables.
+
+    python -m src.utils.precompute            # then: streamlit run Home.py
+"""
+import sys
+import time
+import argparse
+
+from src.utils import pipelines
+from src.utils.all_indicators import refresh_view
+from src.utils.artifacts import cached_artifact, data_version, prune, save_artifact
+from src.utils.data_store import build_store
+from src.utils.datasets import dataset_path, indicators, table
+from src.utils.geometry import DEFAULT_PRECISION, REFERENCE_HEIGHT, select_lod
+from src.utils.loader import failed_tasks, warm_up
+from src.utils.timeline import TIMELINE_DIR
+
+# The map page's initial view, which decides the geometry level of detail.
+MAP_ZOOM = 2
+
+
+def top_n_associations(version):
+    from src.utils.cube import load_cube
+    from src.utils.risk_factors import associations
+    return associations(load_cube(version), year_min=2011)
+
+
+def map_artifacts(version, years=(pipelines.MAP_YEAR,), category=pipelines.MAP_SCALE):
+    """
+    Build the choropleth and every indicator point layer of the map page.
+    Returns the number of artifacts written.
+    """
+    lod = select_lod(MAP_ZOOM, REFERENCE_HEIGHT)
+    count = 0
+    for year in years:
+        ref = dataset_path("NMR")
+        key = (category, year, lod, ref, DEFAULT_PRECISION)
+        cached_artifact("choropleth_records", key, lambda: pipelines.choropleth_records(*key), version)
+        count += 1
+        for group in pipelines.MAP_GROUPS.values():
+            path = dataset_path(group)
+            for indicator in indicators(path, year, year):
+                if indicator == pipelines.NMR_INDICATOR:
+                    continue
+                codes = table(path).default_codes(indicator)
+                key = (category, group, indicator, year, path, codes.get("AGE"), codes.get("SEX"))
+                save_artifact(pipelines.indicator_points(*key), "points", key, version)
+                count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute every page's derived data into data/cache/artifacts/")
+    parser.add_argument("--keep-old", action="store_true", help="keep artifacts of older data versions")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    built = build_store()
+    print(f"data store: {len(built)} datasets rebuilt")
+    refresh_view()
+
+    timings = warm_up()
+    print(f"loaded {len(timings)} tables, including the indicator cube")
+    for name, error in failed_tasks().items():
+        print(f"failed to load {name}: {error!r}")
+
+    from src.utils.cube import cube_version
+    cube = cube_version()
+    version = data_version()
+
+    cached_artifact("associations", (cube,), lambda: top_n_associations(cube), version)
+    print("top-n: NMR association table")
+
+    print(f"map: {map_artifacts(version)} layers")
+
+    path = dataset_path("NMR_SMR")
+    cached_artifact("nmr_smr_tables", (path,), lambda: pipelines.nmr_smr_tables(path), version)
+    print("nmr/smr: normalized tables")
+
+    if not args.keep_old:
+        for old in prune(version):
+            print(f"removed artifacts of data version {old}")
+        for old in prune(version, TIMELINE_DIR):
+            print(f"removed time-series map files of data version {old}")
+    print(f"artifacts for data version {version} ready in {time.perf_counter() - start:,.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Net migration rate ranking index.
+
+The NMR (area, year) matrix of the cube is argsorted once per dataset version:
+per year, and over every country-year together.  The N lowest and highest
+rates for any N and year are then slices of a sorted array, and how often each
+country lands in the top or bottom N is a count over a precomputed rank matrix.
+"""
+import numpy as np
+import pandas as pd
+
+NMR_INDICATOR = "DM_NET_MG_RATE"
+
+
+class RankingIndex:
+    """
+    Ascending orders of an indicator's (area, year) matrix.
+    """
+    def __init__(self, matrix, areas, years, indicator=NMR_INDICATOR):
+        matrix = np.asarray(matrix, dtype=float)
+        self.indicator = indicator
+        self.areas = list(areas)
+        self.years = np.asarray(years, dtype=np.int64)
+        self._matrix = matrix
+        self._year_pos = {int(y): i for i, y in enumerate(self.years)}
+
+        # Per year: area positions with a value, lowest rate first.
+        self._by_year = []
+        low = np.full(matrix.shape, -1, dtype=np.int64)
+        high = np.full(matrix.shape, -1, dtype=np.int64)
+        for j in range(matrix.shape[1]):
+            col = matrix[:, j]
+            order = np.flatnonzero(~np.isnan(col))
+            order = order[np.argsort(col[order], kind="stable")]
+            self._by_year.append(order)
+            low[order, j] = np.arange(len(order))
+            high[order, j] = np.arange(len(order))[::-1]
+        self._low_rank = low
+        self._high_rank = high
+
+        # All years: flat (area, year) positions with a value, lowest rate first.
+        flat = matrix.ravel()
+        order = np.flatnonzero(~np.isnan(flat))
+        self._all_years = order[np.argsort(flat[order], kind="stable")]
+
+    @classmethod
+    def from_cube(cls, cube, indicator=NMR_INDICATOR, year_min=None, year_max=None):
+        keep = np.ones(len(cube.years), dtype=bool)
+        if year_min is not None:
+            keep &= cube.years >= year_min
+        if year_max is not None:
+            keep &= cube.years <= year_max
+        return cls(cube.matrix(indicator)[:, keep], cube.areas, cube.years[keep], indicator)
+
+    def _frame(self, area_idx, year_idx):
+        return pd.DataFrame({
+            "REF_AREA": pd.Categorical.from_codes(area_idx, self.areas),
+            "TIME_PERIOD": self.years[year_idx],
+            "INDICATOR": pd.Categorical([self.indicator] * len(area_idx)),
+            "OBS_VALUE": self._matrix[area_idx, year_idx],
+        })
+
+    def extremes(self, n, year=None):
+        """
+        The n lowest and n highest country-years, for one year or (year=None)
+        across all years, sorted by REF_AREA and rate.
+        """
+        if year is None:
+            order = self._all_years
+            picked = np.concatenate([order[:n], order[-n:] if n else order[:0]])
+            area_idx, year_idx = np.divmod(picked, len(self.years))
+        else:
+            if int(year) not in self._year_pos:
+                return self._frame(np.array([], dtype=np.int64), np.array([], dtype=np.int64))
+            j = self._year_pos[int(year)]
+            order = self._by_year[j]
+            area_idx = np.concatenate([order[:n], order[-n:] if n else order[:0]])
+            year_idx = np.full(len(area_idx), j)
+        df = self._frame(area_idx, year_idx)
+        return df.sort_values(["REF_AREA", "OBS_VALUE"], kind="stable").reset_index(drop=True)
+
+    def stability(self, n, years=None):
+        """
+        For every country that is among the n lowest or n highest in at least
+        one of the given years (default: all), the number of those years it
+        was in the bottom and in the top n, most persistent first.
+        """
+        cols = np.arange(len(self.years)) if years is None else \
+            np.array([self._year_pos[int(y)] for y in years if int(y) in self._year_pos], dtype=np.int64)
+        low = self._low_rank[:, cols]
+        high = self._high_rank[:, cols]
+        bottom = ((low >= 0) & (low < n)).sum(axis=1)
+        top = ((high >= 0) & (high < n)).sum(axis=1)
+        ranked = (~np.isnan(self._matrix[:, cols])).sum(axis=1)
+        keep = np.flatnonzero((bottom > 0) | (top > 0))
+        df = pd.DataFrame({
+            "REF_AREA": pd.Categorical.from_codes(keep, self.areas),
+            "Years in bottom N": bottom[keep],
+            "Years in top N": top[keep],
+            "Years ranked": ranked[keep],
+        })
+        df["Most years at one extreme"] = df[["Years in bottom N", "Years in top N"]].max(axis=1)
+        df = df.sort_values(["Most years at one extreme", "REF_AREA"], ascending=[False, True], kind="stable")
+        return df.drop(columns="Most years at one extreme").reset_index(drop=True)
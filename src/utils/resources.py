@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+On-demand loading of heavy dependencies.
+
+    pdk = lazy_module("pydeck")
+
+binds pdk without importing pydeck; the import happens on first attribute
+access, so a page only pays for the libraries its current rerun touches.
+"""
+import importlib
+
+
+class LazyModule:
+    """
+    Module proxy that imports the real module on first attribute access.
+    """
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_module(name):
+    return LazyModule(name)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Association of every indicator with net migration rate.
+
+All indicators of the cube are compared with the NMR matrix in one pass:
+for each lag k the indicator at year t is paired with NMR at year t + k over
+every country, and the Pearson and Spearman correlations and the number of
+country-years behind them are computed as masked array reductions, with no
+per-indicator merge.
+"""
+import numpy as np
+import pandas as pd
+
+from src.utils.ranking import NMR_INDICATOR
+
+DEFAULT_LAGS = (0, 1, 2, 3)
+
+# Correlations over fewer country-years than this are reported as NaN.
+MIN_PAIRS = 30
+
+
+def _masked_pearson(x, y, mask):
+    # Row-wise Pearson r of x and y (indicator, pair) over the pairs in mask.
+    n = mask.sum(axis=1)
+    x = np.where(mask, x, 0.0)
+    y = np.where(mask, y, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mx = x.sum(axis=1) / n
+        my = y.sum(axis=1) / n
+        dx = np.where(mask, x - mx[:, None], 0.0)
+        dy = np.where(mask, y - my[:, None], 0.0)
+        r = (dx * dy).sum(axis=1) / np.sqrt((dx * dx).sum(axis=1) * (dy * dy).sum(axis=1))
+    return n, r
+
+
+def _masked_ranks(values, mask):
+    # Average ranks along each row, counting only the entries in mask.
+    ranked = pd.DataFrame(np.where(mask, values, np.nan)).rank(axis=1)
+    return ranked.to_numpy()
+
+
+def associations(cube, target=NMR_INDICATOR, lags=DEFAULT_LAGS, year_min=None, year_max=None,
+                 min_pairs=MIN_PAIRS):
+    """
+    Return one row per (indicator, lag) with the pair count and the Pearson
+    and Spearman correlation against target, strongest Spearman first.
+    """
+    keep = np.ones(len(cube.years), dtype=bool)
+    if year_min is not None:
+        keep &= cube.years >= year_min
+    if year_max is not None:
+        keep &= cube.years <= year_max
+    values = np.asarray(cube.values)[:, :, keep]
+    nmr = np.asarray(cube.matrix(target))[:, keep]
+    years = cube.years[keep]
+
+    codes = [c for c in cube.indicators if c != target]
+    rows = np.array([cube.indicators.index(c) for c in codes], dtype=np.int64)
+    values = values[rows]
+    group_of = {}
+    for group, members in cube.groups.items():
+        for code in members:
+            group_of.setdefault(code, group)
+
+    frames = []
+    for lag in lags:
+        # Pair by calendar year, so a gap in the years never stretches the lag
+        later = np.searchsorted(years, years + lag)
+        paired = later < len(years)
+        paired[paired] = years[later[paired]] == years[paired] + lag
+        if not paired.any():
+            continue
+        x = values[:, :, paired].reshape(len(codes), -1)
+        y = np.broadcast_to(nmr[:, later[paired]].reshape(1, -1), x.shape)
+        mask = ~np.isnan(x) & ~np.isnan(y)
+        n, pearson = _masked_pearson(x, y, mask)
+        _, spearman = _masked_pearson(_masked_ranks(x, mask), _masked_ranks(y, mask), mask)
+        too_few = n < min_pairs
+        frames.append(pd.DataFrame({
+            "INDICATOR": codes,
+            "GROUP": [group_of.get(c) for c in codes],
+            "LAG": lag,
+            "N": n,
+            "PEARSON": np.where(too_few, np.nan, pearson),
+            "SPEARMAN": np.where(too_few, np.nan, spearman),
+        }))
+
+    if not frames:
+        return pd.DataFrame(columns=["INDICATOR", "GROUP", "LAG", "N", "PEARSON", "SPEARMAN"])
+    df = pd.concat(frames, ignore_index=True)
+    order = df["SPEARMAN"].abs().sort_values(ascending=False, na_position="last", kind="stable").index
+    return df.loc[order].reset_index(drop=True)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Import-time profiler for the app's entry points.
+
+For each script, the top-level import statements are run in a fresh
+interpreter under `python -X importtime`, and the cost of every module they
+pull in is reported.  With --budget-ms the command fails when a script's
+imports take longer than the budget, so first-page latency can be checked
+in CI.
+
+    python -m src.utils.startup                      # Home.py and every page
+    python -m src.utils.startup pages/01_*.py --top 15 --budget-ms 1500
+"""
+import os
+import re
+import sys
+import ast
+import glob
+import argparse
+import subprocess
+
+DEFAULT_SCRIPTS = ["Home.py"] + sorted(glob.glob(os.path.join("pages", "*.py")))
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_statements(path):
+    """
+    Return the source of the module-level import statements of a script.
+    """
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    tree = ast.parse(source)
+    nodes = [n for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.get_source_segment(source, n) for n in nodes)
+
+
+def parse_importtime(stderr):
+    """
+    Parse -X importtime output into (module, self_us, cumulative_us, depth) rows.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+
+def _importtime(code, python):
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=os.getcwd(),
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.splitlines()[-1])
+    return parse_importtime(proc.stderr)
+
+
+def profile_script(path, python=sys.executable):
+    """
+    Run the script's imports in a fresh interpreter; return the parsed rows,
+    leaving out the modules every interpreter loads at startup.
+    """
+    baseline = {row[0] for row in _importtime("pass", python)}
+    try:
+        rows = _importtime(import_statements(path), python)
+    except RuntimeError as e:
+        raise RuntimeError(f"importing {path} failed: {e}")
+    return [row for row in rows if row[0] not in baseline]
+
+
+def report(path, rows, top=10):
+    direct = [r for r in rows if r[3] == 0]
+    total_ms = sum(r[2] for r in direct) / 1000.0
+    lines = [f"{path}: {total_ms:,.0f} ms in {len(rows)} modules"]
+    for module, _, cumulative_us, _ in sorted(direct, key=lambda r: -r[2])[:top]:
+        lines.append(f"  {cumulative_us / 1000.0:9,.1f} ms  {module}")
+    return total_ms, "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report per-module import cost of the app's scripts")
+    parser.add_argument("scripts", nargs="*", default=DEFAULT_SCRIPTS)
+    parser.add_argument("--top", type=int, default=10, help="number of modules listed per script")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail when a script's imports exceed this")
+    args = parser.parse_args(argv)
+
+    over_budget = []
+    for path in args.scripts:
+        total_ms, text = report(path, profile_script(path), args.top)
+        print(text)
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            over_budget.append(path)
+
+    if over_budget:
+        print(f"over the {args.budget_ms:,.0f} ms budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
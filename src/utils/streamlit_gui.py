@@ -1,5 +1,8 @@
 import streamlit as st
 
+from src.utils.catalog import load_catalog
+from src.utils.dimensions import dimension
+
 
 def local_css(file_name):
     with open(file_name) as f:
@@ -28,17 +31,22 @@ class stNotification:
 
     def __init__(self, text="lorem", spinner=True):
         "Getting default theme and building style"
-        styles = self.build_style()
+        self.styles = self.build_style()
+        self.spinner = spinner
+        self.notification = self.build_notification(text)
+
+    def build_notification(self, text):
+        styles = self.styles
 
         "Spinner"
-        if spinner:
+        if self.spinner:
             loader = f'<div ><div class = "loader" style ="line-height: 2rem;text-align: center;border-left: 0.3em solid {styles["pc"]};" ></div></div>'
         else:
             loader = '<br>'
 #            <div class="custom-notification" style="font-size:0.8rem;min-width:40%;max-width:62%;top:0rem;background-color: #0E1117;border-bottom-right-radius: 9px;border-bottom-left-radius: 9px;padding: 0.5rem;position: fixed;line-height: 2rem;text-align: center;border-left: 2px solid {styles['pc']};border-right: 2px solid {styles['pc']};border-bottom: 2px solid {styles['pc']}">
 
         "Building notification object"
-        self.notification = f'''
+        return f'''
             <div class="custom-notification" style="font-size:0.8rem;min-width:40%;max-width:62%;top:0rem;background-color: {styles["bc"]};padding: 0.5rem;position: fixed;line-height: 2rem;text-align: center;border-style: solid;border-width: 2px;border-image: linear-gradient(-90deg,{styles['bc']}, {styles['pc']}) 1;border-top-width:0px;border-right-width:0px;">
                 <div style="display: flex;flex-wrap: nowrap;">
                     {loader}
@@ -49,14 +57,65 @@ class stNotification:
             </div>
             '''
 
+    def update(self, text):
+        "Replacing the text of a notification that is showing"
+        self.notification = self.build_notification(text)
+        self.notification_object.markdown(self.notification, unsafe_allow_html=True)
+
     def __enter__(self):
-        self.notification_object = st.markdown(
-            self.notification, unsafe_allow_html=True)
+        self.notification_object = st.empty()
+        self.notification_object.markdown(self.notification, unsafe_allow_html=True)
+        return self
 
     def __exit__(self, *args, **kwargs):
         self.notification_object.empty()
         
         
+def finish_timing(timer, params=None):
+    """
+    Record this run's stage timings and, if the sidebar box is ticked, show them.
+    """
+    record = timer.finish(params)
+    if st.sidebar.checkbox("Show stage timings", key="show_timings"):
+        with st.sidebar.expander("Stage timings", expanded=True):
+            st.caption(f"{record['page']}: {record['total'] * 1000:,.0f} ms this run")
+            st.dataframe(
+                [{"Stage": s["stage"], "ms": round(s["seconds"] * 1000, 1)} for s in record["spans"]],
+                hide_index=True,
+            )
+    return record
+
+
+def dimension_selectors(table, indicator):
+    """
+    One selectbox per AGE/SEX dimension of the indicator, defaulting to the
+    "_T" total; a dimension with a single code gets no widget.  Each
+    dimension offers the codes published at the ones chosen before it.
+    Returns {dimension: code}.
+    """
+    codes = {}
+    for col in table.dimensions:
+        options = table.dimension_codes(indicator, col, **codes)
+        if len(options) > 1:
+            codes[col] = st.selectbox(f"**{col.title()}:**", options, format_func=dimension(col).label)
+        elif options:
+            codes[col] = options[0]
+    return codes
+
+
+def search_indicators(codes):
+    """
+    A search box over the indicator labels.  Returns the codes that match,
+    or all of codes when nothing does.
+    """
+    query = st.text_input("Search indicators:", placeholder="e.g. water, mortality, DM_")
+    matches = load_catalog().search(query, codes=codes)
+    if not matches:
+        st.caption("No indicator matches the search; showing all.")
+        return codes
+    return matches
+
+
 def set_page_title(title):
     """
     This function sets the app title, and removes the • Streamlit
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""
+Synthetic SDMX-style indicator data for scale and capacity testing.
+
+Writes a complete stand-in for data/: one umr_data_<GROUP>.csv per indicator
+group in the bundled schema (REF_AREA, TIME_PERIOD, INDICATOR, AGE and SEX
+where the group is disaggregated, OBS_VALUE), the umr_eda_NMR.csv reference,
+nmr_smr_merged.csv and a countries.json with one square cell per REF_AREA,
+so the map joins find a geometry for every area.
+
+Area, indicator, year and AGE/SEX cardinalities are configurable; --scale
+multiplies the number of areas, the way sub-national REF_AREAs would.
+Values are area level + year trend + noise per indicator; a share of the
+indicators is qualitative (Yes/No, Very_Low ... Very_High) and a share of the
+numeric values is censored ("<100"), like the bundled HVA_, GN_ and PV_
+groups.  Files are written one indicator-year at a time, so memory stays flat
+at any size.
+
+    python -m src.utils.synthetic --output /tmp/umr_x100 --scale 100
+    python -m src.utils.synthetic --output /tmp/umr_wide --indicators 200 --ages 7 --year-min 2000
+"""
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import numpy as np
+import pandas as pd
+
+from src.utils.pipelines import NMR_INDICATOR
+
+# Bundled groups; those marked True carry AGE and SEX columns.
+GROUPS = {
+    "DM_": False, "ECON_": False, "ED_": False, "GN_": True, "HVA_": True, "IM_": True,
+    "MG_": False, "MNCH_": True, "PT_": True, "PV_": False, "WS_": False, "WT_": True,
+}
+AGE_CODES = ["_T", "Y0T4", "Y5T14", "Y15T24", "Y25T49", "Y50T64", "Y_GE65", "Y0", "Y10T14", "Y15T49", "Y_GE15", "Y_GE25"]
+SEX_CODES = ["_T", "F", "M"]
+QUALITATIVE_SCALES = [["Yes", "No"], ["Very_Low", "Low", "Medium", "High", "Very_High"]]
+CENSOR_THRESHOLDS = [0.01, 1, 100, 200, 500]
+
+# Cardinalities of the bundled data.
+AREAS = 250
+INDICATORS = 16
+YEAR_MIN = 2012
+YEAR_MAX = 2022
+AGES = 2
+SEXES = 3
+DENSITY = 0.4
+
+NMR_FILE = "umr_eda_NMR.csv"
+NMR_SMR_FILE = "nmr_smr_merged.csv"
+GEOMETRY_FILE = "countries.json"
+
+
+def group_names(n):
+    """
+    The bundled group prefixes, then S01_, S02_, ... when more are asked for.
+    """
+    names = list(GROUPS)[:n]
+    return names + [f"S{i:02d}_" for i in range(1, n - len(names) + 1)]
+
+
+def area_codes(n):
+    width = max(4, len(str(n - 1)))
+    return [f"X{i:0{width}d}" for i in range(n)]
+
+
+def grid_geometry(codes, bounds=(-180.0, -60.0, 180.0, 80.0)):
+    """
+    A GeoJSON FeatureCollection of one square cell per area code, filling
+    bounds row by row; feature ids are the codes, as in data/countries.json.
+    """
+    west, south, east, north = bounds
+    cols = math.ceil(math.sqrt(len(codes) * (east - west) / (north - south)))
+    rows = math.ceil(len(codes) / cols)
+    size = min((east - west) / cols, (north - south) / rows)
+    features = []
+    for i, code in enumerate(codes):
+        x0 = round(west + (i % cols) * size, 5)
+        y0 = round(north - (i // cols + 1) * size, 5)
+        x1, y1 = round(x0 + size, 5), round(y0 + size, 5)
+        features.append({
+            "type": "Feature",
+            "id": code,
+            "properties": {"name": f"Area {code}"},
+            "geometry": {"type": "Polygon", "coordinates": [[[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]]},
+        })
+    return {"type": "FeatureCollection", "features": features}
+
+
+class Generator:
+    """
+    Draws indicator series for a fixed set of areas and years.
+    """
+    def __init__(self, areas, years, density=DENSITY, qualitative=0.1, censored=0.02, seed=0):
+        self.areas = np.array(areas, dtype=object)
+        self.years = np.array(years, dtype=np.int64)
+        self.density = density
+        self.qualitative = qualitative
+        self.censored = censored
+        self.rng = np.random.default_rng(seed)
+
+    def _series(self, n_cells, level, spread):
+        """
+        Per year, (areas, n_cells) values: an area level, a per-area trend and noise.
+        """
+        rng = self.rng
+        base = level + spread * rng.standard_normal((len(self.areas), 1))
+        slope = 0.02 * spread * rng.standard_normal((len(self.areas), 1))
+        offsets = 0.25 * spread * rng.standard_normal((1, n_cells))
+        for y in range(len(self.years)):
+            yield y, base + slope * y + offsets + 0.1 * spread * rng.standard_normal((len(self.areas), n_cells))
+
+    def indicator(self, code, ages, sexes):
+        """
+        Long-format rows of one indicator, one frame per year, over every area
+        and the indicator's AGE/SEX combinations, keeping about density of them.
+        Like the bundled data, an indicator is published for the "_T" totals
+        and a random subset of the other combinations.
+        """
+        rng = self.rng
+        cells = [(a, s) for a in ages for s in sexes]
+        if len(cells) > 1:
+            extra = rng.choice(np.arange(1, len(cells)), rng.integers(0, len(cells)), replace=False)
+            cells = [cells[0]] + [cells[i] for i in sorted(extra)]
+        cell_age = np.array([cell[0] for cell in cells], dtype=object)
+        cell_sex = np.array([cell[1] for cell in cells], dtype=object)
+        labels = None
+        if rng.random() < self.qualitative:
+            labels = np.array(QUALITATIVE_SCALES[rng.integers(len(QUALITATIVE_SCALES))], dtype=object)
+            level, spread = len(labels) / 2.0, len(labels) / 3.0
+        else:
+            level = 10.0 ** rng.uniform(-1, 4)
+            spread = level * rng.uniform(0.1, 0.6)
+        thresholds = np.array(CENSOR_THRESHOLDS, dtype=float)
+
+        for y, values in self._series(len(cells), level, spread):
+            if labels is not None:
+                obs = labels[np.clip(values, 0, len(labels) - 1).astype(int)]
+            else:
+                values = np.abs(values)
+                obs = np.round(values, 4).astype(object)
+                censor = rng.random(values.shape) < self.censored
+                if censor.any():
+                    at = np.minimum(np.searchsorted(thresholds, values[censor]), len(thresholds) - 1)
+                    obs[censor] = [f"<{t:g}" for t in thresholds[at]]
+
+            a, c = np.nonzero(rng.random(values.shape) < self.density)
+            df = pd.DataFrame({
+                "REF_AREA": self.areas[a],
+                "TIME_PERIOD": self.years[y],
+                "INDICATOR": code,
+                "AGE": cell_age[c],
+                "SEX": cell_sex[c],
+                "OBS_VALUE": obs[a, c],
+            })
+            yield df
+
+    def nmr(self):
+        values = np.hstack([v for _, v in self._series(1, 0.0, 8.0)])
+        a, y = np.meshgrid(np.arange(len(self.areas)), np.arange(len(self.years)), indexing="ij")
+        return pd.DataFrame({
+            "REF_AREA": self.areas[a.ravel()],
+            "TIME_PERIOD": self.years[y.ravel()],
+            "INDICATOR": NMR_INDICATOR,
+            "AGE": "_T",
+            "OBS_VALUE": np.round(values.ravel(), 3),
+        })
+
+
+class _CsvWriter:
+    """
+    Append frames to a CSV with a running unnamed index column, like the bundled files.
+    """
+    def __init__(self, path, columns):
+        self.f = open(path, "w", newline="")
+        self.columns = columns
+        self.rows = 0
+
+    def write(self, df):
+        df = df[self.columns]
+        df.index = pd.RangeIndex(self.rows, self.rows + len(df))
+        df.to_csv(self.f, header=(self.rows == 0))
+        self.rows += len(df)
+
+    def close(self):
+        if self.rows == 0:
+            pd.DataFrame(columns=self.columns).to_csv(self.f)
+        self.f.close()
+
+
+def nmr_smr(nmr, rng, ages=("Y10T14", "Y15T19", "Y20T24")):
+    """
+    The merged NMR/SMR table of page 02: an SMR per age band for each NMR row.
+    """
+    rows = nmr.loc[nmr.index.repeat(len(ages))].reset_index(drop=True)
+    rows["AGE_x"] = np.tile(ages, len(nmr))
+    rows["SMR"] = np.round(np.abs(rng.normal(5.0, 3.0, len(rows))), 2)
+    rows["RANK"] = rows.groupby(["TIME_PERIOD", "AGE_x"])["SMR"].rank(ascending=False, method="first").astype(int)
+    rows = rows.rename(columns={"AGE": "AGE_y", "OBS_VALUE": "NMR"})
+    return rows[["REF_AREA", "TIME_PERIOD", "AGE_x", "SMR", "RANK", "AGE_y", "NMR"]]
+
+
+def generate(output, scale=1, areas=AREAS, indicators=INDICATORS, groups=len(GROUPS), year_min=YEAR_MIN,
+             year_max=YEAR_MAX, ages=AGES, sexes=SEXES, density=DENSITY, qualitative=0.1, censored=0.02, seed=0,
+             progress=None):
+    """
+    Write a synthetic data directory to output.  Returns {file name: rows}.
+    """
+    os.makedirs(output, exist_ok=True)
+    codes = area_codes(int(areas * scale))
+    gen = Generator(codes, range(year_min, year_max + 1), density, qualitative, censored, seed)
+    written = {}
+
+    nmr = gen.nmr()
+    writer = _CsvWriter(os.path.join(output, NMR_FILE), list(nmr.columns))
+    writer.write(nmr)
+    writer.close()
+    written[NMR_FILE] = writer.rows
+
+    merged = nmr_smr(nmr, gen.rng)
+    writer = _CsvWriter(os.path.join(output, NMR_SMR_FILE), list(merged.columns))
+    writer.write(merged)
+    writer.close()
+    written[NMR_SMR_FILE] = writer.rows
+
+    for g, group in enumerate(group_names(groups)):
+        disaggregated = GROUPS.get(group, g % 2 == 1)
+        age_codes = AGE_CODES[:max(ages, 1)] if disaggregated else ["_T"]
+        sex_codes = SEX_CODES[:max(sexes, 1)] if disaggregated else ["_T"]
+        columns = ["REF_AREA", "TIME_PERIOD", "INDICATOR"]
+        if disaggregated:
+            columns += ["AGE", "SEX"]
+        columns.append("OBS_VALUE")
+
+        name = f"umr_data_{group}.csv"
+        writer = _CsvWriter(os.path.join(output, name), columns)
+        if group == "DM_":
+            # The NMR series is also published in the demographic group, as in the bundled files.
+            writer.write(nmr.drop(columns=["AGE"]))
+        for i in range(indicators):
+            for df in gen.indicator(f"{group}SYN{i:04d}", age_codes, sex_codes):
+                writer.write(df)
+        writer.close()
+        written[name] = writer.rows
+        if progress is not None:
+            progress(name, writer.rows)
+
+    with open(os.path.join(output, GEOMETRY_FILE), "w") as f:
+        json.dump(grid_geometry(codes), f)
+    written[GEOMETRY_FILE] = len(codes)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write synthetic indicator data in the bundled data/ schema")
+    parser.add_argument("--output", required=True, help="directory to write the files to")
+    parser.add_argument("--scale", type=float, default=1, help="multiplies the number of areas")
+    parser.add_argument("--areas", type=int, default=AREAS)
+    parser.add_argument("--indicators", type=int, default=INDICATORS, help="indicators per group")
+    parser.add_argument("--groups", type=int, default=len(GROUPS))
+    parser.add_argument("--year-min", type=int, default=YEAR_MIN)
+    parser.add_argument("--year-max", type=int, default=YEAR_MAX)
+    parser.add_argument("--ages", type=int, default=AGES, help=f"AGE codes of disaggregated groups (max {len(AGE_CODES)})")
+    parser.add_argument("--sexes", type=int, default=SEXES, help=f"SEX codes of disaggregated groups (max {len(SEX_CODES)})")
+    parser.add_argument("--density", type=float, default=DENSITY, help="share of area-year-AGE-SEX cells with a value")
+    parser.add_argument("--qualitative", type=float, default=0.1, help="share of qualitative indicators")
+    parser.add_argument("--censored", type=float, default=0.02, help="share of censored numeric values")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    written = generate(
+        args.output, args.scale, args.areas, args.indicators, args.groups, args.year_min, args.year_max,
+        min(args.ages, len(AGE_CODES)), min(args.sexes, len(SEX_CODES)), args.density, args.qualitative,
+        args.censored, args.seed, progress=lambda name, rows: print(f"{name}: {rows:,} rows", flush=True),
+    )
+    total = sum(rows for name, rows in written.items() if name.endswith(".csv"))
+    print(f"{total:,} rows and {written[GEOMETRY_FILE]:,} areas written to {args.output} "
+          f"in {time.perf_counter() - start:,.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Multi-year map layers, shipped once as static files.
+
+The map page's time-series mode does not rejoin and resend the polygons when
+the year changes.  Every year of YEARS is precomputed into one file per layer
+under static/timeline/<data version>/, which Streamlit serves at
+app/static/ (server.enableStaticServing in .streamlit/config.toml):
+
+  * the NMR choropleth, a GeoJSON FeatureCollection whose features carry
+    per-year arrays: fill (RGBA, classified over all years together, so one
+    legend holds for every year) and nmr (the rate, used as elevation);
+  * an indicator's point layer, a list of centroids with per-year value and
+    radius arrays.
+
+The page hands pydeck the file's URL and picks the year in the accessors,
+e.g. get_fill_color="properties.fill[21]", so moving the year slider sends
+only the layer properties; the browser fetches each file once.  Per-year
+scalars (value_2021, ...) are kept next to the arrays for the tooltip,
+which cannot index arrays.
+"""
+import os
+import json
+import hashlib
+import tempfile
+import numpy as np
+
+from src.utils.artifacts import data_version
+from src.utils.classify import classify, hex_to_rgb_array
+from src.utils.datasets import select, view
+from src.utils.geometry import DEFAULT_PRECISION, compact, read_layer
+from src.utils.pipelines import NMR_INDICATOR, scale_centroids
+
+YEARS = range(2000, 2022 + 1)
+STATIC_DIR = "static"
+TIMELINE_DIR = os.path.join(STATIC_DIR, "timeline")
+STATIC_URL = "app/static/"
+
+
+def year_matrix(df, areas, years=YEARS):
+    """
+    OBS_VALUE of df as an (area, year) array in the order of areas and years,
+    NaN where missing; of duplicate rows, the first is kept.
+    """
+    df = df.drop_duplicates(subset=["REF_AREA", "TIME_PERIOD"])
+    matrix = df.pivot(index="REF_AREA", columns="TIME_PERIOD", values="OBS_VALUE")
+    matrix.index = matrix.index.astype(str)
+    return matrix.reindex(index=[str(a) for a in areas], columns=list(years)).to_numpy(dtype=np.float64)
+
+
+def fill_arrays(matrix, colors, scheme="equal_count"):
+    """
+    Classify every value of matrix together and return an (area, year, 4)
+    uint8 RGBA array, transparent where there is no value, and the class edges.
+    """
+    bins, edges = classify(matrix.ravel(), len(colors), scheme)
+    palette = np.vstack([
+        np.hstack([hex_to_rgb_array(colors), np.full((len(colors), 1), 255, dtype=np.uint8)]),
+        np.zeros((1, 4), dtype=np.uint8),
+    ])
+    return palette[bins].reshape(matrix.shape + (4,)), edges
+
+
+def _nulls(values):
+    return [None if np.isnan(v) else round(float(v), 3) for v in values]
+
+
+def _year_scalars(values, years):
+    return {f"value_{year}": v for year, v in zip(years, values)}
+
+
+def choropleth_timeline(category, lod, reference_path, colors, scheme="equal_count", years=YEARS,
+                        precision=DEFAULT_PRECISION):
+    """
+    The NMR choropleth of every year as one FeatureCollection, and its class edges.
+    """
+    layer = read_layer(category, lod)
+    if category == "countries_hires":
+        layer = layer.rename(columns={"ISO_A3": "id"})
+    df = view(reference_path, year_min=years[0], year_max=years[-1])
+    matrix = year_matrix(df[df.INDICATOR == NMR_INDICATOR], layer["id"], years)
+    fills, edges = fill_arrays(matrix, colors, scheme)
+
+    records, _ = compact(layer, ["id", "name"], precision)
+    positions = {str(a): i for i, a in enumerate(layer["id"])}
+    features = []
+    for record in records:
+        geometry = record.pop("geometry")
+        i = positions[str(record["id"])]
+        nmr = _nulls(matrix[i])
+        record.update(nmr=nmr, fill=fills[i].tolist(), **_year_scalars(nmr, years))
+        features.append({"type": "Feature", "geometry": geometry, "properties": record})
+    return {"type": "FeatureCollection", "features": features}, edges
+
+
+def points_timeline(category, group, indicator, indicator_path, years=YEARS, **codes):
+    """
+    The centroid of every country with a value of the indicator slice in any
+    year, with per-year value and radius (square root of the value) arrays.
+    """
+    centroids = scale_centroids(category)
+    df = select(indicator_path, indicator, years[0], years[-1], **codes)
+    matrix = year_matrix(df, centroids["id"], years)
+    radius = np.sqrt(np.clip(np.nan_to_num(matrix), 0, None))
+
+    points = []
+    for i, row in enumerate(centroids[["id", "name", "long", "lat"]].itertuples(index=False)):
+        if np.isnan(matrix[i]).all() or np.isnan([row.long, row.lat]).any():
+            continue
+        value = _nulls(matrix[i])
+        points.append({
+            "id": row.id, "name": row.name, "long": round(float(row.long), 4), "lat": round(float(row.lat), 4),
+            "value": value, "radius": np.round(radius[i], 3).tolist(), **_year_scalars(value, years),
+        })
+    return points
+
+
+def publish(obj, name, key, version=None, timeline_dir=TIMELINE_DIR):
+    """
+    Write obj as JSON to the static directory, unless the file for key is
+    already there, and return (its URL, its size in bytes).
+    """
+    if version is None:
+        version = data_version()
+    digest = hashlib.sha256(repr(key).encode()).hexdigest()[:24]
+    path = os.path.join(timeline_dir, version, f"{name}-{digest}.json")
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(obj, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+    url = STATIC_URL + os.path.relpath(path, STATIC_DIR).replace(os.sep, "/")
+    return url, os.path.getsize(path)
+
+
+def year_index(year, years=YEARS):
+    return list(years).index(year)
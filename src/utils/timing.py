@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Per-rerun stage timing for the pages.
+
+Each page run opens a Timer and wraps its stages in spans; at the end of the
+run one JSON line is appended to data/cache/metrics/timings.jsonl with the
+page, the widget values the run used and the seconds of every span, and the
+sidebar can show the same record.  Past MAX_BYTES the file is rotated to
+timings.jsonl.1, replacing the previous one, so at most two files are kept.
+
+    timer = Timer("Net Migration")
+    with timer.span("join_attributes"):
+        ...
+    record = timer.finish({"group": "DM_"})
+
+Code that runs inside a page, such as the pipelines, adds spans to the
+page's timer with the module-level span(), which does nothing elsewhere.
+
+The command summarizes the file per page and stage, or prints it in the
+Prometheus text format:
+
+    python -m src.utils.timing
+    python -m src.utils.timing --page "Net Migration" --prometheus
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import numpy as np
+
+METRICS_PATH = os.path.join("data", "cache", "metrics", "timings.jsonl")
+MAX_BYTES = 5 * 2 ** 20
+
+_write_lock = threading.Lock()
+_current = threading.local()
+
+
+class Timer:
+    """
+    Wall-clock spans of one page run.  Nested spans are named parent/child.
+    """
+    def __init__(self, page, path=METRICS_PATH):
+        self.page = page
+        self.path = path
+        self.spans = []
+        self._stack = []
+        self._start = time.perf_counter()
+        _current.timer = self
+
+    @contextmanager
+    def span(self, name):
+        self._stack.append(name)
+        record = {"stage": "/".join(self._stack), "seconds": None}
+        self.spans.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            self._stack.pop()
+
+    def record(self, params=None):
+        return {
+            "time": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "page": self.page,
+            "params": params or {},
+            "total": time.perf_counter() - self._start,
+            "spans": [s for s in self.spans if s["seconds"] is not None],
+        }
+
+    def finish(self, params=None):
+        """
+        Append this run's record to the metrics file and return it.
+        """
+        record = self.record(params)
+        if current_timer() is self:
+            _current.timer = None
+        if self.path:
+            append_record(record, self.path)
+        return record
+
+
+def current_timer():
+    return getattr(_current, "timer", None)
+
+
+@contextmanager
+def span(name):
+    """
+    A span of the timer running in this thread, if any.
+    """
+    timer = current_timer()
+    if timer is None:
+        yield None
+    else:
+        with timer.span(name) as record:
+            yield record
+
+
+def append_record(record, path=METRICS_PATH, max_bytes=MAX_BYTES):
+    """
+    Append record to path, first rotating the file to path.1 if it has
+    reached max_bytes.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    line = json.dumps(record, default=str)
+    with _write_lock:
+        if max_bytes and os.path.exists(path) and os.path.getsize(path) >= max_bytes:
+            os.replace(path, path + ".1")
+        with open(path, "a") as f:
+            f.write(line + "\n")
+
+
+def read_records(path=METRICS_PATH, page=None):
+    """
+    The records of the rotated file, if any, then of path.
+    """
+    records = []
+    for name in [path + ".1", path]:
+        if not os.path.exists(name):
+            continue
+        with open(name) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if page is None or record.get("page") == page:
+                    records.append(record)
+    return records
+
+
+def stage_seconds(records):
+    """
+    (page, stage) -> list of seconds, with each run's total as stage "total".
+    """
+    seconds = {}
+    for record in records:
+        seconds.setdefault((record["page"], "total"), []).append(record["total"])
+        for span in record["spans"]:
+            seconds.setdefault((record["page"], span["stage"]), []).append(span["seconds"])
+    return seconds
+
+
+def summary(records):
+    lines = [f"{'page':<16} {'stage':<28} {'runs':>5} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}"]
+    for (page, stage), values in sorted(stage_seconds(records).items()):
+        ms = np.array(values) * 1000.0
+        lines.append(f"{page:<16} {stage:<28} {len(ms):>5} {np.percentile(ms, 50):9,.1f} "
+                     f"{np.percentile(ms, 95):9,.1f} {ms.max():9,.1f}")
+    return "\n".join(lines)
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def prometheus(records):
+    """
+    The records as Prometheus summaries of stage seconds per page.
+    """
+    lines = [
+        "# HELP umr_stage_seconds Wall-clock seconds of a page stage per rerun.",
+        "# TYPE umr_stage_seconds summary",
+    ]
+    for (page, stage), values in sorted(stage_seconds(records).items()):
+        labels = f'page="{_label(page)}",stage="{_label(stage)}"'
+        for q in (0.5, 0.95):
+            lines.append(f'umr_stage_seconds{{{labels},quantile="{q}"}} {np.quantile(values, q):.6f}')
+        lines.append(f"umr_stage_seconds_sum{{{labels}}} {sum(values):.6f}")
+        lines.append(f"umr_stage_seconds_count{{{labels}}} {len(values)}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize the page stage timings")
+    parser.add_argument("--path", default=METRICS_PATH)
+    parser.add_argument("--page", default=None, help="only this page")
+    parser.add_argument("--prometheus", action="store_true", help="print in the Prometheus text format")
+    args = parser.parse_args(argv)
+
+    records = read_records(args.path, args.page)
+    if not records:
+        print(f"no timings in {args.path}")
+        return 1
+    print(prometheus(records) if args.prometheus else summary(records))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
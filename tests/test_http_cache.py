@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+HttpCache against a local HTTP server.  Run from the repository root:
+
+    python -m pytest tests
+"""
+import os
+import socket
+import functools
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from src.utils.http_cache import HttpCache, make_session
+
+BODY = b"REF_AREA,TIME_PERIOD,OBS_VALUE\nAFG,2021,1.5\n"
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path):
+    root = tmp_path / "remote"
+    root.mkdir()
+    (root / "x.csv").write_bytes(BODY)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(QuietHandler, directory=str(root)))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def closed_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def make_cache(tmp_path):
+    return HttpCache(cache_dir=str(tmp_path / "cache"), fallback_dir=str(tmp_path / "data"),
+                     session=make_session(retries=0), timeout=(1, 5))
+
+
+def test_downloaded_then_not_modified_then_cached(tmp_path, server):
+    cache = make_cache(tmp_path)
+    url = f"http://127.0.0.1:{server.server_port}/x.csv"
+
+    path, status = cache.fetch(url)
+    assert status == "downloaded"
+    with open(path, "rb") as f:
+        assert f.read() == BODY
+
+    assert cache.fetch(url) == (path, "not-modified")
+
+    server.shutdown()
+    server.server_close()
+    assert cache.fetch(url) == (path, "cached")
+
+
+def test_fallback_when_unreachable(tmp_path):
+    os.makedirs(tmp_path / "data")
+    (tmp_path / "data" / "x.csv").write_bytes(BODY)
+    cache = make_cache(tmp_path)
+
+    path, status = cache.fetch(f"http://127.0.0.1:{closed_port()}/x.csv")
+    assert status == "fallback"
+    assert path == str(tmp_path / "data" / "x.csv")
+
+
+def test_unreachable_without_copy_raises(tmp_path):
+    cache = make_cache(tmp_path)
+    with pytest.raises(requests.ConnectionError):
+        cache.fetch(f"http://127.0.0.1:{closed_port()}/x.csv")
+
+
+def test_http_error_is_raised_not_served_from_fallback(tmp_path, server):
+    os.makedirs(tmp_path / "data")
+    (tmp_path / "data" / "missing.csv").write_bytes(BODY)
+    cache = make_cache(tmp_path)
+
+    with pytest.raises(requests.HTTPError):
+        cache.fetch(f"http://127.0.0.1:{server.server_port}/missing.csv")